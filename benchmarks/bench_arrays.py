@@ -0,0 +1,54 @@
+#-----------------------------------------------------------------
+# bench_arrays.py
+#
+# Compares the memory held by *Node and *Element data as nested
+# lists of str (the default) and as packed NumPy arrays
+# (parse(..., arrays=True)) on tests/data/mmxmn.inp.
+#-----------------------------------------------------------------
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+import numpy
+
+from AbqParse import abaqus_parser
+from AbqParse.abaqus_arrays import keyword_name, NODE_KEYWORDS, ELEMENT_KEYWORDS
+
+
+def deep_sizeof(obj):
+    """ Approximate number of bytes held by obj and its members
+    """
+    if isinstance(obj, numpy.ndarray):
+        return sys.getsizeof(obj) + (0 if obj.base is None else obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item) for item in obj)
+    return size
+
+
+def mesh_bytes(keywords):
+    return sum(deep_sizeof(kw.data) for kw in keywords
+               if keyword_name(kw.keyword) in NODE_KEYWORDS + ELEMENT_KEYWORDS)
+
+
+def main():
+    f = open(os.path.join(HERE, '..', 'tests', 'data', 'mmxmn.inp'), 'rb')
+    buf = f.read()
+    f.close()
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+    print('%-16s %10s %14s' % ('data', 'seconds', 'mesh bytes'))
+    for arrays in (False, True):
+        t1 = time.time()
+        keywords = parser.parse(buf, 'mmxmn.inp', arrays=arrays)
+        elapsed = time.time() - t1
+        print('%-16s %10.3f %14d' % (
+            'arrays' if arrays else 'lists', elapsed, mesh_bytes(keywords)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#-----------------------------------------------------------------
+# bench_fastpath.py
+#
+# Compares AbaqusParser.parse with the regex fast path for data
+# lines (the default) against the PLY token-by-token path
+# (fast=False) on tests/data/mmxmn.inp.
+#-----------------------------------------------------------------
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+from benchtools import best_of
+
+
+def main(repeat=3):
+    f = open(os.path.join(HERE, '..', 'tests', 'data', 'mmxmn.inp'), 'rb')
+    buf = f.read()
+    f.close()
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+    nlines = buf.count('\n')
+    ply_time = best_of(repeat, parser.parse, buf, 'mmxmn.inp', fast=False)
+    fast_time = best_of(repeat, parser.parse, buf, 'mmxmn.inp', fast=True)
+    print('%-10s %10s %14s' % ('path', 'seconds', 'lines/s'))
+    print('%-10s %10.3f %14.0f' % ('ply', ply_time, nlines / ply_time))
+    print('%-10s %10.3f %14.0f' % ('fast', fast_time, nlines / fast_time))
+    print('speedup: %.1fx' % (ply_time / fast_time))
+
+
+if __name__ == "__main__":
+    main()
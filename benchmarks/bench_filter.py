@@ -0,0 +1,51 @@
+#-----------------------------------------------------------------
+# bench_filter.py
+#
+# Time of keyword-filtered parses of a synthetic deck against a
+# full parse_file: the filtered ones only parse the blocks they
+# keep, so their time follows the share of the deck kept.
+#
+# usage: python bench_filter.py [nlines]
+#-----------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+from benchtools import best_of
+from gendeck import write_deck
+
+FILTERS = (
+    ('all', {}),
+    ('node', dict(include_keywords=['node'])),
+    ('element', dict(include_keywords=['element'])),
+    ('section', dict(include_keywords=['solid section'])),
+    ('no node', dict(exclude_keywords=['node'])),
+)
+
+
+def main(nlines=1000000, repeat=3):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'deck.inp')
+        write_deck(path, nlines)
+        print('%-10s %10s %10s' % ('keep', 'keywords', 'seconds'))
+        for name, options in FILTERS:
+            count = len(parser.parse_file(path, **options))
+            seconds = best_of(repeat, parser.parse_file, path, **options)
+            print('%-10s %10d %10.4f' % (name, count, seconds))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,74 @@
+#-----------------------------------------------------------------
+# bench_incremental.py
+#
+# Latency of edits re-parsed with IncrementalParse.edit:
+#
+#   - a one-line edit to the material card of synthetic decks of
+#     growing size, against a full AbaqusParser.parse
+#   - edits at the start of decks of many small *Elset blocks,
+#     which move every block after them: adding and removing a data
+#     line, adding and removing a keyword block, and adding many
+#     keyword blocks at one place (mean per edit)
+#-----------------------------------------------------------------
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+from gendeck import make_deck
+
+
+def many_blocks(nblocks):
+    return '*heading\nmodel\n*elset,elset=a\n1,\n' + ''.join(
+        '*elset,elset=e%d\n%d,\n' % (i, i) for i in range(nblocks))
+
+
+def mean_edit(deck, edits, repeat):
+    # Applies the edits in turn, repeat times; the mean time of one
+    t1 = time.time()
+    for i in range(repeat):
+        for offset, length, text in edits:
+            deck.edit(offset, length, text)
+    return (time.time() - t1) / (repeat * len(edits))
+
+
+def main(sizes=(10000, 100000, 1000000), block_counts=(10000, 100000, 400000),
+         repeat=20):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    print('%10s %14s %14s' % ('lines', 'full (s)', 'edit (ms)'))
+    for nlines in sizes:
+        text = make_deck(nlines).replace(
+            '*end step\n', '*material,name=T95\n*elastic\n30.0e6,0.3\n*end step\n')
+        t1 = time.time()
+        deck = parser.parse_incremental(text, 'deck.inp')
+        full_time = time.time() - t1
+        offset = deck.text.index('30.0e6')
+        best = None
+        for i in range(repeat):
+            t1 = time.time()
+            deck.edit(offset, 6, '%.1fe6' % (20 + i % 10))
+            elapsed = time.time() - t1
+            if best is None or elapsed < best:
+                best = elapsed
+        print('%10d %14.3f %14.3f' % (nlines, full_time, best * 1000))
+
+    print('')
+    print('%10s %14s %14s %14s' % ('blocks', 'line (ms)', 'keyword (ms)', 'inserts (ms)'))
+    for nblocks in block_counts:
+        deck = parser.parse_incremental(many_blocks(nblocks), 'deck.inp')
+        start = deck.text.index('*elset,elset=a\n')
+        offset = start + len('*elset,elset=a\n1,\n')
+        line = mean_edit(deck, [(offset, 0, '2,\n'), (offset, 3, '')], repeat)
+        block = '*nset,nset=n\n1,\n'
+        keyword = mean_edit(deck, [(start, 0, block), (start, len(block), '')], repeat)
+        inserts = mean_edit(deck, [(start, 0, block)], 50 * repeat)
+        print('%10d %14.3f %14.3f %14.3f' % (nblocks, line * 1000, keyword * 1000,
+                                             inserts * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#-----------------------------------------------------------------
+# bench_mmap.py
+#
+# Compares peak RSS and time of reading a deck into a string and
+# calling AbaqusParser.parse against AbaqusParser.parse_file, which
+# memory-maps the deck. Each mode runs in a fresh process.
+#
+# usage: python bench_mmap.py [deck.inp]
+#-----------------------------------------------------------------
+import os
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+
+
+def run(mode, path):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    t1 = time.time()
+    if mode == 'read':
+        f = open(path, 'rb')
+        buf = f.read()
+        f.close()
+        parser.parse(buf, path, arrays=True)
+    else:
+        parser.parse_file(path, arrays=True)
+    elapsed = time.time() - t1
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print('%-10s %10.3f %14d' % (mode, elapsed, maxrss))
+
+
+def main(path):
+    print('%-10s %10s %14s' % ('mode', 'seconds', 'peak RSS (kB)'))
+    for mode in ('read', 'mmap'):
+        sys.stdout.flush()
+        subprocess.check_call([sys.executable, __file__, '--run', mode, path])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--run':
+        run(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        main(os.path.join(HERE, '..', 'tests', 'data', 'mmxmn.inp'))
@@ -0,0 +1,78 @@
+#-----------------------------------------------------------------
+# bench_model.py
+#
+# Memory held by the parse result of tests/data/mmxmn.inp with
+#   - dict-backed Keyword/Parameter objects (the previous model),
+#   - the __slots__ Keyword/Parameter objects,
+#   - lazy Keywords, whose data is a span of the source text.
+# The lazy figure includes the source text itself.
+#-----------------------------------------------------------------
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+
+
+class DictParameter(object):
+    def __init__(self, name, value=None):
+        self.name = name
+        self.value = value
+
+
+class DictKeyword(object):
+    def __init__(self, keyword, params=None, data=None, coord=None):
+        self.keyword = keyword
+        self.params = params
+        self.data = data
+        self.coord = coord
+
+
+def as_dict_objects(keywords):
+    return [DictKeyword(kw.keyword,
+                        [DictParameter(p.name, p.value) for p in kw.params or []] or None,
+                        kw.data, kw.coord)
+            for kw in keywords]
+
+
+def deep_sizeof(obj, seen=None):
+    """ Bytes held by obj and everything it references, counting
+        shared objects once.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or obj is None:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif hasattr(obj, '__dict__'):
+        size += deep_sizeof(obj.__dict__, seen)
+    elif hasattr(type(obj), '__slots__'):
+        for name in type(obj).__slots__:
+            size += deep_sizeof(getattr(obj, name, None), seen)
+    return size
+
+
+def main():
+    f = open(os.path.join(HERE, '..', 'tests', 'data', 'mmxmn.inp'), 'rb')
+    buf = f.read()
+    f.close()
+    parser = abaqus_parser.AbaqusParser()
+
+    eager = parser.parse(buf, 'mmxmn.inp')
+    lazy = parser.parse(buf, 'mmxmn.inp', lazy=True)
+    print('%-20s %14s' % ('model', 'bytes'))
+    print('%-20s %14d' % ('dict objects', deep_sizeof(as_dict_objects(eager))))
+    print('%-20s %14d' % ('__slots__ objects', deep_sizeof(eager)))
+    print('%-20s %14d' % ('lazy spans', deep_sizeof(lazy)))
+    print('%-20s %14d' % ('(source text)', sys.getsizeof(buf)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#-----------------------------------------------------------------
+# bench_parallel.py
+#
+# Times abaqus_parallel.parse_parallel on a synthetic deck for an
+# increasing number of worker processes, with the number of chunks
+# the deck is cut into and the share of the largest one, which bounds
+# the speedup.
+#
+# usage: python bench_parallel.py [nlines [max_workers]]
+#-----------------------------------------------------------------
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parallel
+from gendeck import write_deck
+
+
+def main(nlines, max_workers):
+    fd, path = tempfile.mkstemp(suffix='.inp')
+    os.close(fd)
+    try:
+        write_deck(path, nlines)
+        size = os.path.getsize(path)
+        print('%-10s %10s %10s %10s %10s' % ('workers', 'chunks', 'largest', 'seconds', 'speedup'))
+        base = None
+        workers = 1
+        while workers <= max_workers:
+            chunk_size = max(size // (workers * abaqus_parallel.CHUNKS_PER_WORKER),
+                             abaqus_parallel.MIN_CHUNK_SIZE)
+            chunks = abaqus_parallel.find_chunks(path, chunk_size)
+            largest = max(chunk[1] for chunk in chunks) / float(size)
+            t1 = time.time()
+            abaqus_parallel.parse_parallel(path, workers=workers, arrays=True)
+            elapsed = time.time() - t1
+            if base is None:
+                base = elapsed
+            print('%-10d %10d %9.0f%% %10.3f %10.2f' % (
+                workers, len(chunks), largest * 100, elapsed, base / elapsed))
+            workers *= 2
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    nlines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+    main(nlines, max_workers)
@@ -0,0 +1,57 @@
+#-----------------------------------------------------------------
+# bench_scaling.py
+#
+# Shows how AbaqusParser.parse time grows with deck size, from
+# tests/data/test_2.inp up to a synthetic 5-million-line deck.
+# The time per line should stay roughly constant.
+#
+# usage: python bench_scaling.py [nlines ...]
+#-----------------------------------------------------------------
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+from gendeck import make_deck
+
+
+DEFAULT_SIZES = [10000, 100000, 1000000, 5000000]
+
+
+def time_parse(parser, buf, name):
+    t1 = time.time()
+    # The PLY path runs the grammar actions; the default fast path
+    # splits data lines with regexes instead
+    parser.parse(buf, name, fast=False)
+    return time.time() - t1
+
+
+def main(sizes):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+    f = open(os.path.join(HERE, '..', 'tests', 'data', 'test_2.inp'), 'rb')
+    buf = f.read()
+    f.close()
+    runs = [('test_2.inp', buf)]
+    for nlines in sizes:
+        runs.append(('synthetic-%d' % nlines, None))
+
+    print('%-20s %10s %10s %14s' % ('deck', 'lines', 'seconds', 'us/line'))
+    for name, buf in runs:
+        if buf is None:
+            buf = make_deck(int(name.split('-')[1]))
+        nlines = buf.count('\n')
+        elapsed = time_parse(parser, buf, name)
+        print('%-20s %10d %10.3f %14.3f' % (
+            name, nlines, elapsed, 1.0e6 * elapsed / nlines))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main(DEFAULT_SIZES)
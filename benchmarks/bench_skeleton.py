@@ -0,0 +1,35 @@
+#-----------------------------------------------------------------
+# bench_skeleton.py
+#
+# Time to list the keywords of a deck: an eager
+# AbaqusParser.parse_file against a lazy one, which parses only
+# the keyword lines and leaves the data lines unsplit.
+#
+# usage: python bench_skeleton.py [deck.inp]
+#-----------------------------------------------------------------
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser
+from benchtools import best_of
+
+
+def main(path, repeat=5):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    eager = best_of(repeat, parser.parse_file, path)
+    lazy = best_of(repeat, parser.parse_file, path, lazy=True)
+    print('%-10s %10s' % ('mode', 'seconds'))
+    print('%-10s %10.4f' % ('eager', eager))
+    print('%-10s %10.4f' % ('lazy', lazy))
+    print('speedup    %10.1fx' % (eager / lazy))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        main(os.path.join(HERE, '..', 'tests', 'data', 'mmxmn.inp'))
@@ -0,0 +1,49 @@
+#-----------------------------------------------------------------
+# bench_startup.py
+#
+# Measures the import time of AbqParse.abaqus_parser and the time
+# to construct an AbaqusParser from the shipped lextab/yacctab
+# tables, against regenerating the tables. Each measurement runs in
+# a fresh process, as in a short-lived worker.
+#-----------------------------------------------------------------
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+
+def run(mode):
+    t0 = time.time()
+    from AbqParse import abaqus_parser
+    t1 = time.time()
+    if mode == 'shipped':
+        abaqus_parser.AbaqusParser()
+    else:
+        import ply.lex
+        import ply.yacc
+        parser = abaqus_parser.AbaqusParser()
+        t1 = time.time()
+        # What a parser without usable tables has to do
+        ply.lex.lex(object=parser.clex, optimize=0)
+        ply.yacc.yacc(module=parser, start='keyword_list', optimize=0, debug=0,
+                      write_tables=0, tabmodule='_no_such_table',
+                      errorlog=ply.yacc.NullLogger())
+    t2 = time.time()
+    print('%-12s %12.1f %14.1f' % (mode, 1000 * (t1 - t0), 1000 * (t2 - t1)))
+
+
+def main():
+    print('%-12s %12s %14s' % ('tables', 'import (ms)', 'construct (ms)'))
+    for mode in ('shipped', 'regenerate'):
+        sys.stdout.flush()
+        subprocess.check_call([sys.executable, __file__, '--run', mode])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--run':
+        run(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,54 @@
+#-----------------------------------------------------------------
+# bench_store.py
+#
+# Time to get the node and element arrays of a synthetic deck: an
+# AbaqusParser.parse_file with arrays=True against abaqus_store.load
+# of the same keywords saved before, reading every array once.
+#-----------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser, abaqus_store
+from gendeck import write_deck
+
+
+def touch(keywords):
+    # Reads every packed array, as an analysis would
+    total = 0.0
+    for kw in keywords:
+        if isinstance(kw.data, tuple):
+            total += sum(float(array.sum()) for array in kw.data)
+    return total
+
+
+def main(sizes=(100000, 1000000)):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    directory = tempfile.mkdtemp()
+    try:
+        print('%10s %12s %12s %12s' % ('lines', 'parse (s)', 'save (s)', 'load (s)'))
+        for nlines in sizes:
+            path = os.path.join(directory, 'deck.inp')
+            store = os.path.join(directory, 'deck.npy')
+            write_deck(path, nlines)
+            t1 = time.time()
+            keywords = parser.parse_file(path, arrays=True)
+            touch(keywords)
+            t2 = time.time()
+            abaqus_store.save(keywords, store)
+            t3 = time.time()
+            touch(abaqus_store.load(store))
+            t4 = time.time()
+            print('%10d %12.3f %12.3f %12.3f' % (nlines, t2 - t1, t3 - t2, t4 - t3))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
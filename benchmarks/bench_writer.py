@@ -0,0 +1,43 @@
+#-----------------------------------------------------------------
+# bench_writer.py
+#
+# Throughput of abaqus_writer against AbaqusParser.parse on a
+# synthetic deck, for data kept as value strings and for *Node and
+# *Element data packed into arrays.
+#-----------------------------------------------------------------
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from AbqParse import abaqus_parser, abaqus_writer
+from gendeck import make_deck
+
+
+class NullStream(object):
+    def write(self, text):
+        pass
+
+
+def main(nlines=1000000):
+    parser = abaqus_parser.AbaqusParser(
+        lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+    buf = make_deck(nlines)
+    nlines = buf.count('\n')
+    print('%-14s %10s %14s' % ('step', 'seconds', 'lines/s'))
+    for arrays in (False, True):
+        label = 'arrays' if arrays else 'strings'
+        t1 = time.time()
+        keywords = parser.parse(buf, 'deck.inp', arrays=arrays)
+        elapsed = time.time() - t1
+        print('%-14s %10.3f %14.0f' % ('parse ' + label, elapsed, nlines / elapsed))
+        t1 = time.time()
+        abaqus_writer.write(keywords, NullStream())
+        elapsed = time.time() - t1
+        print('%-14s %10.3f %14.0f' % ('write ' + label, elapsed, nlines / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#-----------------------------------------------------------------
+# benchtools.py
+#
+# Timing helpers shared by the benchmark scripts in this directory.
+#-----------------------------------------------------------------
+import time
+
+
+def best_of(repeat, func, *args, **kwargs):
+    """ Calls func(*args, **kwargs) repeat times and returns the
+        shortest run time in seconds.
+    """
+    best = None
+    for i in range(repeat):
+        t1 = time.time()
+        func(*args, **kwargs)
+        elapsed = time.time() - t1
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
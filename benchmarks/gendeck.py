@@ -0,0 +1,64 @@
+#-----------------------------------------------------------------
+# gendeck.py
+#
+# Generator for synthetic Abaqus input decks of a given size, used
+# by the benchmark scripts in this directory.
+#-----------------------------------------------------------------
+import sys
+
+
+def iter_deck(nlines):
+    """ Yields the lines of a synthetic deck with roughly nlines
+        lines. About half of the lines are *Node data lines, the
+        rest are *Element and *Elset data lines, which mirrors the
+        mesh-heavy shape of real models.
+    """
+    nnodes = max(nlines // 2, 1)
+    nelems = max(nlines // 4, 1)
+    nset = max(nlines - nnodes - nelems - 8, 1)
+    for line in ('*HEADING\n', 'Synthetic deck\n', '** generated by gendeck.py\n'):
+        yield line
+    yield '*Node\n'
+    for i in range(1, nnodes + 1):
+        yield '%8d,%16.9E,%16.9E,%16.9E\n' % (i, i * 1.0e-3, -i * 2.0e-3, 0.0)
+    yield '*element,type=cax4,elset=axi\n'
+    for i in range(1, nelems + 1):
+        n = (i - 1) % (nnodes - 3 if nnodes > 4 else 1) + 1
+        yield '%d,%d,%d,%d,%d\n' % (i, n, n + 1, n + 2, n + 3)
+    yield '*elset,elset=box\n'
+    for i in range(1, nset + 1):
+        yield '%d,\n' % ((i - 1) % nelems + 1)
+    yield '*solid section,elset=box,material=T95\n'
+    yield '1.0\n'
+    yield '*end step\n'
+
+
+def make_deck(nlines):
+    """ Returns the text of a synthetic deck with roughly nlines
+        lines, see iter_deck.
+    """
+    return ''.join(iter_deck(nlines))
+
+
+def write_deck(filename, nlines):
+    """ Writes a synthetic deck to filename without holding all of
+        its text in memory.
+    """
+    f = open(filename, 'wb')
+    try:
+        buf = []
+        for line in iter_deck(nlines):
+            buf.append(line)
+            if len(buf) == 65536:
+                f.write(''.join(buf))
+                buf = []
+        f.write(''.join(buf))
+    finally:
+        f.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print('usage: gendeck.py <output.inp> <nlines>')
+        sys.exit(1)
+    write_deck(sys.argv[1], int(sys.argv[2]))
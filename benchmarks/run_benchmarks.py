@@ -0,0 +1,196 @@
+#-----------------------------------------------------------------
+# run_benchmarks.py
+#
+# Benchmark suite for releases. For the decks in tests/data and for
+# synthetic decks of 10k to 10M lines (see gendeck.py) it reports
+#
+#   - the time to construct an AbaqusParser from the shipped tables
+#   - AbaqusLexer throughput in tokens per second
+#   - AbaqusParser.parse throughput in lines per second, and the
+#     peak memory it adds on top of the deck text
+#
+# Every deck is measured in a fresh process, so peak memory is not
+# inflated by earlier decks. Results can be saved as JSON and
+# compared against a saved baseline to spot regressions.
+#
+# usage: python run_benchmarks.py [--sizes 10000,100000,...]
+#            [--repeat N] [--json results.json]
+#            [--compare baseline.json] [--threshold 0.1]
+#-----------------------------------------------------------------
+import json
+import optparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+
+from benchtools import best_of
+from gendeck import write_deck
+
+DATA_DIR = os.path.join(HERE, '..', 'tests', 'data')
+DEFAULT_SIZES = '10000,100000,1000000,10000000'
+
+# Decks above this many lines are timed once whatever --repeat says
+REPEAT_MAX_LINES = 1000000
+
+# Metrics compared by --compare, and whether higher is better
+METRICS = (
+    ('construct_ms', False),
+    ('tokens_per_s', True),
+    ('lines_per_s', True),
+    ('peak_mb', False),
+)
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def count_tokens(lexer, text):
+    lexer.input(text)
+    ntokens = 0
+    token = lexer.token
+    while token():
+        ntokens += 1
+    return ntokens
+
+
+def measure(path, repeat):
+    """ Measures one deck; runs in its own process.
+    """
+    t1 = time.time()
+    from AbqParse import abaqus_parser
+    parser = abaqus_parser.AbaqusParser()
+    construct = time.time() - t1
+
+    f = open(path, 'rb')
+    text = f.read()
+    f.close()
+    nlines = text.count('\n')
+    if nlines > REPEAT_MAX_LINES:
+        repeat = 1
+
+    # Parse first, so the peak reflects the parse and not the lexer
+    base = peak_rss_mb()
+    parse_time = best_of(repeat, parser.parse, text, path)
+    peak = peak_rss_mb() - base
+
+    lexer = parser.clex
+    lexer.filename = path
+    lexer.reset_lineno()
+    t1 = time.time()
+    ntokens = count_tokens(lexer, text)
+    lex_time = time.time() - t1
+
+    return {
+        'deck': os.path.basename(path),
+        'lines': nlines,
+        'construct_ms': 1000 * construct,
+        'tokens': ntokens,
+        'tokens_per_s': ntokens / lex_time,
+        'lines_per_s': nlines / parse_time,
+        'peak_mb': peak,
+    }
+
+
+def run_deck(path, repeat):
+    """ Measures the deck at path in a fresh process. Returns the
+        results, or None if the process failed (e.g. out of memory).
+    """
+    process = subprocess.Popen(
+        [sys.executable, __file__, '--run', path, str(repeat)],
+        stdout=subprocess.PIPE)
+    out = process.communicate()[0]
+    if process.returncode != 0:
+        return None
+    return json.loads(out)
+
+
+def print_row(result):
+    print('%-22s %10d %14.1f %14.0f %14.0f %10.1f' % (
+        result['deck'], result['lines'], result['construct_ms'],
+        result['tokens_per_s'], result['lines_per_s'], result['peak_mb']))
+
+
+def compare(results, baseline, threshold):
+    """ Prints the metrics that got worse than baseline by more than
+        threshold (a fraction). Returns the number of regressions.
+    """
+    old = dict((result['deck'], result) for result in baseline)
+    regressions = 0
+    for result in results:
+        before = old.get(result['deck'])
+        if before is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            ratio = result[metric] / before[metric] if before[metric] else 1.0
+            worse = ratio < 1 - threshold if higher_is_better else ratio > 1 + threshold
+            if worse:
+                regressions += 1
+                print('REGRESSION %-22s %-14s %14.1f -> %14.1f' % (
+                    result['deck'], metric, before[metric], result[metric]))
+    return regressions
+
+
+def main(argv):
+    op = optparse.OptionParser(usage='%prog [options]')
+    op.add_option('--sizes', default=DEFAULT_SIZES,
+                  help='comma separated line counts of the synthetic decks')
+    op.add_option('--repeat', type='int', default=3,
+                  help='parse each deck this many times and keep the best')
+    op.add_option('--json', help='write the results to this file')
+    op.add_option('--compare', help='baseline results written with --json')
+    op.add_option('--threshold', type='float', default=0.1,
+                  help='relative change reported as a regression')
+    options, args = op.parse_args(argv)
+
+    decks = [os.path.join(DATA_DIR, name) for name in sorted(os.listdir(DATA_DIR))
+             if name.endswith('.inp')]
+    directory = tempfile.mkdtemp()
+    results = []
+    try:
+        print('%-22s %10s %14s %14s %14s %10s' % (
+            'deck', 'lines', 'construct ms', 'tokens/s', 'lines/s', 'peak MB'))
+        sizes = [int(size) for size in options.sizes.split(',') if size]
+        for nlines in sizes:
+            decks.append(os.path.join(directory, 'synthetic_%d.inp' % nlines))
+        for path in decks:
+            if not os.path.exists(path):
+                write_deck(path, int(path.rsplit('_', 1)[1][:-len('.inp')]))
+            sys.stdout.flush()
+            result = run_deck(path, options.repeat)
+            if path.startswith(directory):
+                os.remove(path)
+            if result is None:
+                print('%-22s failed' % os.path.basename(path))
+                continue
+            print_row(result)
+            results.append(result)
+    finally:
+        shutil.rmtree(directory)
+
+    if options.json:
+        f = open(options.json, 'wb')
+        json.dump(results, f, indent=1)
+        f.close()
+    if options.compare:
+        f = open(options.compare, 'rb')
+        baseline = json.load(f)
+        f.close()
+        if compare(results, baseline, options.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--run':
+        sys.stdout.write(json.dumps(measure(sys.argv[2], int(sys.argv[3]))))
+    else:
+        sys.exit(main(sys.argv[1:]))
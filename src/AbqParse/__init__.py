@@ -1 +1,5 @@
-__all__ = ['abaqus_lexer', 'abaqus_parser']
+__all__ = ['abaqus_lexer', 'abaqus_parser', 'abaqus_scanner', 'abaqus_arrays',
+           'abaqus_fastpath', 'abaqus_parallel', 'abaqus_cache', 'abaqus_include',
+           'abaqus_index', 'abaqus_incremental', 'abaqus_writer', 'abaqus_stats',
+           'abaqus_mesh', 'abaqus_sets', 'abaqus_feed', 'abaqus_pool',
+           'abaqus_compress', 'abaqus_store']
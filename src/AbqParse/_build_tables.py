@@ -0,0 +1,48 @@
+#-----------------------------------------------------------------
+# _build_tables.py
+#
+# A dummy for generating the lexing/parsing tables and
+# compiling them into .pyc for faster execution in optimized mode.
+# Also generates AbaqusParser's tables shipped with the package;
+# AbaqusParser itself never writes them.
+#
+# Run from the src directory, after any change to the lexer or the
+# grammar:
+#
+#   python -m AbqParse._build_tables
+#-----------------------------------------------------------------
+import os
+
+import ply.yacc
+
+import abaqus_parser
+
+# Remove the old tables so that they are regenerated
+for name in ('lextab', 'yacctab'):
+    for ext in ('.py', '.pyc'):
+        path = os.path.join(abaqus_parser.TABLES_DIR, name + ext)
+        if os.path.exists(path):
+            os.remove(path)
+
+# Generates the tables, and writes them next to abaqus_parser. The
+# relative path keeps the build directory out of yacctab's header.
+#
+outputdir = os.path.relpath(abaqus_parser.TABLES_DIR)
+parser = abaqus_parser.AbaqusParser(
+    lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+parser.clex.build(
+    optimize=True,
+    lextab=abaqus_parser.LEXTAB,
+    outputdir=outputdir)
+ply.yacc.yacc(
+    module=parser,
+    start='keyword_list',
+    debug=False,
+    optimize=True,
+    tabmodule=abaqus_parser.YACCTAB,
+    outputdir=outputdir)
+
+# Load to compile into .pyc
+#
+import lextab
+import yacctab
@@ -0,0 +1,175 @@
+#-----------------------------------------------------------------
+# abaqus_arrays.py
+#
+# Packing of *Node and *Element data lines into NumPy arrays
+#-----------------------------------------------------------------
+import re
+
+import numpy
+
+from abaqus_fastpath import float_constant, int_constant
+
+# Abaqus wraps element data lines after this many entries
+ENTRIES_PER_LINE = 16
+
+NODE_KEYWORDS = ('node',)
+ELEMENT_KEYWORDS = ('element',)
+
+# Data lines of n plain numbers each, which numpy can convert
+# straight from the text; compiled per (first, other, n)
+_numeric_line = {}
+
+
+def keyword_name(keyword):
+    """ Normalized keyword name, e.g. 'Node ' -> 'node'
+    """
+    return ' '.join(keyword.lower().split())
+
+
+def keyword_param(kw, name, default=None):
+    """ Value of the parameter name of Keyword kw, compared as
+        keyword_name does, stripped of blanks. Parameters without a
+        value give None; missing ones give default.
+    """
+    for param in kw.params or []:
+        if keyword_name(param.name) == name:
+            return param.value.strip() if param.value is not None else None
+    return default
+
+
+def node_arrays(data):
+    """ Converts *Node data lines to (labels, coords).
+
+        labels is an int64 vector and coords a float64 matrix with
+        one row per node. Short lines are padded with zeros, as
+        Abaqus does for omitted coordinates.
+    """
+    if not data:
+        return (numpy.zeros(0, dtype=numpy.int64),
+                numpy.zeros((0, 3), dtype=numpy.float64))
+    labels = numpy.array([line[0] for line in data], dtype=numpy.int64)
+    widths = set(len(line) for line in data)
+    if len(widths) == 1 and max(widths) >= 4:
+        table = numpy.array(data, dtype=numpy.float64)
+        return labels, table[:, 1:].copy()
+    ncols = max(max(widths) - 1, 3)
+    coords = numpy.zeros((len(data), ncols), dtype=numpy.float64)
+    for row, line in enumerate(data):
+        if len(line) > 1:
+            coords[row, :len(line) - 1] = line[1:]
+    return labels, coords
+
+
+def join_continuation_lines(data):
+    """ Joins element data lines that were wrapped because they
+        hold more than ENTRIES_PER_LINE entries.
+    """
+    widths = set(len(line) for line in data)
+    if len(widths) <= 1:
+        return data
+    joined = []
+    current = None
+    for line in data:
+        if current is not None and len(current) % ENTRIES_PER_LINE == 0:
+            current = current + line
+            joined[-1] = current
+        else:
+            current = line
+            joined.append(current)
+    return joined
+
+
+def element_arrays(data):
+    """ Converts *Element data lines to (labels, connectivity).
+
+        labels is an int64 vector and connectivity an int64 matrix
+        with one row of node labels per element.
+    """
+    if not data:
+        return (numpy.zeros(0, dtype=numpy.int64),
+                numpy.zeros((0, 0), dtype=numpy.int64))
+    data = join_continuation_lines(data)
+    if len(set(len(line) for line in data)) != 1:
+        raise ValueError('element data lines have different lengths')
+    table = numpy.array(data, dtype=numpy.int64)
+    return table[:, 0].copy(), table[:, 1:].copy()
+
+
+def numeric_line(first, other, n):
+    """ Regex matching a data line of n values, the first one
+        matching first and the others other.
+    """
+    key = (first, other, n)
+    if key not in _numeric_line:
+        field = r'[ \t]*(?:%s)[ \t]*'
+        _numeric_line[key] = re.compile(
+            field % first + (',' + field % other) * (n - 1) + '\n')
+    return _numeric_line[key]
+
+
+def numeric_table(text, start, first, other, dtype):
+    """ Converts the data lines text[start:] into a matrix of dtype
+        without splitting them into value strings, if they are plain
+        lines of the same number of values matching the regexes first
+        (first value) and other. Returns None otherwise, e.g. for
+        comments, blank lines or wrapped lines.
+    """
+    newline = text.find('\n', start)
+    if newline < 0:
+        return None
+    n = text.count(',', start, newline) + 1
+    # One match per line: a regex repeated over the whole block is
+    # several times slower
+    line = numeric_line(first, other, n)
+    pos = start
+    end = len(text)
+    while pos < end:
+        m = line.match(text, pos)
+        if m is None:
+            return None
+        pos = m.end()
+    values = numpy.fromstring(text[start:].replace(',', ' '), dtype=dtype, sep=' ')
+    return values.reshape(-1, n)
+
+
+def pack_text(name, text, start=0):
+    """ Packed arrays for the data lines text[start:] of a *Node or
+        *Element keyword with normalized name, converted straight
+        from the text. Returns None if they need splitting first.
+    """
+    if name in NODE_KEYWORDS:
+        table = numeric_table(text, start, int_constant,
+                              float_constant + '|' + int_constant, numpy.float64)
+        if table is None:
+            return None
+        coords = table[:, 1:]
+        if coords.shape[1] < 3:
+            coords = numpy.hstack([coords, numpy.zeros((len(table), 3 - coords.shape[1]))])
+        return table[:, 0].astype(numpy.int64), coords.copy()
+    elif name in ELEMENT_KEYWORDS:
+        table = numeric_table(text, start, int_constant, int_constant, numpy.int64)
+        if table is None:
+            return None
+        return table[:, 0].copy(), table[:, 1:].copy()
+    return None
+
+
+def pack_data(name, data):
+    """ Packed arrays for the data of a keyword with normalized
+        name, if it is *Node or *Element; otherwise data itself.
+    """
+    if name in NODE_KEYWORDS:
+        return node_arrays(data)
+    elif name in ELEMENT_KEYWORDS:
+        return element_arrays(data)
+    return data
+
+
+def pack_keyword(kw):
+    """ Replaces the data of a *Node or *Element Keyword by its
+        packed arrays. Other keywords are left untouched.
+    """
+    name = keyword_name(kw.keyword)
+    if name in NODE_KEYWORDS + ELEMENT_KEYWORDS and not isinstance(kw.data, tuple):
+        kw.data = pack_data(name, kw.data)
+    return kw
@@ -0,0 +1,152 @@
+#-----------------------------------------------------------------
+# abaqus_cache.py
+#
+# On-disk cache of parse results, keyed by the content of the deck
+#-----------------------------------------------------------------
+import hashlib
+import os
+import tempfile
+import time
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+# Bump whenever the grammar or the Keyword/Parameter classes change,
+# so that results pickled by an older parser are not reused
+CACHE_VERSION = 3
+
+DEFAULT_MAX_SIZE = 1 << 30
+
+SUFFIX = '.pickle'
+
+
+def text_digest(text):
+    return hashlib.sha1(text).hexdigest()
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    f = open(path, 'rb')
+    try:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    finally:
+        f.close()
+    return digest.hexdigest()
+
+
+class ParseCache(object):
+    """ A directory of pickled parse results.
+
+        Entries are keyed by the SHA-1 of the deck, CACHE_VERSION
+        and the parse options, so a changed file or parser never
+        hits a stale entry. When the total size of the entries
+        exceeds max_size, the least recently used ones are removed.
+    """
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def key(self, digest, *options):
+        """ Cache key for a deck with the given content digest,
+            parsed with the given options.
+        """
+        parts = [digest, str(CACHE_VERSION)] + [repr(option) for option in options]
+        return hashlib.sha1('\0'.join(parts)).hexdigest()
+
+    def get(self, key):
+        """ Returns the cached keywords for key, or None.
+        """
+        path = self._path(key)
+        try:
+            f = open(path, 'rb')
+        except IOError:
+            return None
+        try:
+            try:
+                keywords = pickle.load(f)
+            except Exception:
+                # Truncated or unreadable entry
+                keywords = None
+        finally:
+            f.close()
+        if keywords is None:
+            self.discard(key)
+            return None
+        self._touch(path)
+        return keywords
+
+    def put(self, key, keywords):
+        """ Stores keywords under key, then evicts old entries if
+            the cache is over max_size.
+        """
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        f = os.fdopen(fd, 'wb')
+        try:
+            pickle.dump(keywords, f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            f.close()
+        os.rename(tmp, self._path(key))
+        self._touch(self._path(key))
+        self.evict()
+
+    def discard(self, key):
+        """ Removes the entry for key, if any.
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """ Removes all entries.
+        """
+        for name, size, mtime in self._entries():
+            self.discard(name[:-len(SUFFIX)])
+
+    def evict(self):
+        """ Removes least recently used entries until the cache
+            fits in max_size.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for name, size, mtime in entries)
+        for name, size, mtime in entries:
+            if total <= self.max_size:
+                break
+            self.discard(name[:-len(SUFFIX)])
+            total -= size
+
+    def size(self):
+        """ Total size in bytes of the entries.
+        """
+        return sum(size for name, size, mtime in self._entries())
+
+    ######################--   PRIVATE   --######################
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _touch(self, path):
+        # The modification time orders entries for eviction. Set it
+        # explicitly, the file system clock may be too coarse.
+        now = time.time()
+        os.utime(path, (now, now))
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((name, st.st_size, st.st_mtime))
+        return entries
@@ -0,0 +1,154 @@
+#-----------------------------------------------------------------
+# abaqus_compress.py
+#
+# Reading of compressed decks. gzip and bz2 files are always
+# supported, xz files if the lzma module (or backports.lzma) is
+# installed and zstd files if zstandard is. Decompressed input is
+# read in chunks, so it never has to be held, or written to disk,
+# as a whole; PrefetchReader can decompress the next chunks on a
+# separate thread while the current one is parsed.
+#-----------------------------------------------------------------
+import os
+import threading
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from abaqus_scanner import DEFAULT_CHUNK_SIZE
+
+# Compression formats by file name extension and by magic bytes
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+MAGIC = (
+    ('\x1f\x8b', 'gzip'),
+    ('BZh', 'bz2'),
+    ('\xfd7zXZ\x00', 'xz'),
+    ('\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+# Chunks read ahead by a PrefetchReader
+PREFETCH_DEPTH = 4
+
+
+def compression(path):
+    """ The compression format of the file at path, 'gzip', 'bz2',
+        'xz' or 'zstd', or None if it is not compressed. Known
+        extensions decide; other files are recognized by their
+        first bytes.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in EXTENSIONS:
+        return EXTENSIONS[ext]
+    f = open(path, 'rb')
+    try:
+        head = f.read(6)
+    finally:
+        f.close()
+    for magic, name in MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_compressed(path, name):
+    """ A file object reading the decompressed content of the file
+        at path, compressed with format name.
+    """
+    if name == 'gzip':
+        import gzip
+        return gzip.GzipFile(path, 'rb')
+    elif name == 'bz2':
+        import bz2
+        return bz2.BZ2File(path, 'rb')
+    elif name == 'xz':
+        try:
+            import lzma
+        except ImportError:
+            try:
+                from backports import lzma
+            except ImportError:
+                raise ValueError('%s: reading xz files needs the lzma module' % path)
+        return lzma.LZMAFile(path, 'rb')
+    elif name == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError('%s: reading zstd files needs the zstandard module' % path)
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    raise ValueError('%s: unknown compression %s' % (path, name))
+
+
+def open_deck(path):
+    """ Opens the deck at path for reading in binary mode,
+        decompressing it on the fly if it is compressed.
+    """
+    name = compression(path)
+    if name is None:
+        return open(path, 'rb')
+    return open_compressed(path, name)
+
+
+class PrefetchReader(object):
+    """ Reads stream chunk_size bytes at a time on a separate
+        thread, up to depth chunks ahead of the reader, so that
+        decompression overlaps with parsing. zlib, bz2 and lzma
+        release the GIL while they decompress.
+
+        read returns the chunks in order and '' at the end; errors
+        of the stream are raised by read. The read size argument is
+        ignored. close stops the thread; stream stays open.
+    """
+    def __init__(self, stream, chunk_size=DEFAULT_CHUNK_SIZE, depth=PREFETCH_DEPTH):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._chunks = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        # Blocking puts: with a timeout, Python 2 queues poll, which
+        # takes the GIL from the parsing thread
+        try:
+            while not self._stop.is_set():
+                chunk = self.stream.read(self.chunk_size)
+                self._chunks.put((chunk, None))
+                if not chunk:
+                    return
+        except Exception as e:
+            self._chunks.put(('', e))
+
+    def read(self, size=-1):
+        if self._done:
+            return ''
+        chunk, error = self._chunks.get()
+        if error is not None:
+            self._done = True
+            raise error
+        if not chunk:
+            self._done = True
+        return chunk
+
+    def close(self):
+        self._stop.set()
+        # Makes room for a blocked put, after which the thread stops
+        while True:
+            try:
+                self._chunks.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
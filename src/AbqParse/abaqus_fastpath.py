@@ -0,0 +1,145 @@
+#-----------------------------------------------------------------
+# abaqus_fastpath.py
+#
+# Bulk splitting of data lines, bypassing the PLY lexer and parser.
+#
+# A keyword block (see abaqus_scanner) is cut into its keyword
+# lines, which still go through AbaqusParser, and its data lines,
+# which are split here with compiled regexes in one pass. Only
+# plainly formatted lines are accepted: comma separated integers,
+# floats and identifiers. Anything else makes split_block return
+# None, and the caller falls back to parsing the block with PLY,
+# so the resulting Keyword objects are always the same.
+#-----------------------------------------------------------------
+import re
+
+from abaqus_lexer import AbaqusLexer
+from abaqus_scanner import keyword_starts
+
+# Same lexemes as t_FLOAT_CONST, t_INT_CONST_DEC and t_ID in
+# AbaqusLexer, restricted to the forms found in real decks
+float_constant = r'[\+\-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][\+\-]?[0-9]+)?|[0-9]+[eE][\+\-]?[0-9]+'
+int_constant = r'[1-9][0-9]*|0'
+identifier = AbaqusLexer.identifier
+
+data_value = '(?:' + float_constant + '|' + int_constant + '|' + identifier + ')'
+data_field = r'[ \t]*' + data_value + r'[ \t]*'
+
+DATA_LINE = re.compile(
+    '(?:' + data_field + ',)*' + data_field + r'(?:,[ \t]*)?\Z')
+DATA_VALUE = re.compile(data_value)
+
+# A single keyword line, as t_KEYWORD and the keywordstate rules
+# of AbaqusLexer split it. Continued keyword lines are left to PLY.
+header_param = (r',[ \t]*(' + identifier + r')(?:[ \t]*=[ \t]*(' +
+                float_constant + '|' + int_constant + '|' + identifier + r')[ \t]*)?')
+HEADER_LINE = re.compile(
+    r'[ \t]*\*([a-zA-Z][0-9a-zA-Z_ \t]*)((?:' +
+    header_param.replace('(', '(?:').replace('(?:?:', '(?:') + r')*)\n\Z')
+HEADER_PARAM = re.compile(header_param)
+COMMENT_LINE = re.compile(r'[ \t]*\*\*')
+KEYWORD_START = re.compile(r'[ \t]*\*(?!\*)')
+
+
+def split_data_lines(lines):
+    """ Splits data lines into lists of value strings. Comment
+        lines are skipped. Returns None if any line needs the
+        full lexer.
+    """
+    data = []
+    for line in lines:
+        if DATA_LINE.match(line):
+            data.append(DATA_VALUE.findall(line))
+        elif COMMENT_LINE.match(line):
+            continue
+        else:
+            return None
+    return data
+
+
+def split_body_lines(lines):
+    """ Splits the data lines of a block, as split_data_lines, but
+        leaves blocks with blank lines to the full parser.
+    """
+    for line in lines:
+        if not line.strip(' \t'):
+            return None
+    return split_data_lines(lines)
+
+
+def split_data(text):
+    """ Splits the text of the data lines of one block into lists
+        of value strings. Returns None if the text needs the full
+        parser.
+    """
+    lines = text.split('\n')
+    # The part after the last newline may only hold indentation
+    if lines[-1].strip(' \t'):
+        return None
+    lines.pop()
+    return split_body_lines(lines)
+
+
+def header_end(text, start, end):
+    """ Index just past the keyword line of the block text[start:end]
+        and its continuation lines. Comment lines in front of the
+        keyword line (first block of a deck) are part of the header.
+    """
+    pos = next(keyword_starts(text, start, end), start)
+    while True:
+        newline = text.find('\n', pos, end)
+        if newline < 0:
+            return end
+        pos = newline + 1
+        # Keyword lines ending with ',' are continued on the next line
+        if text[newline - 1:newline] != ',' or KEYWORD_START.match(text, pos, end):
+            return pos
+
+
+def split_header(header):
+    """ Splits a keyword line into (keyword, params), where params
+        is a list of (name, value) pairs, value None for parameters
+        without one, or None if the line has no parameters. Returns
+        None if the line needs the full parser.
+    """
+    m = HEADER_LINE.match(header)
+    if m is None:
+        return None
+    keyword, rest = m.groups()
+    if not rest:
+        return keyword, None
+    return keyword, HEADER_PARAM.findall(rest)
+
+
+def split_block(block):
+    """ Splits a keyword block into (header, header_offset, data).
+
+        header is the text of the keyword line and its continuation
+        lines, starting header_offset lines into the block, and data
+        the split data lines (None if there are none). Returns None
+        if the block can't be handled by the fast path.
+    """
+    lines = block.split('\n')
+    # The part after the last newline may only hold indentation
+    if lines[-1].strip(' \t'):
+        return None
+    lines.pop()
+    # Leading comments, only found in the first block of a deck
+    first = 0
+    while first < len(lines) and not KEYWORD_START.match(lines[first]):
+        if lines[first].strip(' \t') and not COMMENT_LINE.match(lines[first]):
+            return None
+        first += 1
+    if first == len(lines):
+        return None
+    # Keyword lines ending with ',' are continued on the next line
+    last = first
+    while lines[last].endswith(',') and last + 1 < len(lines):
+        last += 1
+        if lines[last].lstrip(' \t').startswith('*'):
+            return None
+    header = '\n'.join(lines[first:last + 1]) + '\n'
+    data = split_body_lines(lines[last + 1:])
+    if data is None:
+        return None
+    return header, first, data or None
@@ -0,0 +1,60 @@
+#-----------------------------------------------------------------
+# abaqus_feed.py
+#
+# Push parsing: input is handed to a KeywordFeed chunk by chunk as
+# it arrives, instead of the parser reading it, so the parse can be
+# driven by an event loop. No I/O happens inside the feed, and
+# each call does a bounded amount of work, the keyword blocks the
+# chunk completes.
+#-----------------------------------------------------------------
+from abaqus_scanner import BlockSplitter
+
+
+class KeywordFeed(object):
+    """ Parses input fed to it in chunks with parser.
+
+        feed(chunk) returns the Keywords of the blocks that chunk
+        completes, close() those of the last block; each Keyword is
+        returned once its data lines end, as by iter_keywords. The
+        calls can run in a worker thread, e.g. an asyncio service
+        that reads an upload from a StreamReader can keep the event
+        loop free with
+
+            feed = parser.feed_keywords('upload.inp')
+            while True:
+                chunk = await reader.read(1 << 20)
+                if not chunk:
+                    break
+                keywords = await loop.run_in_executor(None, feed.feed, chunk)
+                ...
+            keywords = feed.close()
+
+        A parser must not run two feeds, or a feed and a parse, at
+        the same time.
+    """
+    def __init__(self, parser, filename='', arrays=False, fast=True):
+        self.parser = parser
+        self.filename = filename
+        self.arrays = arrays
+        self.fast = fast
+        self._splitter = BlockSplitter()
+        self.closed = False
+
+    def feed(self, chunk):
+        """ Adds chunk to the input and returns the Keywords it
+            completes. ParseErrors are raised here as well.
+        """
+        if self.closed:
+            raise ValueError('feed after close')
+        return self._parse(self._splitter.feed(chunk))
+
+    def close(self):
+        """ Ends the input and returns the remaining Keywords.
+        """
+        if self.closed:
+            return []
+        self.closed = True
+        return self._parse(self._splitter.close())
+
+    def _parse(self, blocks):
+        return list(self.parser._parse_blocks(blocks, self.filename, self.fast, self.arrays))
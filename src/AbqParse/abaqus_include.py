@@ -0,0 +1,117 @@
+#-----------------------------------------------------------------
+# abaqus_include.py
+#
+# Resolution of *INCLUDE keywords. Included files are loaded level
+# by level, so that all files included from one level can be parsed
+# at the same time on a pool of worker processes, and are then
+# spliced into the including deck in place of the *INCLUDE keywords.
+#-----------------------------------------------------------------
+import os
+
+from abaqus_arrays import keyword_name
+from abaqus_parallel import pool_map
+from plyparser import ParseError
+
+
+def is_include(kw):
+    return keyword_name(kw.keyword) == 'include'
+
+
+def include_path(kw, including):
+    """ Path of the file named by the input= parameter of an
+        *INCLUDE keyword, relative to the including file.
+    """
+    for param in kw.params or []:
+        if param.name.strip().lower() == 'input' and param.value is not None:
+            return os.path.normpath(os.path.join(
+                os.path.dirname(including), param.value.strip()))
+    raise ParseError('%s: *INCLUDE without input parameter' % kw.coord)
+
+
+def parse_path(parser, path, arrays, fast, include_keywords=None, exclude_keywords=None):
+    return parser.parse_file(path, arrays=arrays, fast=fast,
+                             include_keywords=include_keywords,
+                             exclude_keywords=exclude_keywords)
+
+
+def keyword_filters(include_keywords, exclude_keywords):
+    """ The include_keywords and exclude_keywords of a filtered
+        parse, amended to keep *INCLUDE keywords.
+    """
+    if include_keywords is not None:
+        if isinstance(include_keywords, basestring):
+            include_keywords = [include_keywords]
+        include_keywords = list(include_keywords) + ['include']
+    if exclude_keywords is not None:
+        if isinstance(exclude_keywords, basestring):
+            exclude_keywords = [exclude_keywords]
+        exclude_keywords = [name for name in exclude_keywords
+                            if keyword_name(name.lstrip('*')) != 'include']
+    return include_keywords, exclude_keywords
+
+
+def load_tree(path, keywords, load):
+    """ Loads every file included from path, whose keywords are
+        given, recursively.
+
+        load is called once per level of inclusion with a list of
+        paths and returns the list of their keywords; each file is
+        loaded once. Returns a dict from path to keywords.
+    """
+    parsed = {}
+    level = [(path, keywords)]
+    while level:
+        parsed.update(level)
+        found = []
+        for including, keywords in level:
+            for kw in keywords:
+                if not is_include(kw):
+                    continue
+                included = include_path(kw, including)
+                if included in parsed or included in found:
+                    continue
+                if not os.path.isfile(included):
+                    raise ParseError('%s: cannot find include file %s' % (
+                        kw.coord, included))
+                found.append(included)
+        level = list(zip(found, load(found))) if found else []
+    return parsed
+
+
+def splice(path, parsed, chain=()):
+    """ Returns the keywords of path with every *INCLUDE replaced by
+        the keywords of the included file. chain holds the files
+        that are being expanded, to detect cycles.
+    """
+    chain = chain + (path,)
+    keywords = []
+    for kw in parsed[path]:
+        if not is_include(kw):
+            keywords.append(kw)
+            continue
+        included = include_path(kw, path)
+        if included in chain:
+            raise ParseError('%s: include cycle through %s' % (kw.coord, included))
+        keywords.extend(splice(included, parsed, chain))
+    return keywords
+
+
+def parse_with_includes(parser, path, filename=None, arrays=False, fast=True,
+                        workers=1, include_keywords=None, exclude_keywords=None):
+    """ Parses the deck at path with parser, resolving *INCLUDE
+        keywords. See AbaqusParser.parse_file.
+    """
+    path = os.path.normpath(path)
+    include_keywords, exclude_keywords = keyword_filters(include_keywords, exclude_keywords)
+    keywords = parser.parse_file(path, filename, arrays=arrays, fast=fast,
+                                 include_keywords=include_keywords,
+                                 exclude_keywords=exclude_keywords)
+
+    def load(paths):
+        tasks = [(included, arrays, fast, include_keywords, exclude_keywords)
+                 for included in paths]
+        if workers == 1 or len(tasks) == 1:
+            return [parse_path(parser, *task) for task in tasks]
+        return pool_map(parse_path, tasks, workers, parser.options)
+
+    return splice(path, load_tree(path, keywords, load))
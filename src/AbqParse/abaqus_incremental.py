@@ -0,0 +1,229 @@
+#-----------------------------------------------------------------
+# abaqus_incremental.py
+#
+# Incremental re-parsing of a deck after text edits. The deck is
+# kept as keyword blocks (see abaqus_scanner); an edit re-parses
+# only the blocks it touches. The offsets and line numbers of the
+# blocks are prefix sums kept in Fenwick trees, so the blocks after
+# an edit are not visited at all and its cost depends on the size
+# of the edited blocks rather than on the size of the deck.
+#-----------------------------------------------------------------
+from abaqus_scanner import iter_blocks
+
+# A slot collecting more blocks than this, or the square root of
+# the number of slots, from keywords added at one place, makes the
+# edit redistribute the blocks. Scanning a slot and redistributing
+# then both cost O(sqrt(n)) per added keyword.
+SLOT_LIMIT = 64
+
+
+class Fenwick(object):
+    """ Prefix sums of a list of non-negative numbers, with
+        O(log n) updates and queries.
+    """
+    def __init__(self, numbers):
+        self.n = n = len(numbers)
+        self.tree = tree = [0] + list(numbers)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.top = 1
+        while self.top * 2 <= n:
+            self.top *= 2
+
+    def add(self, i, delta):
+        """ Adds delta to number i.
+        """
+        i += 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """ Sum of the numbers before number i.
+        """
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, target):
+        """ The largest i whose prefix(i) <= target.
+        """
+        i = 0
+        step = self.top
+        while step:
+            if i + step <= self.n and self.tree[i + step] <= target:
+                i += step
+                target -= self.tree[i]
+            step //= 2
+        return i
+
+
+class IncrementalParse(object):
+    """ The parse of text by parser, which can be updated by edit.
+
+        keywords is the list of Keywords of text, as returned by
+        AbaqusParser.parse. The text is held block by block, so that
+        an edit copies only the blocks it touches. The blocks are
+        kept in slots, each holding a list of [text, keywords,
+        number of lines, line number of the keyword coords] blocks;
+        an edit replaces the blocks of the slots it touches, so the
+        slots after it keep their place in the Fenwick trees of
+        slot sizes and line counts.
+
+        The coords of the keywords of blocks moved by an edit are
+        brought up to date when keywords is read.
+    """
+    def __init__(self, parser, text, filename='', arrays=False, fast=True):
+        self.parser = parser
+        self.filename = filename
+        self.arrays = arrays
+        self.fast = fast
+        self.size = len(text)
+        if not text:
+            # Let the parser report the empty deck
+            parser.parse(text, filename, arrays=arrays, fast=fast)
+        self._rebuild(self._parse_region(text, 1))
+
+    @property
+    def text(self):
+        return ''.join(block[0] for block in self._iter_blocks())
+
+    @property
+    def keywords(self):
+        keywords = []
+        lineno = 1
+        for block in self._iter_blocks():
+            shift = lineno - block[3]
+            if shift:
+                for kw in block[1]:
+                    kw.coord.line += shift
+                block[3] = lineno
+            keywords.extend(block[1])
+            lineno += block[2]
+        return keywords
+
+    @property
+    def starts(self):
+        """ The offset of every block.
+        """
+        starts = []
+        start = 0
+        for block in self._iter_blocks():
+            starts.append(start)
+            start += len(block[0])
+        return starts
+
+    def edit(self, offset, length, text):
+        """ Replaces the length characters at offset by text and
+            re-parses the keyword blocks the change touches. Returns
+            the keywords of those blocks. If they don't parse, the
+            ParseError is raised and nothing is changed.
+        """
+        end = offset + length
+        if offset < 0 or length < 0 or end > self.size:
+            raise ValueError('edit out of range')
+        # Blocks first..last hold the edit. A change to the keyword
+        # line of the first one may join it to the block before.
+        first = self._find(offset)
+        slot, index, begin, lineno = first
+        if begin > 0:
+            newline = self._slots[slot][index][0].find('\n')
+            if newline < 0 or offset <= begin + newline:
+                first = self._find(begin - 1)
+                slot, index, begin, lineno = first
+        last = max(self._find(end), first)
+        old = ''.join(block[0] for block in self._blocks_between(first, last))
+        region = old[:offset - begin] + text + old[end - begin:]
+        if not region and len(old) == self.size:
+            # Let the parser report the empty deck
+            self.parser.parse(region, self.filename, arrays=self.arrays, fast=self.fast)
+        parsed = self._parse_region(region, lineno)
+        self.size += len(text) - length
+        self._replace(first, last, parsed)
+        return [kw for block in parsed for kw in block[1]]
+
+    ######################--   PRIVATE   --######################
+
+    def _parse_region(self, text, lineno):
+        """ Parses the blocks of text, whose first line is lineno.
+            Returns a block list for every block.
+        """
+        parsed = []
+        for block_lineno, block in iter_blocks(text, lineno):
+            keywords = list(self.parser._parse_blocks(
+                [(block_lineno, block)], self.filename, self.fast, self.arrays))
+            parsed.append([block, keywords, block.count('\n'), block_lineno])
+        return parsed
+
+    def _iter_blocks(self):
+        for slot in self._slots:
+            for block in slot:
+                yield block
+
+    def _rebuild(self, blocks):
+        """ Puts every block in a slot of its own.
+        """
+        self._slots = [[block] for block in blocks]
+        self._nblocks = len(blocks)
+        self._slot_sizes = [len(block[0]) for block in blocks]
+        self._slot_lines = [block[2] for block in blocks]
+        self._sizes = Fenwick(self._slot_sizes)
+        self._lines = Fenwick(self._slot_lines)
+        self._slot_limit = max(SLOT_LIMIT, int(len(blocks) ** 0.5))
+
+    def _find(self, offset):
+        """ (slot, index, start, lineno) of the block holding offset,
+            or of the last block if offset is the end of the text.
+        """
+        target = min(offset, self.size - 1)
+        slot = self._sizes.find(target)
+        start = self._sizes.prefix(slot)
+        lineno = 1 + self._lines.prefix(slot)
+        for index, block in enumerate(self._slots[slot]):
+            if start + len(block[0]) > target:
+                break
+            start += len(block[0])
+            lineno += block[2]
+        return slot, index, start, lineno
+
+    def _blocks_between(self, first, last):
+        """ Yields the blocks from first to last, located by _find.
+        """
+        for slot in range(first[0], last[0] + 1):
+            blocks = self._slots[slot]
+            stop = last[1] + 1 if slot == last[0] else len(blocks)
+            for block in blocks[first[1] if slot == first[0] else 0:stop]:
+                yield block
+
+    def _replace(self, first, last, parsed):
+        """ Replaces the blocks from first to last by parsed, in the
+            slot of first.
+        """
+        first_slot, first_index = first[:2]
+        last_slot, last_index = last[:2]
+        slots = self._slots
+        removed = 0
+        for slot in range(first_slot, last_slot + 1):
+            removed += len(slots[slot])
+        tail = slots[last_slot][last_index + 1:]
+        if last_slot > first_slot:
+            slots[last_slot] = tail
+            tail = []
+        for slot in range(first_slot + 1, last_slot):
+            slots[slot] = []
+        slots[first_slot] = slots[first_slot][:first_index] + parsed + tail
+        for slot in range(first_slot, last_slot + 1):
+            removed -= len(slots[slot])
+            size = sum(len(block[0]) for block in slots[slot])
+            lines = sum(block[2] for block in slots[slot])
+            self._sizes.add(slot, size - self._slot_sizes[slot])
+            self._lines.add(slot, lines - self._slot_lines[slot])
+            self._slot_sizes[slot] = size
+            self._slot_lines[slot] = lines
+        self._nblocks -= removed
+        if len(slots[first_slot]) > self._slot_limit or 2 * self._nblocks < len(slots):
+            self._rebuild(list(self._iter_blocks()))
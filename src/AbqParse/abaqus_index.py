@@ -0,0 +1,181 @@
+#-----------------------------------------------------------------
+# abaqus_index.py
+#
+# Keyword index for random access into large decks. One pass over
+# the deck records where every keyword block starts; queries then
+# seek to the blocks they need and parse only those.
+#-----------------------------------------------------------------
+import json
+import os
+import re
+
+from abaqus_arrays import keyword_name
+from abaqus_fastpath import header_end
+from abaqus_scanner import iter_stream_blocks
+
+# Bump whenever the sidecar file layout changes
+INDEX_VERSION = 1
+
+SIDECAR_SUFFIX = '.idx'
+
+COMMENT_LINE = re.compile(r'^[ \t]*\*\*', re.MULTILINE)
+BLANK_LINE = re.compile(r'^[ \t]*\n', re.MULTILINE)
+
+
+class IndexEntry(object):
+    """ One keyword block of an indexed deck.
+
+        name is the normalized keyword name and params a list of
+        (name, value) pairs with normalized names. The block is
+        length bytes at byte offset and starts on line lineno;
+        nlines is its number of data lines.
+    """
+    __slots__ = ('name', 'params', 'offset', 'length', 'lineno', 'nlines')
+
+    def __init__(self, name, params, offset, length, lineno, nlines):
+        self.name = name
+        self.params = params
+        self.offset = offset
+        self.length = length
+        self.lineno = lineno
+        self.nlines = nlines
+
+    def param(self, name, default=None):
+        name = keyword_name(name)
+        for param_name, value in self.params:
+            if param_name == name:
+                return value
+        return default
+
+    def matches(self, name, params):
+        if self.name != keyword_name(name):
+            return False
+        for param_name, value in params.items():
+            found = self.param(param_name)
+            if found is None or found.strip().lower() != str(value).lower():
+                return False
+        return True
+
+
+class KeywordIndex(object):
+    """ Index of the keyword blocks of the deck at path.
+
+        Build it with KeywordIndex.build, or with KeywordIndex.open,
+        which reuses an up to date sidecar file (path + '.idx') and
+        writes one otherwise.
+    """
+    def __init__(self, path, entries, parser):
+        self.path = path
+        self.entries = entries
+        self.parser = parser
+
+    @classmethod
+    def build(cls, path, parser):
+        """ Indexes the deck at path in one pass, parsing only the
+            keyword lines with parser.
+        """
+        entries = []
+        offset = 0
+        f = open(path, 'rb')
+        try:
+            for lineno, block in iter_stream_blocks(f):
+                stop = header_end(block, 0, len(block))
+                keywords = parser.parse(block[:stop], path, lineno=lineno)
+                kw = keywords[-1]
+                params = [(keyword_name(param.name), param.value)
+                          for param in kw.params or []]
+                nlines = (block.count('\n', stop)
+                          - len(COMMENT_LINE.findall(block, stop))
+                          - len(BLANK_LINE.findall(block, stop)))
+                entries.append(IndexEntry(
+                    keyword_name(kw.keyword), params, offset, len(block),
+                    lineno, nlines))
+                offset += len(block)
+        finally:
+            f.close()
+        return cls(path, entries, parser)
+
+    @classmethod
+    def load(cls, path, parser, sidecar=None):
+        """ Reads the index of path from its sidecar file. Returns
+            None if there is none, or if the deck changed since it
+            was written.
+        """
+        if sidecar is None:
+            sidecar = path + SIDECAR_SUFFIX
+        try:
+            f = open(sidecar, 'rb')
+        except IOError:
+            return None
+        try:
+            try:
+                state = json.load(f)
+            except ValueError:
+                return None
+        finally:
+            f.close()
+        st = os.stat(path)
+        if (state.get('version') != INDEX_VERSION or state.get('size') != st.st_size
+                or state.get('mtime') != st.st_mtime):
+            return None
+        entries = [IndexEntry(name, [tuple(param) for param in params], *fields)
+                   for name, params, fields in state['entries']]
+        return cls(path, entries, parser)
+
+    @classmethod
+    def open(cls, path, parser, sidecar=None):
+        """ Loads the index of path from its sidecar file, or builds
+            it and writes the sidecar file.
+        """
+        index = cls.load(path, parser, sidecar)
+        if index is None:
+            index = cls.build(path, parser)
+            index.save(sidecar)
+        return index
+
+    def save(self, sidecar=None):
+        """ Writes the index to a sidecar file, by default next to
+            the deck.
+        """
+        if sidecar is None:
+            sidecar = self.path + SIDECAR_SUFFIX
+        st = os.stat(self.path)
+        state = {
+            'version': INDEX_VERSION,
+            'size': st.st_size,
+            'mtime': st.st_mtime,
+            'entries': [(entry.name, entry.params,
+                         (entry.offset, entry.length, entry.lineno, entry.nlines))
+                        for entry in self.entries],
+        }
+        f = open(sidecar, 'wb')
+        try:
+            json.dump(state, f)
+        finally:
+            f.close()
+
+    def find(self, keyword, **params):
+        """ Entries of the blocks of the given keyword whose
+            parameters have the given values, e.g.
+            find('elset', elset='box'). Names and values are
+            compared case-insensitively, as Abaqus does.
+        """
+        return [entry for entry in self.entries if entry.matches(keyword, params)]
+
+    def read(self, entry, **options):
+        """ Parses the block of entry and returns its Keyword.
+            options are passed to AbaqusParser.parse.
+        """
+        f = open(self.path, 'rb')
+        try:
+            f.seek(entry.offset)
+            text = f.read(entry.length)
+        finally:
+            f.close()
+        return self.parser.parse(text, self.path, lineno=entry.lineno,
+                                 **options)[-1]
+
+    def get(self, keyword, **params):
+        """ Keywords of the blocks matching find(keyword, **params).
+        """
+        return [self.read(entry) for entry in self.find(keyword, **params)]
@@ -7,6 +7,7 @@
 # License: BSD
 #-----------------------------------------------------------------
 
+import copy
 import re
 import sys
 
@@ -34,6 +35,8 @@ class AbaqusLexer(object):
         """
         self.error_func = error_func
         self.filename = ''
+        # Offset in lexdata of the start of the current line
+        self.line_start = 0
         
     def build(self, **kwargs):
         """ Builds the lexer from the specification. Must be
@@ -45,13 +48,45 @@ class AbaqusLexer(object):
         """
         self.lexer = ply.lex.lex(object=self, **kwargs)
 
-    def reset_lineno(self):
+    def clone(self, error_func):
+        """ Returns a new, built AbaqusLexer that shares the compiled
+            rules of this one but has its own position and states.
+            (ply.lex.Lexer.clone keeps only the last master regex of
+            each state, so the rules are rebound here.)
+        """
+        clex = AbaqusLexer(error_func)
+        clex.filename = self.filename
+        lexer = copy.copy(self.lexer)
+        lexer.lexstatere = dict(
+            (state, [(cre, [clex._rebind(f) for f in findex]) for cre, findex in ritem])
+            for state, ritem in self.lexer.lexstatere.items())
+        lexer.lexstateerrorf = dict(
+            (state, getattr(clex, f.__name__))
+            for state, f in self.lexer.lexstateerrorf.items())
+        lexer.lexmodule = clex
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        clex.lexer = lexer
+        return clex
+
+    def _rebind(self, f):
+        # f is (rule function, token type), or None for no rule
+        if not f or not f[0]:
+            return f
+        return getattr(self, f[0].__name__), f[1]
+
+    def reset_lineno(self, lineno=1):
         """ Resets the internal line number counter of the lexer.
         """
-        self.lexer.lineno = 1
+        self.lexer.lineno = lineno
 
     def input(self, text):
+        # Start every input in the initial state, so that a lexer
+        # can be reused after it stopped in the middle of a block
+        self.lexer.lexstatestack = []
+        self.lexer.begin('INITIAL')
         self.lexer.input(text)
+        self.line_start = 0
     
     def token(self):
         g = self.lexer.token()
@@ -67,12 +102,16 @@ class AbaqusLexer(object):
         self.error_func(msg, location[0], location[1])
         self.lexer.skip(1)
     
+    def _newlines(self, t):
+        """ Advances the line count over the newlines in the value
+            of t, keeping track of where the current line starts.
+        """
+        t.lexer.lineno += t.value.count("\n")
+        self.line_start = t.lexpos + t.value.rfind("\n") + 1
+
     def _find_tok_column(self, token):
-        i = token.lexpos
-        while i > 0:
-            if self.lexer.lexdata[i] == '\n': break
-            i -= 1
-        return (token.lexpos - i) + 1
+        # Tokens are only located while the lexer is on their line
+        return token.lexpos - self.line_start + 1
     
     def _make_tok_location(self, token):
         return (token.lineno, self._find_tok_column(token))
@@ -172,6 +211,8 @@ class AbaqusLexer(object):
     
     def t_keywordstate_CONTINUE(self, t):
         r',\n'
+        t.lexer.lineno += 1
+        self.line_start = t.lexpos + 2
         t.value = ','
         t.type = 'COMMA'
         return t
@@ -180,7 +221,7 @@ class AbaqusLexer(object):
         r'\n'
         t.lexer.pop_state()
         t.lexer.push_state('datalinestate')
-        t.lexer.lineno += t.value.count("\n")
+        self._newlines(t)
 
     t_keywordstate_ignore = ' \t'
 
@@ -190,7 +231,7 @@ class AbaqusLexer(object):
 
     def t_datalinestate_LASTTOKENONLINE(self, t):
         r'\n+'
-        t.lexer.lineno += t.value.count("\n")
+        self._newlines(t)
         return t
 
     ##
@@ -201,13 +242,13 @@ class AbaqusLexer(object):
     
     def t_COMMENT(self, t):
         r'[ \t]*\*\*.*\n'
-        t.lexer.lineno += t.value.count("\n")
+        self._newlines(t)
 
     # Newlines
 
     def t_NEWLINEALONE(self, t):
         r'\n+'
-        t.lexer.lineno += t.value.count("\n")
+        self._newlines(t)
 
     # Assignment operators
     t_EQUALS            = r'='
@@ -0,0 +1,184 @@
+#-----------------------------------------------------------------
+# abaqus_mesh.py
+#
+# Columnar mesh model built from parsed keywords: one coordinate
+# array for all nodes, one connectivity array per element type,
+# and sorted label indexes, so that lookups by label are NumPy
+# fancy indexing instead of Python loops over dicts.
+#-----------------------------------------------------------------
+import numpy
+
+from abaqus_arrays import (NODE_KEYWORDS, ELEMENT_KEYWORDS, keyword_name, keyword_param,
+                           node_arrays, element_arrays)
+from abaqus_sets import NSET_KEYWORDS, ELSET_KEYWORDS, SetTable
+
+
+class LabelIndex(object):
+    """ Maps labels to rows of the arrays they label, by binary
+        search in the sorted labels. If a label occurs more than
+        once, its first row is used.
+    """
+    def __init__(self, labels):
+        self.labels = labels
+        self.order = numpy.argsort(labels, kind='mergesort')
+        self.sorted = labels[self.order]
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _positions(self, labels):
+        labels = numpy.asarray(labels, dtype=numpy.int64)
+        pos = numpy.searchsorted(self.sorted, labels)
+        found = pos < len(self.sorted)
+        found[found] = self.sorted[pos[found]] == labels[found]
+        return labels, pos, found
+
+    def contains(self, labels):
+        """ Boolean array telling which of labels are indexed.
+        """
+        return self._positions(labels)[2]
+
+    def rows(self, labels):
+        """ Rows of labels. Raises KeyError if some are missing.
+        """
+        labels, pos, found = self._positions(labels)
+        if not found.all():
+            raise KeyError('labels not found: %s' % labels[~found][:10].tolist())
+        return self.order[pos]
+
+
+class ElementTable(object):
+    """ The elements of one type: labels, connectivity (a row of
+        node labels per element) and the label index.
+    """
+    def __init__(self, etype, labels, connectivity):
+        self.type = etype
+        self.labels = labels
+        self.connectivity = connectivity
+        self.index = LabelIndex(labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+
+def packed(kw, name):
+    """ (labels, values) of a *Node or *Element Keyword, whether its
+        data was packed by the parser or not.
+    """
+    data = kw.data
+    if isinstance(data, tuple):
+        return data
+    if name in NODE_KEYWORDS:
+        return node_arrays(data)
+    return element_arrays(data)
+
+
+def concatenate(arrays, dtype):
+    if not arrays:
+        return numpy.zeros(0, dtype=dtype)
+    return numpy.concatenate(arrays)
+
+
+class Mesh(object):
+    """ Nodes, elements and sets of a deck.
+
+        node_labels and coords hold all nodes, with index (a
+        LabelIndex) mapping labels to rows. elements maps element
+        types, e.g. 'cax4', to ElementTables; type names are lower
+        case. nsets and elsets are abaqus_sets.SetTables, which give
+        the sorted labels of a set by name.
+    """
+    def __init__(self, node_labels, coords, elements, nsets=None, elsets=None):
+        self.node_labels = node_labels
+        self.coords = coords
+        self.index = LabelIndex(node_labels)
+        self.elements = elements
+        self.nsets = nsets if nsets is not None else SetTable('nset')
+        self.elsets = elsets if elsets is not None else SetTable('elset')
+
+    @classmethod
+    def from_keywords(cls, keywords):
+        """ Builds the mesh from *Node, *Element, *Nset and *Elset
+            keywords; other keywords are ignored. Their data may
+            come from a parse with or without arrays.
+        """
+        node_blocks = []
+        element_blocks = {}
+        nsets = SetTable('nset')
+        elsets = SetTable('elset')
+        for kw in keywords:
+            name = keyword_name(kw.keyword)
+            if name in NODE_KEYWORDS:
+                labels, coords = packed(kw, name)
+                node_blocks.append((labels, coords))
+                nset = keyword_param(kw, 'nset')
+                if nset:
+                    nsets.add_labels(nset, labels)
+            elif name in ELEMENT_KEYWORDS:
+                labels, connectivity = packed(kw, name)
+                etype = (keyword_param(kw, 'type') or '').lower()
+                element_blocks.setdefault(etype, []).append((labels, connectivity))
+                elset = keyword_param(kw, 'elset')
+                if elset:
+                    elsets.add_labels(elset, labels)
+            elif name in NSET_KEYWORDS:
+                nsets.add_keyword(kw)
+            elif name in ELSET_KEYWORDS:
+                elsets.add_keyword(kw)
+
+        ncols = max([coords.shape[1] for labels, coords in node_blocks] or [3])
+        node_labels = concatenate([labels for labels, coords in node_blocks], numpy.int64)
+        coords = numpy.zeros((len(node_labels), ncols), dtype=numpy.float64)
+        row = 0
+        for labels, block in node_blocks:
+            coords[row:row + len(labels), :block.shape[1]] = block
+            row += len(labels)
+
+        elements = {}
+        for etype, blocks in element_blocks.items():
+            elements[etype] = ElementTable(
+                etype,
+                numpy.concatenate([labels for labels, connectivity in blocks]),
+                numpy.concatenate([connectivity for labels, connectivity in blocks]))
+        return cls(node_labels, coords, elements, nsets, elsets)
+
+    def node_coords(self, labels):
+        """ Coordinates of the nodes with the given labels, one row
+            per label.
+        """
+        return self.coords[self.index.rows(labels)]
+
+    def element_nodes(self, labels):
+        """ Sorted unique labels of the nodes of the elements with
+            the given labels, whatever their types.
+        """
+        labels = numpy.asarray(labels, dtype=numpy.int64)
+        found = numpy.zeros(len(labels), dtype=bool)
+        nodes = []
+        for table in self.elements.values():
+            mask = table.index.contains(labels)
+            found |= mask
+            rows = table.index.rows(labels[mask])
+            nodes.append(table.connectivity[rows].ravel())
+        if not found.all():
+            raise KeyError('elements not found: %s' % labels[~found][:10].tolist())
+        return numpy.unique(concatenate(nodes, numpy.int64))
+
+    def nset(self, name):
+        return self.nsets[name]
+
+    def elset(self, name):
+        return self.elsets[name]
+
+    def nset_coords(self, name):
+        """ (labels, coords) of the nodes of nset name.
+        """
+        labels = self.nset(name)
+        return labels, self.node_coords(labels)
+
+    def elset_coords(self, name):
+        """ (labels, coords) of the nodes of the elements of elset
+            name, e.g. mesh.elset_coords('box').
+        """
+        labels = self.element_nodes(self.elset(name))
+        return labels, self.node_coords(labels)
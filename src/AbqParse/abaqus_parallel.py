@@ -0,0 +1,203 @@
+#-----------------------------------------------------------------
+# abaqus_parallel.py
+#
+# Parsing of large decks on several processes. The deck is cut at
+# keyword lines into chunks, and blocks too large for one chunk
+# between their data lines; each worker process parses chunks with
+# its own AbaqusParser, and the results are merged in order.
+#-----------------------------------------------------------------
+import multiprocessing
+import os
+
+from abaqus_arrays import ENTRIES_PER_LINE
+from abaqus_fastpath import header_end
+from abaqus_parser import AbaqusParser
+from abaqus_scanner import iter_stream_blocks
+
+# Chunks per worker; more chunks even out uneven block sizes
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1 << 20
+
+_worker_parser = None
+
+
+def _init_worker(parser_options):
+    global _worker_parser
+    _worker_parser = AbaqusParser(**parser_options)
+
+
+def _call_worker(args):
+    func, task = args
+    return func(_worker_parser, *task)
+
+
+def pool_map(func, tasks, workers, parser_options):
+    """ Returns [func(parser, *task) for task in tasks], computed
+        on a pool of worker processes that each hold an AbaqusParser
+        built with parser_options. func must be a module level
+        function.
+    """
+    pool = multiprocessing.Pool(
+        min(workers, len(tasks)), _init_worker, (parser_options,))
+    try:
+        results = pool.map(_call_worker, [(func, task) for task in tasks],
+                           chunksize=1)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+
+def parse_chunk(parser, path, filename, offset, length, lineno, arrays=False,
+                header=None):
+    """ Parses length bytes of the file at path, starting at byte
+        offset, which is the start of line lineno. A chunk that
+        starts within the data lines of a keyword block is parsed
+        under header, the keyword line(s) of that block.
+    """
+    f = open(path, 'rb')
+    try:
+        f.seek(offset)
+        text = f.read(length)
+    finally:
+        f.close()
+    if header is not None:
+        text = header + text
+        lineno -= header.count('\n')
+    return parser.parse(text, filename, arrays=arrays, lineno=lineno)
+
+
+def data_cut(block, pos):
+    """ Offset of the first line of block starting at or after pos
+        where its data lines can be cut: the line before must not be
+        continued, i.e. neither end with ',' nor hold a multiple of
+        ENTRIES_PER_LINE entries like wrapped element lines. Returns
+        None if there is none.
+    """
+    while True:
+        cut = block.find('\n', pos - 1) + 1
+        if cut == 0 or cut >= len(block):
+            return None
+        line = block[block.rfind('\n', 0, cut - 1) + 1:cut - 1].rstrip()
+        if not line.endswith(',') and (line.count(',') + 1) % ENTRIES_PER_LINE:
+            return cut
+        pos = cut + 1
+
+
+def find_chunks(path, chunk_size):
+    """ Scans the deck for keyword lines and returns a list of
+        (offset, length, lineno, header) chunks of about chunk_size
+        bytes. Each starts at a keyword line (or at the start of the
+        file), with header None, or, in a block larger than
+        chunk_size, between two of its data lines, with header the
+        keyword line(s) of the block.
+    """
+    chunks = []
+    offset = 0
+    length = 0
+    lineno = 1
+    header = None
+    f = open(path, 'rb')
+    try:
+        for block_lineno, block in iter_stream_blocks(f):
+            if length >= chunk_size:
+                chunks.append((offset, length, lineno, header))
+                offset += length
+                length = 0
+                lineno = block_lineno
+                header = None
+            pos = 0
+            stop = None
+            while len(block) - pos > chunk_size - length:
+                if stop is None:
+                    stop = header_end(block, 0, len(block))
+                cut = data_cut(block, max(stop, pos + chunk_size - length))
+                if cut is None:
+                    break
+                length += cut - pos
+                chunks.append((offset, length, lineno, header))
+                offset += length
+                length = 0
+                lineno = block_lineno + block.count('\n', 0, cut)
+                header = block[:stop]
+                pos = cut
+            length += len(block) - pos
+    finally:
+        f.close()
+    if length or not chunks:
+        chunks.append((offset, length, lineno, header))
+    return chunks
+
+
+def join_data(data, more):
+    """ The data of a keyword followed by more data lines of it,
+        both lists of lines or both packed arrays.
+    """
+    if not more:
+        return data
+    if not data:
+        return more
+    if isinstance(data, tuple):
+        import numpy
+        if data[1].shape[1] != more[1].shape[1]:
+            # Nodes with more coordinates in one of the pieces
+            ncols = max(data[1].shape[1], more[1].shape[1])
+            data, more = [(labels, numpy.hstack([table, numpy.zeros(
+                              (len(table), ncols - table.shape[1]), dtype=table.dtype)]))
+                          for labels, table in (data, more)]
+        return tuple(numpy.concatenate(pair) for pair in zip(data, more))
+    return data + more
+
+
+def parse_parallel(path, workers=None, filename=None, arrays=False,
+                   chunk_size=None, **parser_options):
+    """ Parses the Abaqus input file at path on several processes
+        and returns the list of Keywords, as AbaqusParser.parse
+        would.
+
+        workers:
+            Number of worker processes. Defaults to the number of
+            CPUs.
+
+        filename:
+            Name of the file for error messages. Defaults to path.
+            Line numbers in errors refer to the whole file.
+
+        arrays:
+            As in AbaqusParser.parse.
+
+        chunk_size:
+            Approximate size in bytes of the pieces handed to the
+            workers. Defaults to an even split of the file into
+            CHUNKS_PER_WORKER pieces per worker.
+
+        parser_options:
+            Passed to the AbaqusParser created in each worker.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if filename is None:
+        filename = path
+    if chunk_size is None:
+        chunk_size = max(os.path.getsize(path) // (workers * CHUNKS_PER_WORKER),
+                         MIN_CHUNK_SIZE)
+    tasks = [(path, filename, offset, length, lineno, arrays, header)
+             for offset, length, lineno, header in find_chunks(path, chunk_size)]
+
+    if workers == 1 or len(tasks) == 1:
+        parser = AbaqusParser(**parser_options)
+        results = [parse_chunk(parser, *task) for task in tasks]
+    else:
+        results = pool_map(parse_chunk, tasks, workers, parser_options)
+
+    keywords = []
+    for task, result in zip(tasks, results):
+        if task[-1] is not None and result:
+            # The first keyword continues the data of the last one
+            keywords[-1].data = join_data(keywords[-1].data, result[0].data)
+            result = result[1:]
+        keywords.extend(result)
+    return keywords
@@ -3,27 +3,115 @@
 # AbaqusParser class: Parser and AST builder for Abaqus input files
 #
 #-----------------------------------------------------------------
+import copy
+import importlib
+import mmap
+import os
 import re
+import sys
+import time
 
 import ply.yacc
 
 from abaqus_lexer import AbaqusLexer
-from plyparser import PLYParser, Coord, ParseError
+from abaqus_scanner import (iter_blocks, iter_block_spans, iter_stream_blocks,
+                            count_lines, text_slice, KeywordFilter, DEFAULT_CHUNK_SIZE)
+from abaqus_fastpath import split_block, split_data, split_header, header_end
+from abaqus_cache import text_digest, file_digest
+from plyparser import PLYParser, Coord, ParseError, check_state
+
+# The lextab.py and yacctab.py tables shipped with the package live
+# here. Only _build_tables.py writes them.
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+# Module names of the shipped tables, in the package this module was
+# imported from (plain names when it is run as a script)
+TABLES_PACKAGE = __package__ or __name__.rpartition('.')[0]
+LEXTAB = '.'.join(filter(None, (TABLES_PACKAGE, 'lextab')))
+YACCTAB = '.'.join(filter(None, (TABLES_PACKAGE, 'yacctab')))
+
+# Syntax error of input that ends in the middle of a keyword
+END_OF_INPUT = 'At end of input'
+# The KEYWORD token at the start of a keyword line
+KEYWORD_TOKEN = re.compile(r'[ \t]*(%s)' % AbaqusLexer.abaqus_keyword)
+
+def load_table(name):
+    """ Imports the table module name. Returns None if there is no
+        such module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 def list_append(lst, item):
     lst.append(item)
     return lst
 
 class Parameter(object):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value = None):
         self.name = name
         self.value = value
+
+    def __getstate__(self):
+        return (self.name, self.value)
+
+    def __setstate__(self, state):
+        check_state(state, 2)
+        self.name, self.value = state
         
 class Keyword(object):
-    def __init__(self, keyword, params = None, data = None):
+    """ A keyword with its parameters and data lines.
+
+        Keywords from a lazy parse keep their data as a span of the
+        source text, and only split it into values when data is
+        first accessed; the result then replaces the span.
+    """
+    __slots__ = ('keyword', 'params', 'coord', '_data', '_span')
+
+    def __init__(self, keyword, params = None, data = None, coord = None):
         self.keyword = keyword
         self.params = params
-        self.data = data
+        self.coord = coord
+        self._data = data
+        self._span = None
+
+    def _get_data(self):
+        if self._span is not None:
+            text, start, end, lineno, loader = self._span
+            self._data = loader(self, text, start, end, lineno)
+            self._span = None
+        return self._data
+
+    def _set_data(self, data):
+        self._data = data
+        self._span = None
+
+    data = property(_get_data, _set_data)
+
+    @property
+    def loaded(self):
+        """ False while the data is still an unsplit span.
+        """
+        return self._span is None
+
+    def set_span(self, text, start, end, lineno, loader):
+        """ Makes the data lazy: text[start:end] holds the data lines,
+            the first of them on line lineno, and
+            loader(keyword, text, start, end, lineno) returns the
+            data when it is first accessed.
+        """
+        self._data = None
+        self._span = (text, start, end, lineno, loader)
+
+    def __getstate__(self):
+        return (self.keyword, self.params, self.data, self.coord)
+
+    def __setstate__(self, state):
+        check_state(state, 4)
+        self.keyword, self.params, self._data, self.coord = state
+        self._span = None
         
     def __str__(self):
         kwd_str_list = ['Keyword:{0}'.format(self.keyword),]
@@ -42,16 +130,15 @@ class Keyword(object):
     def __repr__(self):
         return str(self)
         
-keywords = []
-
 class AbaqusParser(PLYParser):    
     def __init__(
             self, 
             lex_optimize=True,
-            lextab='pycparser.lextab',
+            lextab=LEXTAB,
             yacc_optimize=True,
-            yacctab='pycparser.yacctab',
-            yacc_debug=False):
+            yacctab=YACCTAB,
+            yacc_debug=False,
+            cache=None):
         """ Create a new AbaqusParser.
         
             Some arguments for controlling the debug/optimization
@@ -71,10 +158,13 @@ class AbaqusParser(PLYParser):
             
             lextab:
                 Points to the lex table that's used for optimized
-                mode. Only if you're modifying the lexer and want
-                some tests to avoid re-generating the table, make 
-                this point to a local lex table file (that's been
-                earlier generated with lex_optimize=True)
+                mode. Defaults to the table shipped in the AbqParse
+                package (see _build_tables.py). Only if you're
+                modifying the lexer and want some tests to avoid
+                re-generating the table, make this point to a local
+                lex table module. The parser never writes tables;
+                if lextab doesn't exist, the lexer table is
+                regenerated on each run.
             
             yacc_optimize:
                 Set to False when you're modifying the parser.
@@ -86,33 +176,84 @@ class AbaqusParser(PLYParser):
             
             yacctab:
                 Points to the yacc table that's used for optimized
-                mode. Only if you're modifying the parser, make 
-                this point to a local yacc table file
-                        
+                mode. Defaults to the table shipped in the AbqParse
+                package. Only if you're modifying the parser, make
+                this point to a local yacc table module. As for
+                lextab, a missing table is regenerated but not
+                written.
+
             yacc_debug:
-                Generate a parser.out file that explains how yacc
-                built the parsing table from the grammar.
+                Generate a parser.out file in the current directory
+                that explains how yacc built the parsing table from
+                the grammar.
+
+            cache:
+                An abaqus_cache.ParseCache. When given, parse and
+                parse_file return the stored result for a deck whose
+                content was parsed before with the same options,
+                instead of parsing it again.
         """
+        self.cache = cache
+        # List collecting ParseErrors during a parse with errors=
+        self._errors = None
+        # abaqus_stats.ParseStats during a parse with stats=
+        self._stats = None
+        # abaqus_scanner.KeywordFilter during a parse with
+        # include_keywords= or exclude_keywords=
+        self._filter = None
+        # Kept to build equivalent parsers in worker processes
+        self.options = dict(
+            lex_optimize=lex_optimize,
+            lextab=lextab,
+            yacc_optimize=yacc_optimize,
+            yacctab=yacctab,
+            cache=cache)
         self.clex = AbaqusLexer(error_func=self._lex_error_func)
             
+        # PLY writes the lex table it regenerates for a table name,
+        # but never for a table module
+        lextab = load_table(lextab) if lex_optimize else None
         self.clex.build(
-            optimize=lex_optimize,
+            optimize=lextab is not None,
             lextab=lextab)
         self.tokens = self.clex.tokens
-        
+
         self.cparser = ply.yacc.yacc(
-            module=self, 
+            module=self,
             start='keyword_list',
             debug=yacc_debug,
             optimize=yacc_optimize,
-            tabmodule=yacctab)
+            tabmodule=yacctab,
+            write_tables=False)
         
     
-    def parse(self, text, filename='', debuglevel=0):
+    def clone(self):
+        """ Returns a new AbaqusParser that shares the lexer and
+            parser tables of this one, which are never modified, but
+            none of its state during a parse. A parser must not run
+            two parses at once; clones of it can, e.g. one per
+            thread, and cost far less to make than a new parser.
+        """
+        parser = copy.copy(self)
+        parser._errors = None
+        parser._stats = None
+        parser._filter = None
+        parser.clex = self.clex.clone(parser._lex_error_func)
+        parser.cparser = copy.copy(self.cparser)
+        parser.cparser.errorfunc = parser.p_error
+        parser.cparser.productions = [
+            self._rebind(production, parser) for production in self.cparser.productions]
+        return parser
+
+    def parse(self, text, filename='', debuglevel=0, arrays=False, fast=True,
+              lineno=1, lazy=False, errors=None, stats=None,
+              include_keywords=None, exclude_keywords=None):
         """ Parses Abaqus input files and returns an AST.
         
             text:
-                A string containing the Abaqus input file
+                A string containing the Abaqus input file, or a
+                buffer such as a bytearray or an mmap. Buffers are
+                scanned in place and copied block by block.
             
             filename:
                 Name of the file being parsed (for meaningful
@@ -120,15 +261,587 @@ class AbaqusParser(PLYParser):
             
             debuglevel:
                 Debug level to yacc
+
+            arrays:
+                If True, the data of *Node keywords is returned as
+                a (labels, coords) pair of NumPy arrays and the data
+                of *Element keywords as (labels, connectivity).
+                Requires numpy.
+
+            fast:
+                Split plainly formatted data lines with regexes
+                instead of running them token by token through
+                PLY. The result is the same either way; set to
+                False (or use a debuglevel) to force the PLY path.
+
+            lineno:
+                Line number of the first line of text, when text
+                is an excerpt of a larger file
+
+            lazy:
+                Parse only the keyword lines. The data of each
+                Keyword is kept as a span of text and split on first
+                access of Keyword.data, so errors in data lines are
+                raised then. Lazy parses bypass the cache.
+
+            errors:
+                A list. When given, ParseErrors are appended to it
+                instead of being raised, so one pass reports every
+                diagnostic: all lexer errors, and the first syntax
+                error of each keyword block. Blocks with syntax
+                errors are left out of the result. Parses collecting
+                errors bypass the cache.
+
+            stats:
+                An abaqus_stats.ParseStats. When given, it records
+                the time spent in each phase of the parse, counts of
+                keywords, lines and tokens per keyword name, and the
+                peak memory of the parse.
+
+            include_keywords, exclude_keywords:
+                Sequences of keyword names, e.g. ['Node', 'Element'].
+                Only the keyword blocks whose keyword is in
+                include_keywords, if given, and not in
+                exclude_keywords are parsed and returned. The others
+                are skipped by the block scanner without being
+                lexed, so errors in them are not reported. Filtered
+                parses bypass the cache.
         """
-        self.clex.filename = filename
-        self.clex.reset_lineno()
-        return self.cparser.parse(text, lexer=self.clex, debug=debuglevel)
-    
+        if include_keywords is not None or exclude_keywords is not None:
+            return self._filtering(KeywordFilter(include_keywords, exclude_keywords),
+                                   self.parse, text, filename, debuglevel, arrays,
+                                   fast, lineno, lazy, errors, stats)
+        if stats is not None:
+            return self._instrumented(stats, self.parse, text, filename, debuglevel,
+                                      arrays, fast, lineno, lazy, errors)
+        if errors is not None:
+            return self._collecting(errors, self.parse, text, filename, debuglevel,
+                                    arrays, fast, lineno, lazy)
+        if lazy and not debuglevel:
+            return list(self._parse_lazy(text, filename, lineno, arrays))
+        if (self.cache is not None and not debuglevel and self._errors is None
+                and self._filter is None):
+            key = self.cache.key(text_digest(text), filename, lineno, arrays)
+            return self._cached(key, self._parse_string,
+                                text, filename, 0, arrays, fast, lineno)
+        return self._parse_string(text, filename, debuglevel, arrays, fast, lineno)
+
+    def parse_file(self, path, filename=None, arrays=False, fast=True,
+                   includes=False, workers=1, errors=None, stats=None, lazy=False,
+                   include_keywords=None, exclude_keywords=None):
+        """ Parses the Abaqus input file at path.
+
+            The file is memory-mapped instead of read into a string,
+            so it is never copied as a whole: only the text of the
+            keyword block being parsed is materialized. Repeated
+            parses of the same file are served from the OS page
+            cache.
+
+            Compressed files (see abaqus_compress) are decompressed
+            chunk by chunk on a separate thread while the chunks
+            before are parsed.
+
+            filename:
+                Name of the file being parsed (for meaningful
+                error messages). Defaults to path.
+
+            arrays, fast:
+                As in parse.
+
+            includes:
+                Resolve *INCLUDE keywords: the keywords of the
+                included file, found relative to the including one,
+                replace the *INCLUDE keyword, recursively. Their
+                coord.file is the path of the included file.
+                Include cycles raise ParseError.
+
+            workers:
+                With includes, the number of processes that parse
+                included files concurrently.
+
+            errors:
+                As in parse. Errors in files parsed by worker
+                processes are still raised.
+
+            stats:
+                As in parse. Files parsed by worker processes are
+                not counted.
+
+            lazy:
+                As in parse. The file stays mapped until the last
+                Keyword referring to it is gone. Can't be combined
+                with includes.
+
+            include_keywords, exclude_keywords:
+                As in parse. With includes, *INCLUDE keywords are
+                always kept so that they can be resolved, and the
+                included files are filtered the same way.
+        """
+        if stats is not None:
+            return self._instrumented(stats, self.parse_file, path, filename, arrays,
+                                      fast, includes, workers, errors, None, lazy,
+                                      include_keywords, exclude_keywords)
+        if errors is not None:
+            return self._collecting(errors, self.parse_file, path, filename,
+                                    arrays, fast, includes, workers, None, None, lazy,
+                                    include_keywords, exclude_keywords)
+        if includes:
+            if lazy:
+                raise ValueError('lazy parses do not resolve includes')
+            import abaqus_include
+            return abaqus_include.parse_with_includes(
+                self, path, filename, arrays, fast, workers,
+                include_keywords, exclude_keywords)
+        if include_keywords is not None or exclude_keywords is not None:
+            return self._filtering(KeywordFilter(include_keywords, exclude_keywords),
+                                   self.parse_file, path, filename, arrays, fast,
+                                   False, workers, None, None, lazy)
+        if filename is None:
+            filename = path
+        if (self.cache is not None and self._errors is None and self._filter is None
+                and not lazy):
+            key = self.cache.key(file_digest(path), filename, 1, arrays)
+            return self._cached(key, self._parse_path, path, filename, arrays, fast)
+        return self._parse_path(path, filename, arrays, fast, lazy)
+
+    def iter_keywords(self, source, filename=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                      arrays=False, fast=True, prefetch=False,
+                      include_keywords=None, exclude_keywords=None):
+        """ Parses an Abaqus input file incrementally, yielding each
+            Keyword as soon as its data lines end.
+
+            source:
+                A path or a file object opened in binary mode. The
+                file is read chunk_size bytes at a time, so memory
+                stays bounded by the largest single keyword block.
+                Compressed files are decompressed as they are read
+                (see abaqus_compress).
+
+            filename:
+                Name of the file being parsed (for meaningful
+                error messages). Defaults to source when it is
+                a path.
+
+            arrays, fast:
+                As in parse.
+
+            prefetch:
+                Read, and decompress, up to a few chunks ahead on a
+                separate thread while the current one is parsed.
+
+            include_keywords, exclude_keywords:
+                As in parse.
+        """
+        import abaqus_compress
+        if hasattr(source, 'read'):
+            stream = source
+            close = False
+        else:
+            stream = abaqus_compress.open_deck(source)
+            close = True
+            if filename is None:
+                filename = source
+        reader = stream
+        try:
+            if prefetch:
+                reader = abaqus_compress.PrefetchReader(stream, chunk_size)
+            keep = None
+            if include_keywords is not None or exclude_keywords is not None:
+                keep = KeywordFilter(include_keywords, exclude_keywords)
+            blocks = iter_stream_blocks(reader, chunk_size, keep)
+            for keyword in self._parse_blocks(blocks, filename or '', fast, arrays):
+                yield keyword
+        finally:
+            if reader is not stream:
+                reader.close()
+            if close:
+                stream.close()
+
+    def feed_keywords(self, filename='', arrays=False, fast=True):
+        """ Returns an abaqus_feed.KeywordFeed, which parses input
+            pushed to it chunk by chunk, e.g. from an asyncio
+            StreamReader, and returns each Keyword as soon as its
+            data lines end.
+
+            arrays, fast:
+                As in parse.
+        """
+        import abaqus_feed
+        return abaqus_feed.KeywordFeed(self, filename, arrays, fast)
+
+    def parse_incremental(self, text, filename='', arrays=False, fast=True):
+        """ Parses text like parse, but returns an IncrementalParse
+            whose keywords attribute holds the Keywords. Its edit
+            method applies a text edit and re-parses only the keyword
+            blocks the edit touches, so small edits to large decks
+            are cheap.
+        """
+        import abaqus_incremental
+        return abaqus_incremental.IncrementalParse(self, text, filename, arrays, fast)
+
     ######################--   PRIVATE   --######################
     
+    def _parse_text(self, text, filename, lineno, debuglevel):
+        self.clex.filename = filename
+        self.clex.reset_lineno(lineno)
+        if self._stats is not None:
+            return self._parse_counted(text, debuglevel)
+        return self.cparser.parse(text, lexer=self.clex, debug=debuglevel)
+
+    def _parse_counted(self, text, debuglevel):
+        """ Parses text as _parse_text does, timing and counting the
+            tokens of the lexer separately from yacc.
+        """
+        stats = self._stats
+        lex_time = stats.phases['lex']
+        t1 = time.time()
+        try:
+            return self.cparser.parse(text, lexer=self.clex, debug=debuglevel,
+                                      tokenfunc=stats.token_func(self.clex))
+        finally:
+            # The lexer runs inside the parse
+            stats.add_time('yacc', time.time() - t1 - (stats.phases['lex'] - lex_time))
+
+    def _parse_string(self, text, filename, debuglevel, arrays, fast, lineno):
+        blockwise = fast or self._errors is not None or self._stats is not None
+        if self._filter is not None or (blockwise and not debuglevel):
+            nerrors = len(self._errors or ())
+            keywords = list(self._parse_blocks(
+                iter_blocks(text, lineno, self._filter), filename, fast, arrays))
+            if keywords or len(self._errors or ()) > nerrors or self._filtered():
+                return keywords
+            # Let yacc report the empty input
+        try:
+            keywords = self._parse_text(text_slice(text, 0, len(text)), filename, lineno, debuglevel)
+        except ParseError:
+            if self._errors is None:
+                raise
+            self._errors.append(sys.exc_info()[1])
+            return []
+        if arrays:
+            keywords = self._pack_arrays(keywords)
+        return keywords
+
+    def _parse_path(self, path, filename, arrays, fast, lazy=False):
+        import abaqus_compress
+        name = abaqus_compress.compression(path)
+        if name is None:
+            return self._parse_mapped(path, filename, arrays, fast, lazy)
+        return self._parse_compressed(path, name, filename, arrays, fast, lazy)
+
+    def _parse_compressed(self, path, name, filename, arrays, fast, lazy):
+        """ Parses a compressed file, decompressed on a separate
+            thread.
+        """
+        import abaqus_compress
+        nerrors = len(self._errors or ())
+        stream = abaqus_compress.open_compressed(path, name)
+        try:
+            reader = abaqus_compress.PrefetchReader(stream)
+            try:
+                if lazy:
+                    # The spans need the whole text
+                    text = ''.join(iter(reader.read, ''))
+                    return list(self._parse_lazy(text, filename, 1, arrays))
+                keywords = list(self._parse_blocks(
+                    iter_stream_blocks(reader, keep=self._filter), filename, fast, arrays))
+            finally:
+                reader.close()
+        finally:
+            stream.close()
+        if not keywords and len(self._errors or ()) == nerrors and not self._filtered():
+            # Let yacc report the empty input
+            return self._parse_string('', filename, 0, arrays, fast, 1)
+        return keywords
+
+    def _parse_mapped(self, path, filename, arrays, fast, lazy=False):
+        f = open(path, 'rb')
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                if lazy:
+                    return []
+                return self._parse_string('', filename, 0, arrays, fast, 1)
+            t1 = time.time()
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._stats is not None:
+                self._stats.add_time('io', time.time() - t1)
+        finally:
+            f.close()
+        if lazy:
+            # The spans of the keywords keep buf open
+            return list(self._parse_lazy(buf, filename, 1, arrays))
+        try:
+            return list(self._parse_blocks(
+                iter_blocks(buf, 1, self._filter), filename, fast, arrays))
+        finally:
+            buf.close()
+
+    @staticmethod
+    def _rebind(production, parser):
+        """ A copy of a yacc production whose grammar action is the
+            method of parser.
+        """
+        production = copy.copy(production)
+        if production.func:
+            production.callable = getattr(parser, production.func)
+        return production
+
+    def _instrumented(self, stats, func, *args):
+        """ Calls func with stats recording the parse.
+        """
+        stats.start()
+        self._stats = stats
+        try:
+            return func(*args)
+        finally:
+            self._stats = None
+            stats.finish()
+
+    def _timed(self, phase, func, *args):
+        """ Calls func, adding the time it takes to phase in the
+            current stats.
+        """
+        t1 = time.time()
+        try:
+            return func(*args)
+        finally:
+            self._stats.add_time(phase, time.time() - t1)
+
+    def _collecting(self, errors, func, *args):
+        """ Calls func with ParseErrors collected in errors.
+        """
+        self._errors = errors
+        try:
+            return func(*args)
+        finally:
+            self._errors = None
+
+    def _filtering(self, keep, func, *args):
+        """ Calls func with the keyword blocks of the parse
+            selected by keep, a KeywordFilter.
+        """
+        self._filter = keep
+        try:
+            return func(*args)
+        finally:
+            self._filter = None
+
+    def _filtered(self):
+        """ Whether the current parse skipped keyword blocks, so
+            that finding no keywords is not an empty input.
+        """
+        return self._filter is not None and self._filter.skipped > 0
+
+    def _cached(self, key, func, *args):
+        if self._stats is None:
+            keywords = self.cache.get(key)
+        else:
+            keywords = self._timed('cache', self.cache.get, key)
+        if keywords is None:
+            keywords = func(*args)
+            if self._stats is None:
+                self.cache.put(key, keywords)
+            else:
+                self._timed('cache', self.cache.put, key, keywords)
+        return keywords
+
+    def _parse_blocks(self, blocks, filename, fast, arrays):
+        """ Parses (lineno, block) pairs one at a time, yielding
+            their keywords. Packing arrays block by block keeps the
+            str form of only one block alive.
+        """
+        stats = self._stats
+        if stats is not None:
+            blocks = stats.timed_iter('scan', blocks)
+        blocks = iter(blocks)
+        pending = []
+        while True:
+            item = pending.pop() if pending else next(blocks, None)
+            if item is None:
+                break
+            lineno, block = item
+            if stats is not None:
+                tokens = stats.tokens
+            try:
+                if fast:
+                    keywords = self._parse_block(block, filename, lineno, arrays)
+                else:
+                    keywords = self._parse_text(block, filename, lineno, 0)
+            except ParseError:
+                error = sys.exc_info()[1]
+                if str(error).endswith(END_OF_INPUT):
+                    following = next(blocks, None)
+                    if following is not None:
+                        pending.append(following)
+                        error = self._keyword_error(error, following[1], 0, following[0])
+                if self._errors is None:
+                    raise error
+                self._errors.append(error)
+                continue
+            if stats is not None:
+                stats.add_block(keywords, count_lines(block, 0, len(block)),
+                                stats.tokens - tokens)
+            if arrays:
+                if stats is None:
+                    keywords = self._pack_arrays(keywords)
+                else:
+                    keywords = self._timed('arrays', self._pack_arrays, keywords)
+            for keyword in keywords:
+                yield keyword
+
+    def _parse_block(self, block, filename, lineno, arrays=False):
+        """ Parses one keyword block, taking the fast path for its
+            data lines when possible.
+        """
+        if arrays:
+            keywords = self._parse_packed(block, filename, lineno)
+            if keywords is not None:
+                return keywords
+        if self._stats is None:
+            split = split_block(block)
+        else:
+            split = self._timed('fastpath', split_block, block)
+        if split is None:
+            return self._parse_text(block, filename, lineno, 0)
+        header, offset, data = split
+        keywords = self._parse_header(header, filename, lineno + offset)
+        keywords[0].data = data
+        return keywords
+
+    def _parse_header(self, header, filename, lineno):
+        """ Parses the keyword line(s) of a block, without PLY if
+            they are a single plain line.
+        """
+        if self._stats is None:
+            split = split_header(header)
+        else:
+            split = self._timed('fastpath', split_header, header)
+        if split is None:
+            return self._parse_text(header, filename, lineno, 0)
+        return [self._keyword(split, filename, lineno)]
+
+    def _parse_packed(self, block, filename, lineno):
+        """ Parses a plain *Node or *Element block straight into
+            packed arrays, without splitting its data lines into
+            value strings. Returns None for other blocks.
+        """
+        import abaqus_arrays
+        stop = header_end(block, 0, len(block))
+        split = split_header(block[:stop])
+        if split is None:
+            return None
+        name = abaqus_arrays.keyword_name(split[0])
+        if name not in abaqus_arrays.NODE_KEYWORDS + abaqus_arrays.ELEMENT_KEYWORDS:
+            return None
+        if self._stats is None:
+            data = abaqus_arrays.pack_text(name, block, stop)
+        else:
+            data = self._timed('arrays', abaqus_arrays.pack_text, name, block, stop)
+        if data is None:
+            return None
+        keyword = self._keyword(split, filename, lineno)
+        keyword.data = data
+        return [keyword]
+
+    @staticmethod
+    def _keyword(split, filename, lineno):
+        """ The Keyword of a keyword line split by split_header.
+        """
+        keyword, params = split
+        if params is not None:
+            params = [Parameter(name, value or None) for name, value in params]
+        return Keyword(keyword, params, coord=Coord(filename, lineno))
+
+    def _parse_lazy(self, text, filename, lineno, arrays):
+        """ Parses the keyword lines of every block of text and
+            leaves the data lines as spans.
+        """
+        def loader(kw, text, start, end, lineno):
+            return self._load_data(kw, text, start, end, lineno, filename, arrays)
+
+        stats = self._stats
+        spans = iter_block_spans(text, lineno, self._filter)
+        if stats is not None:
+            spans = stats.timed_iter('scan', spans)
+        spans = iter(spans)
+        pending = []
+        while True:
+            span = pending.pop() if pending else next(spans, None)
+            if span is None:
+                break
+            block_lineno, start, end = span
+            stop = header_end(text, start, end)
+            header = text_slice(text, start, stop)
+            if stats is not None:
+                tokens = stats.tokens
+            try:
+                keywords = self._parse_header(header, filename, block_lineno)
+            except ParseError:
+                error = sys.exc_info()[1]
+                if str(error).endswith(END_OF_INPUT):
+                    following = next(spans, None)
+                    if following is not None:
+                        pending.append(following)
+                        error = self._keyword_error(error, text, following[1], following[0])
+                if self._errors is None:
+                    raise error
+                self._errors.append(error)
+                continue
+            if stats is not None:
+                stats.add_block(keywords, count_lines(text, start, end),
+                                stats.tokens - tokens)
+            if stop < end:
+                keywords[-1].set_span(
+                    text, stop, end, block_lineno + header.count('\n'), loader)
+            elif arrays:
+                # Like eager parses, give *Node and *Element without
+                # data lines empty arrays
+                keywords = self._pack_arrays(keywords)
+            for keyword in keywords:
+                yield keyword
+
+    def _keyword_error(self, error, text, start, lineno):
+        """ The error of a block that ended in the middle of its
+            keyword, e.g. after a trailing comma, as a parse of the
+            whole text reports it: at the KEYWORD token of the
+            keyword line text[start:] on line lineno.
+        """
+        m = KEYWORD_TOKEN.match(text, start)
+        if m is None:
+            return error
+        return ParseError('%s: before: %s' % (self._coord(lineno), m.group(1)[1:]))
+
+    def _load_data(self, kw, text, start, end, lineno, filename, arrays):
+        """ Splits the data lines text[start:end] of a lazy Keyword.
+        """
+        lines = text_slice(text, start, end)
+        if arrays:
+            import abaqus_arrays
+            data = abaqus_arrays.pack_text(abaqus_arrays.keyword_name(kw.keyword), lines)
+            if data is not None:
+                return data
+        data = split_data(lines)
+        if data is None:
+            # Let PLY split (or reject) them under a stand-in keyword line
+            data = self._parse_text('*data\n' + lines, filename, lineno - 1, 0)[0].data
+        data = data or None
+        if arrays:
+            import abaqus_arrays
+            data = abaqus_arrays.pack_data(abaqus_arrays.keyword_name(kw.keyword), data)
+        return data
+
+    def _pack_arrays(self, keywords):
+        import abaqus_arrays
+        for kw in keywords:
+            abaqus_arrays.pack_keyword(kw)
+        return keywords
 
     def _lex_error_func(self, msg, line, column):
+        if self._errors is not None:
+            # Keep lexing; the lexer skips the offending character
+            self._errors.append(ParseError("%s: %s" % (self._coord(line, column), msg)))
+            return
         self._parse_error(msg, self._coord(line, column))
     
     ##
@@ -139,7 +852,7 @@ class AbaqusParser(PLYParser):
         '''
         keyword_list : keyword_list keyword
         '''
-        p[0] = p[1] + [p[2]]
+        p[0] = list_append(p[1], p[2])
 
     def p_keyword(self, p):
         '''
@@ -154,25 +867,26 @@ class AbaqusParser(PLYParser):
                 | KEYWORD COMMA param_list
                 | KEYWORD COMMA param_list data_lines
         '''
+        coord = self._coord(p.lineno(1))
         if len(p) == 2:
             # KEYWORD
-            p[0] = Keyword(p[1])
+            p[0] = Keyword(p[1], coord = coord)
         elif len(p) == 3:
             # KEYWORD data_list
-            p[0] = Keyword(p[1], data = p[2])
+            p[0] = Keyword(p[1], data = p[2], coord = coord)
         elif len(p) == 4:
             # KEYWORD COMMA param_list
-            p[0] = Keyword(p[1], params = p[3])
+            p[0] = Keyword(p[1], params = p[3], coord = coord)
         elif len(p) == 5:
             # KEYWORD COMMA param_list data_list
-            p[0] = Keyword(p[1], params = p[3], data = p[4])
+            p[0] = Keyword(p[1], params = p[3], data = p[4], coord = coord)
         else:
             # Error?
             pass
 
     def p_param_list(self, p):
         '''param_list : param_list COMMA param'''
-        p[0] = p[1] + [p[3]]
+        p[0] = list_append(p[1], p[3])
 
     def p_param(self, p):
         '''param_list : param'''
@@ -216,9 +930,9 @@ class AbaqusParser(PLYParser):
                   | data_list data
         '''
         if len(p) == 3:
-            p[0] = p[1] + [p[2]]
+            p[0] = list_append(p[1], p[2])
         elif len(p) == 4:
-            p[0] = p[1] + [p[3]]
+            p[0] = list_append(p[1], p[3])
 
     def p_data(self, p):
         '''
@@ -240,7 +954,7 @@ class AbaqusParser(PLYParser):
                 'before: %s' % p.value, 
                 self._coord(p.lineno))
         else:
-            self._parse_error('At end of input', '')
+            self._parse_error(END_OF_INPUT, self._coord(self.clex.lexer.lineno))
 
 
 if __name__ == "__main__":
@@ -248,7 +962,7 @@ if __name__ == "__main__":
     import time, sys
     
     t1 = time.time()
-    parser = AbaqusParser(lex_optimize=False, yacc_debug=True, yacc_optimize=False)
+    parser = AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
     print(time.time() - t1)
     
     buf = ''' 
@@ -0,0 +1,80 @@
+#-----------------------------------------------------------------
+# abaqus_pool.py
+#
+# Sharing one parser configuration between threads. An
+# AbaqusParser keeps its lexer position and parse stacks on the
+# instance, so it can run only one parse at a time; ParserPool
+# hands every concurrent caller its own clone (see
+# AbaqusParser.clone) and reuses the clones afterwards.
+#-----------------------------------------------------------------
+import threading
+from contextlib import contextmanager
+
+from abaqus_parser import AbaqusParser
+
+
+class ParserPool(object):
+    """ A pool of AbaqusParsers for concurrent callers, e.g. the
+        threads of a server.
+
+            pool = ParserPool()
+            keywords = pool.parse(text, 'upload.inp')
+
+            with pool.parser() as parser:
+                for kw in parser.iter_keywords(stream):
+                    ...
+
+        The parsers are clones of parser, or of an AbaqusParser
+        built with options; parser itself is never handed out. The
+        pool grows to the number of callers it serves at once and
+        keeps at most max_idle parsers between calls.
+    """
+    def __init__(self, parser=None, max_idle=None, **options):
+        if parser is None:
+            parser = AbaqusParser(**options)
+        elif options:
+            raise TypeError('options are for a new parser only')
+        self.prototype = parser
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ Takes a parser from the pool; give it back with
+            release.
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.prototype.clone()
+
+    def release(self, parser):
+        with self._lock:
+            if self.max_idle is None or len(self._idle) < self.max_idle:
+                self._idle.append(parser)
+
+    @contextmanager
+    def parser(self):
+        """ Context manager lending a parser for the with block.
+            Iterators and lazy Keywords from the parser use it, so
+            finish with them inside the block.
+        """
+        parser = self.acquire()
+        try:
+            yield parser
+        finally:
+            self.release(parser)
+
+    def parse(self, text, *args, **kwargs):
+        """ AbaqusParser.parse on a parser of the pool. For lazy
+            parses use parser() instead, as the data of lazy
+            Keywords is split by their parser.
+        """
+        with self.parser() as parser:
+            return parser.parse(text, *args, **kwargs)
+
+    def parse_file(self, path, *args, **kwargs):
+        """ AbaqusParser.parse_file on a parser of the pool.
+        """
+        with self.parser() as parser:
+            return parser.parse_file(path, *args, **kwargs)
@@ -0,0 +1,189 @@
+#-----------------------------------------------------------------
+# abaqus_scanner.py
+#
+# Splits Abaqus input into keyword blocks without lexing it. A
+# block runs from the start of a keyword line (a line starting with
+# '*' but not '**') up to the start of the next keyword line, so
+# each block can be handed to the parser on its own.
+#-----------------------------------------------------------------
+import re
+
+# Start of a keyword line; '**' comment lines are not boundaries
+KEYWORD_LINE = re.compile(r'^[ \t]*\*(?!\*)', re.MULTILINE)
+# The same, found from the newline in front. Without the '^' the
+# regex engine can skip ahead to the next newline, which makes
+# scanning several times faster.
+NEWLINE_KEYWORD = re.compile(r'\n[ \t]*\*(?!\*)')
+# Name of the first keyword in a block, up to its first comma
+KEYWORD_NAME = re.compile(r'^[ \t]*\*(?!\*)([^,\n]*)', re.MULTILINE)
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def count_lines(text, begin, end):
+    """ Number of newlines in text[begin:end]. text may also be an
+        mmap, which has no count method.
+    """
+    if hasattr(text, 'count'):
+        return text.count('\n', begin, end)
+    return text[begin:end].count('\n')
+
+
+def text_slice(text, begin, end):
+    """ text[begin:end] as a string. Slices of buffers such as a
+        bytearray are converted to str; str and unicode text is
+        sliced as is.
+    """
+    piece = text[begin:end]
+    if isinstance(piece, basestring):
+        return piece
+    return bytes(piece)
+
+
+def keyword_starts(text, begin=0, end=None):
+    """ Yields the offsets of the keyword lines that start in
+        text[begin:end]. begin must be at the start of a line.
+    """
+    if end is None:
+        end = len(text)
+    if KEYWORD_LINE.match(text, begin, end):
+        yield begin
+    for m in NEWLINE_KEYWORD.finditer(text, begin, end):
+        yield m.start() + 1
+
+
+class KeywordFilter(object):
+    """ Selects keyword blocks by the name of their keyword, read
+        from the keyword line with a regex, so that unwanted blocks
+        can be skipped before they are copied or lexed.
+
+        include and exclude are sequences of keyword names, e.g.
+        ['Node', '*Element'], compared case- and blank-insensitively.
+        A block is kept if its name is in include (when given) and
+        not in exclude. Blocks without a keyword line are kept, for
+        the parser to report. skipped counts the blocks rejected.
+    """
+    def __init__(self, include=None, exclude=None):
+        self.include = self._names(include) if include is not None else None
+        self.exclude = self._names(exclude or ())
+        self.skipped = 0
+
+    @staticmethod
+    def _names(names):
+        if isinstance(names, basestring):
+            names = [names]
+        return frozenset(' '.join(name.lstrip('*').lower().split()) for name in names)
+
+    def __call__(self, text, begin=0, end=None):
+        """ Whether to keep the block text[begin:end].
+        """
+        if end is None:
+            end = len(text)
+        m = KEYWORD_NAME.search(text, begin, end)
+        if m is None:
+            return True
+        name = ' '.join(m.group(1).lower().split())
+        if name in self.exclude or (self.include is not None and name not in self.include):
+            self.skipped += 1
+            return False
+        return True
+
+
+def iter_block_spans(text, lineno=1, keep=None):
+    """ Yields (lineno, start, end) for every keyword block in text,
+        where text[start:end] is the block.
+
+        Anything before the first keyword line (blank lines,
+        comments) is kept at the front of the first block, so the
+        blocks cover all of text. lineno is the line number of the
+        first line of each block.
+
+        keep, e.g. a KeywordFilter, is called with (text, start,
+        end) and leaves out the blocks for which it returns False.
+    """
+    starts = list(keyword_starts(text))
+    if not starts:
+        starts = [0]
+    else:
+        # Leading comments stay with the first block
+        starts[0] = 0
+    starts.append(len(text))
+    for begin, end in zip(starts[:-1], starts[1:]):
+        if begin < end:
+            if keep is None or keep(text, begin, end):
+                yield lineno, begin, end
+            lineno += count_lines(text, begin, end)
+
+
+def iter_blocks(text, lineno=1, keep=None):
+    """ Yields (lineno, block) for every keyword block in text, as
+        iter_block_spans does; joining the blocks gives back text.
+        text may be any buffer, e.g. a bytearray or an mmap; the
+        blocks are strings, copied one at a time: str for buffers,
+        and slices of text if it is str or unicode.
+    """
+    for lineno, begin, end in iter_block_spans(text, lineno, keep):
+        yield lineno, text_slice(text, begin, end)
+
+
+class BlockSplitter(object):
+    """ Splits input pushed to it chunk by chunk into keyword
+        blocks, for callers that receive the input rather than read
+        it, e.g. from an event loop. feed returns the (lineno, block)
+        pairs completed by a chunk; close returns the last one.
+        Only the current block is held in memory.
+    """
+    def __init__(self):
+        self.lineno = 1
+        self._parts = []        # complete lines of the current block
+        self._tail = ''         # trailing partial line
+        self._seen_keyword = False
+
+    def feed(self, chunk):
+        text = self._tail + chunk
+        end = text.rfind('\n') + 1
+        self._tail = text[end:]
+        blocks = []
+        pos = 0
+        for start in keyword_starts(text, 0, end):
+            if not self._seen_keyword:
+                # Leading comments stay with the first block
+                self._seen_keyword = True
+                continue
+            self._parts.append(text[pos:start])
+            pos = start
+            self._flush(blocks)
+        self._parts.append(text[pos:end])
+        return blocks
+
+    def close(self):
+        self._parts.append(self._tail)
+        self._tail = ''
+        blocks = []
+        self._flush(blocks)
+        return blocks
+
+    def _flush(self, blocks):
+        block = ''.join(self._parts)
+        self._parts = []
+        if block:
+            blocks.append((self.lineno, block))
+            self.lineno += block.count('\n')
+
+
+def iter_stream_blocks(stream, chunk_size=DEFAULT_CHUNK_SIZE, keep=None):
+    """ Like iter_blocks, but reads stream chunk_size bytes at a
+        time and yields each block as soon as the next keyword line
+        has been seen. Only the current block is held in memory.
+    """
+    splitter = BlockSplitter()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        for lineno, block in splitter.feed(chunk):
+            if keep is None or keep(block):
+                yield lineno, block
+    for lineno, block in splitter.close():
+        if keep is None or keep(block):
+            yield lineno, block
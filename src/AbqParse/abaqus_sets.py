@@ -0,0 +1,161 @@
+#-----------------------------------------------------------------
+# abaqus_sets.py
+#
+# Resolution of *NSET and *ELSET definitions into sorted int64
+# label arrays. Labels are converted and 'generate' ranges expanded
+# with whole-array NumPy operations; references to other sets are
+# resolved on first use and memoized.
+#-----------------------------------------------------------------
+import numpy
+
+from abaqus_arrays import keyword_name, keyword_param
+
+NSET_KEYWORDS = ('nset',)
+ELSET_KEYWORDS = ('elset',)
+
+EMPTY = numpy.zeros(0, dtype=numpy.int64)
+
+
+def union(*sets):
+    """ Sorted unique labels in any of sets.
+    """
+    sets = [s for s in sets if len(s)]
+    if not sets:
+        return EMPTY
+    return numpy.unique(numpy.concatenate(sets))
+
+
+def intersection(*sets):
+    """ Sorted unique labels in all of sets, which must be sorted
+        and unique themselves.
+    """
+    result = sets[0]
+    for s in sets[1:]:
+        result = numpy.intersect1d(result, s, assume_unique=True)
+    return result
+
+
+def difference(a, b):
+    """ Labels of the sorted unique set a that are not in b.
+    """
+    return numpy.setdiff1d(a, b, assume_unique=True)
+
+
+def generate_labels(data):
+    """ Labels of 'generate' data lines: first, last[, increment]
+        on each line, as in *ELSET, GENERATE.
+    """
+    if not data:
+        return EMPTY
+    table = numpy.ones((len(data), 3), dtype=numpy.int64)
+    widths = set(len(line) for line in data)
+    if widths == set([3]):
+        table[:] = numpy.array(data, dtype=numpy.int64)
+    else:
+        for row, line in enumerate(data):
+            if not 2 <= len(line) <= 3:
+                raise ValueError('generate line needs first, last[, increment]: %s' % (line,))
+            table[row, :len(line)] = [int(value) for value in line]
+    first, last, step = table[:, 0], table[:, 1], table[:, 2]
+    if (step <= 0).any() or (last < first).any():
+        raise ValueError('invalid generate range')
+    counts = (last - first) // step + 1
+    # Position of every label within its range, without a Python
+    # loop over the ranges
+    offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    return numpy.repeat(first, counts) + offsets * numpy.repeat(step, counts)
+
+
+def split_set_data(data):
+    """ Splits plain *NSET/*ELSET data lines into (labels, names):
+        an int64 array of the labels and a list of the names of
+        other sets, lower case.
+    """
+    values = [value for line in data or [] for value in line]
+    try:
+        return numpy.array(values, dtype=numpy.int64), []
+    except ValueError:
+        pass
+    labels = []
+    names = []
+    for value in values:
+        value = value.strip()
+        if value.isdigit():
+            labels.append(int(value))
+        else:
+            names.append(value.lower())
+    return numpy.array(labels, dtype=numpy.int64), names
+
+
+class SetTable(object):
+    """ The sets of one kind (node sets or element sets) of a deck,
+        by lower case name.
+
+        Definitions are added with add_labels, add_data and
+        add_keyword; a set defined more than once is the union of
+        its definitions. table[name] returns the sorted unique
+        labels of the set, resolving references to other sets the
+        first time and then from memory.
+    """
+    def __init__(self, kind):
+        self.kind = kind
+        self._labels = {}       # name -> list of label arrays
+        self._references = {}   # name -> list of set names
+        self._resolved = {}
+
+    def add_labels(self, name, labels):
+        name = name.lower()
+        self._labels.setdefault(name, []).append(labels)
+        self._references.setdefault(name, [])
+        self._resolved.clear()
+
+    def add_data(self, name, data, generate=False):
+        """ Adds the data lines of a set definition.
+        """
+        if generate:
+            labels, names = generate_labels(data), []
+        else:
+            labels, names = split_set_data(data)
+        self.add_labels(name, labels)
+        self._references[name.lower()].extend(names)
+
+    def add_keyword(self, kw):
+        """ Adds the definition of a *NSET or *ELSET Keyword.
+        """
+        name = keyword_param(kw, self.kind)
+        if not name:
+            raise ValueError('%s: *%s without %s parameter' % (kw.coord, kw.keyword, self.kind))
+        self.add_data(name, kw.data, 'generate' in [keyword_name(param.name)
+                                                    for param in kw.params or []])
+
+    def __contains__(self, name):
+        return name.lower() in self._labels
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def keys(self):
+        return list(self._labels)
+
+    def __getitem__(self, name):
+        return self.resolve(name.lower())
+
+    def resolve(self, name, chain=()):
+        labels = self._resolved.get(name)
+        if labels is not None:
+            return labels
+        if name not in self._labels:
+            raise KeyError('%s %s not found' % (self.kind, name))
+        if name in chain:
+            raise ValueError('%s %s refers to itself through %s' % (
+                self.kind, name, ' -> '.join(chain)))
+        chain = chain + (name,)
+        parts = list(self._labels[name])
+        for reference in self._references[name]:
+            parts.append(self.resolve(reference, chain))
+        labels = union(*parts)
+        self._resolved[name] = labels
+        return labels
@@ -0,0 +1,185 @@
+#-----------------------------------------------------------------
+# abaqus_stats.py
+#
+# Optional instrumentation of AbaqusParser. Pass a ParseStats as
+# stats= to parse or parse_file to find out where a slow parse
+# spends its time. Without it the parser only pays for a few
+# 'is None' checks per keyword block.
+#-----------------------------------------------------------------
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from abaqus_arrays import keyword_name
+
+# Phases of a parse, in pipeline order:
+#   io        opening and memory-mapping files
+#   cache     looking up and storing results in a ParseCache
+#   scan      splitting the text into keyword blocks
+#   fastpath  splitting data lines with regexes
+#   lex       AbaqusLexer, for text that goes through PLY
+#   yacc      LALR parsing and Keyword construction, less lex
+#   arrays    packing *Node and *Element data into arrays
+PHASES = ('io', 'cache', 'scan', 'fastpath', 'lex', 'yacc', 'arrays')
+
+
+def peak_rss():
+    """ Peak resident set size of the process in bytes, or 0 where
+        the resource module is missing.
+    """
+    if resource is None:
+        return 0
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class KeywordStats(object):
+    """ Totals for one keyword name: number of keywords, lines of
+        their blocks, and tokens that went through the lexer (the
+        fast path splits data lines without tokens).
+    """
+    __slots__ = ('count', 'lines', 'tokens')
+
+    def __init__(self):
+        self.count = 0
+        self.lines = 0
+        self.tokens = 0
+
+    def as_dict(self):
+        return dict(count=self.count, lines=self.lines, tokens=self.tokens)
+
+
+class ParseStats(object):
+    """ Statistics of the parses it was passed to.
+
+        phases maps the names in PHASES to seconds, keywords maps
+        normalized keyword names to KeywordStats. elapsed is the
+        wall time of the parses, and peak_memory how far they
+        raised the peak memory of the process, in bytes: the
+        tracemalloc peak if tracemalloc is tracing, else the peak
+        RSS. Statistics add up over parses; call reset to start
+        over.
+
+        callback, if given, is called with the ParseStats at the
+        end of every parse, e.g. to export it to a metrics system.
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+        self.keywords = {}
+        self.elapsed = 0.0
+        self.peak_memory = 0
+        self.tokens = 0
+        self._start = None
+
+    @property
+    def lines(self):
+        return sum(stats.lines for stats in self.keywords.values())
+
+    def add_time(self, phase, seconds):
+        self.phases[phase] += seconds
+
+    def add_block(self, keywords, lines, tokens):
+        """ Counts the keywords parsed from one block of the given
+            number of lines and lexer tokens.
+        """
+        for i, kw in enumerate(keywords):
+            name = keyword_name(kw.keyword)
+            stats = self.keywords.get(name)
+            if stats is None:
+                stats = self.keywords[name] = KeywordStats()
+            stats.count += 1
+            if i == 0:
+                stats.lines += lines
+                stats.tokens += tokens
+
+    def timed_iter(self, phase, iterable):
+        """ Yields the items of iterable, timing the production of
+            each item as phase.
+        """
+        it = iter(iterable)
+        while True:
+            t1 = time.time()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.phases[phase] += time.time() - t1
+                return
+            self.phases[phase] += time.time() - t1
+            yield item
+
+    def token_func(self, lexer):
+        """ A tokenfunc for yacc that times and counts the tokens of
+            lexer.
+        """
+        phases = self.phases
+
+        def token():
+            t1 = time.time()
+            tok = lexer.token()
+            phases['lex'] += time.time() - t1
+            if tok is not None:
+                self.tokens += 1
+            return tok
+        return token
+
+    def start(self):
+        self._start = (time.time(), self._memory())
+
+    def finish(self):
+        start_time, start_memory = self._start
+        self.elapsed += time.time() - start_time
+        self.peak_memory = max(self.peak_memory, self._peak_memory() - start_memory)
+        self._start = None
+        if self.callback is not None:
+            self.callback(self)
+
+    def as_dict(self):
+        """ The statistics as plain dicts and numbers.
+        """
+        return dict(
+            phases=dict(self.phases),
+            keywords=dict((name, stats.as_dict())
+                          for name, stats in self.keywords.items()),
+            elapsed=self.elapsed,
+            peak_memory=self.peak_memory,
+            tokens=self.tokens,
+            lines=self.lines)
+
+    def __str__(self):
+        lines = ['%-10s %10s' % ('phase', 'seconds')]
+        for phase in PHASES:
+            lines.append('%-10s %10.4f' % (phase, self.phases[phase]))
+        lines.append('%-10s %10.4f' % ('total', self.elapsed))
+        lines.append('')
+        lines.append('%-24s %8s %10s %10s' % ('keyword', 'count', 'lines', 'tokens'))
+        for name in sorted(self.keywords):
+            stats = self.keywords[name]
+            lines.append('%-24s %8d %10d %10d' % (name, stats.count, stats.lines, stats.tokens))
+        lines.append('')
+        lines.append('peak memory: %.1f MB' % (self.peak_memory / 1048576.0))
+        return '\n'.join(lines)
+
+    def _tracing(self):
+        return tracemalloc is not None and tracemalloc.is_tracing()
+
+    def _memory(self):
+        if self._tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return peak_rss()
+
+    def _peak_memory(self):
+        if self._tracing():
+            return tracemalloc.get_traced_memory()[1]
+        return peak_rss()
@@ -0,0 +1,248 @@
+#-----------------------------------------------------------------
+# abaqus_store.py
+#
+# Binary columnar storage of parsed decks, as a directory of NumPy
+# .npy files: all *Node data in one label vector and one coordinate
+# matrix, *Element data in one pair of arrays per element type,
+# integer *Nset/*Elset data as one int64 vector, and the data lines
+# of other keywords as one vector of byte strings. A JSON manifest
+# holds the keyword lines and where each keyword's data lies in the
+# arrays. Loading memory-maps the arrays, so it reads little more
+# than the manifest; data is paged in as it is used.
+#-----------------------------------------------------------------
+import json
+import os
+import re
+
+import numpy
+
+from abaqus_arrays import NODE_KEYWORDS, ELEMENT_KEYWORDS, keyword_name, keyword_param
+from abaqus_parser import Keyword, Parameter
+from abaqus_sets import NSET_KEYWORDS, ELSET_KEYWORDS
+from plyparser import Coord
+
+STORE_VERSION = 1
+
+MANIFEST = 'manifest.json'
+
+# Value and width arrays of the two kinds of stored data lines
+LINE_ARRAYS = {
+    'sets': ('set_labels', 'set_widths'),
+    'records': ('record_values', 'record_widths'),
+}
+
+
+def _text(s):
+    # JSON holds unicode; keyword text is bytes, of any encoding
+    return s.decode('latin-1') if s is not None else None
+
+
+def _native(s):
+    return s.encode('latin-1') if s is not None else None
+
+
+def _group(kw, connectivity):
+    """ Name of the element table of kw: its type and number of
+        nodes, e.g. 'cax4_4'.
+    """
+    etype = re.sub(r'[^0-9a-z_]', '_', (keyword_param(kw, 'type') or '').lower())
+    return '%s_%d' % (etype, connectivity.shape[1])
+
+
+def _set_labels(name, data):
+    """ The labels of *Nset/*Elset data lines as an int64 vector, if
+        they are plain labels that print back the same; else None.
+    """
+    if name not in NSET_KEYWORDS + ELSET_KEYWORDS:
+        return None
+    values = [value for line in data for value in line]
+    try:
+        labels = numpy.array(values, dtype=numpy.int64)
+    except ValueError:
+        return None
+    if [str(label) for label in labels.tolist()] != values:
+        return None
+    return labels
+
+
+class _Lines(object):
+    """ Data lines of varying width stored as a value vector and
+        the width of every line.
+    """
+    def __init__(self, values=None, widths=None):
+        self.values = [] if values is None else values
+        self.widths = [] if widths is None else widths
+        self.offsets = None
+
+    def __len__(self):
+        return len(self.widths)
+
+    def add(self, data, values):
+        start = len(self.widths)
+        self.values.append(values)
+        self.widths.extend(len(line) for line in data)
+        return start, len(self.widths)
+
+    def lines(self, start, end, convert):
+        """ The data lines start:end, with values converted by
+            convert.
+        """
+        if self.offsets is None:
+            self.offsets = numpy.concatenate([[0], numpy.cumsum(self.widths)])
+        values = convert(self.values[self.offsets[start]:self.offsets[end]])
+        data = []
+        pos = 0
+        for width in self.widths[start:end].tolist():
+            data.append(values[pos:pos + width])
+            pos += width
+        return data
+
+
+def _save_array(directory, name, array):
+    numpy.save(os.path.join(directory, name + '.npy'), array)
+
+
+def _load_array(directory, name, mmap):
+    return numpy.load(os.path.join(directory, name + '.npy'),
+                      mmap_mode='r' if mmap else None)
+
+
+def save(keywords, directory):
+    """ Stores keywords, e.g. from AbaqusParser.parse_file, in
+        directory, which is created if needed. *Node and *Element
+        data go to the node and element tables if they were packed
+        into arrays (parse with arrays=True), else to the records
+        of data lines like other keywords.
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    nodes = []          # (labels, coords) of every *Node
+    node_rows = 0
+    groups = {}         # element table -> [(labels, connectivity)]
+    group_rows = {}
+    sets = _Lines()
+    records = _Lines()
+    entries = []
+    for kw in keywords:
+        data = kw.data
+        name = keyword_name(kw.keyword)
+        if data is None:
+            where = None
+        elif isinstance(data, tuple) and name in NODE_KEYWORDS:
+            labels, coords = data
+            where = ['nodes', node_rows, node_rows + len(labels), coords.shape[1]]
+            nodes.append(data)
+            node_rows += len(labels)
+        elif isinstance(data, tuple) and name in ELEMENT_KEYWORDS:
+            group = _group(kw, data[1])
+            start = group_rows.get(group, 0)
+            where = ['elements', group, start, start + len(data[0])]
+            groups.setdefault(group, []).append(data)
+            group_rows[group] = where[3]
+        else:
+            labels = _set_labels(name, data)
+            if labels is not None:
+                where = ['sets'] + list(sets.add(data, labels))
+            else:
+                values = [value for line in data for value in line]
+                where = ['records'] + list(records.add(data, values))
+        params = kw.params
+        if params is not None:
+            params = [[_text(param.name), _text(param.value)] for param in params]
+        coord = kw.coord
+        if coord is not None:
+            coord = [_text(coord.file), coord.line, coord.column]
+        entries.append([_text(kw.keyword), params, coord, where])
+
+    if nodes:
+        ncols = max(coords.shape[1] for labels, coords in nodes)
+        table = numpy.zeros((node_rows, ncols), dtype=numpy.float64)
+        row = 0
+        for labels, coords in nodes:
+            table[row:row + len(labels), :coords.shape[1]] = coords
+            row += len(labels)
+        _save_array(directory, 'node_labels',
+                    numpy.concatenate([labels for labels, coords in nodes]))
+        _save_array(directory, 'node_coords', table)
+    for group, blocks in groups.items():
+        _save_array(directory, 'element_%s_labels' % group,
+                    numpy.concatenate([labels for labels, connectivity in blocks]))
+        _save_array(directory, 'element_%s_connectivity' % group,
+                    numpy.concatenate([connectivity for labels, connectivity in blocks]))
+    if len(sets):
+        values, widths = LINE_ARRAYS['sets']
+        _save_array(directory, values, numpy.concatenate(sets.values))
+        _save_array(directory, widths, numpy.array(sets.widths, dtype=numpy.int64))
+    if len(records):
+        values, widths = LINE_ARRAYS['records']
+        _save_array(directory, values, numpy.array(
+            [value for part in records.values for value in part], dtype=numpy.string_))
+        _save_array(directory, widths, numpy.array(records.widths, dtype=numpy.int64))
+
+    f = open(os.path.join(directory, MANIFEST), 'wb')
+    try:
+        json.dump({'version': STORE_VERSION, 'keywords': entries}, f)
+    finally:
+        f.close()
+
+
+def load(directory, mmap=True):
+    """ Returns the keywords stored in directory by save, equal to
+        the ones saved. With mmap, the arrays are memory-mapped
+        read-only, and the data of node and element keywords are
+        views of them; the data lines of other keywords are rebuilt
+        when first accessed.
+    """
+    f = open(os.path.join(directory, MANIFEST), 'rb')
+    try:
+        state = json.load(f)
+    finally:
+        f.close()
+    if state.get('version') != STORE_VERSION:
+        raise ValueError('%s: unsupported store version %s' % (directory, state.get('version')))
+
+    arrays = {}
+    def array(name):
+        if name not in arrays:
+            arrays[name] = _load_array(directory, name, mmap)
+        return arrays[name]
+
+    stores = {}
+    def lines(kind):
+        if kind not in stores:
+            values, widths = LINE_ARRAYS[kind]
+            stores[kind] = _Lines(array(values), array(widths))
+        return stores[kind]
+
+    def load_sets(kw, store, start, end, lineno):
+        return store.lines(start, end, lambda values: [str(value) for value in values.tolist()])
+
+    def load_records(kw, store, start, end, lineno):
+        return store.lines(start, end, lambda values: values.tolist())
+
+    keywords = []
+    for keyword, params, coord, where in state['keywords']:
+        if params is not None:
+            params = [Parameter(_native(name), _native(value)) for name, value in params]
+        if coord is not None:
+            coord = Coord(_native(coord[0]), coord[1], coord[2])
+        kw = Keyword(_native(keyword), params, coord=coord)
+        if where is None:
+            pass
+        elif where[0] == 'nodes':
+            kind, start, end, ncols = where
+            kw.data = (array('node_labels')[start:end],
+                       array('node_coords')[start:end, :ncols])
+        elif where[0] == 'elements':
+            kind, group, start, end = where
+            kw.data = (array('element_%s_labels' % group)[start:end],
+                       array('element_%s_connectivity' % group)[start:end])
+        else:
+            kind, start, end = where
+            if start == end:
+                kw.data = []
+            else:
+                loader = load_sets if kind == 'sets' else load_records
+                kw.set_span(lines(kind), start, end, None, loader)
+        keywords.append(kw)
+    return keywords
@@ -0,0 +1,134 @@
+#-----------------------------------------------------------------
+# abaqus_writer.py
+#
+# Writes Keyword objects back out as Abaqus input text. Data lines
+# are formatted in bulk: a block of rows is rendered by a single
+# string formatting operation instead of value by value, and
+# *Node and *Element data packed into NumPy arrays (see
+# abaqus_arrays) is written straight from the arrays.
+#-----------------------------------------------------------------
+from abaqus_arrays import ENTRIES_PER_LINE, NODE_KEYWORDS, ELEMENT_KEYWORDS, keyword_name
+
+# Enough digits to read back the same float64; the mantissa always
+# has a '.', which the lexer needs in front of a signed exponent
+FLOAT_FORMAT = '%.16E'
+
+# Rows formatted per string operation
+ROWS_PER_CHUNK = 4096
+
+
+def format_keyword_line(kw):
+    """ The keyword line of kw, e.g. '*Node, nset=all\\n'.
+    """
+    parts = ['*', kw.keyword]
+    for param in kw.params or []:
+        parts.append(', ')
+        parts.append(param.name)
+        if param.value is not None:
+            parts.append('=')
+            parts.append(param.value)
+    parts.append('\n')
+    return ''.join(parts)
+
+
+def iter_data_lines(data, rows=ROWS_PER_CHUNK):
+    """ Yields the text of data lines given as lists of value
+        strings, rows lines at a time.
+    """
+    for begin in range(0, len(data), rows):
+        lines = [','.join(line) for line in data[begin:begin + rows]]
+        lines.append('')
+        yield '\n'.join(lines)
+
+
+def row_format(formats):
+    """ Format string for one row of values with the given formats,
+        wrapped after ENTRIES_PER_LINE entries.
+    """
+    lines = [','.join(formats[begin:begin + ENTRIES_PER_LINE])
+             for begin in range(0, len(formats), ENTRIES_PER_LINE)]
+    return ',\n'.join(lines) + '\n'
+
+
+def iter_table_lines(table, formats, rows=ROWS_PER_CHUNK):
+    """ Yields the text of the rows of a 2-d array, formatted with
+        one format per column, rows lines at a time.
+    """
+    fmt = row_format(formats)
+    for begin in range(0, len(table), rows):
+        chunk = table[begin:begin + rows]
+        yield (fmt * len(chunk)) % tuple(chunk.ravel().tolist())
+
+
+def iter_node_lines(labels, coords, float_format=FLOAT_FORMAT, rows=ROWS_PER_CHUNK):
+    """ Yields the *Node data lines of packed (labels, coords).
+    """
+    import numpy
+    if not len(labels):
+        return iter(())
+    # Labels are exact in float64, which lets one array hold the rows
+    table = numpy.column_stack((labels.astype(numpy.float64), coords))
+    formats = ['%d'] + [float_format] * coords.shape[1]
+    return iter_table_lines(table, formats, rows)
+
+
+def iter_element_lines(labels, connectivity, rows=ROWS_PER_CHUNK):
+    """ Yields the *Element data lines of packed
+        (labels, connectivity).
+    """
+    import numpy
+    if not len(labels):
+        return iter(())
+    table = numpy.column_stack((labels, connectivity))
+    return iter_table_lines(table, ['%d'] * table.shape[1], rows)
+
+
+def iter_keyword_text(kw, float_format=FLOAT_FORMAT, rows=ROWS_PER_CHUNK):
+    """ Yields the text of kw: its keyword line, then its data lines
+        in chunks.
+    """
+    yield format_keyword_line(kw)
+    data = kw.data
+    if data is None:
+        return
+    if isinstance(data, tuple):
+        name = keyword_name(kw.keyword)
+        if name in NODE_KEYWORDS:
+            lines = iter_node_lines(data[0], data[1], float_format, rows)
+        elif name in ELEMENT_KEYWORDS:
+            lines = iter_element_lines(data[0], data[1], rows)
+        else:
+            raise ValueError('packed data for *%s' % kw.keyword)
+    else:
+        lines = iter_data_lines(data, rows)
+    for text in lines:
+        yield text
+
+
+def write(keywords, f, float_format=FLOAT_FORMAT, rows=ROWS_PER_CHUNK):
+    """ Writes keywords as Abaqus input to f, a path or a file
+        object, in chunks of rows data lines.
+
+        Data lines given as value strings are written as they were
+        parsed; packed *Node coordinates are written with
+        float_format.
+    """
+    if hasattr(f, 'write'):
+        stream = f
+        close = False
+    else:
+        stream = open(f, 'wb')
+        close = True
+    try:
+        for kw in keywords:
+            for text in iter_keyword_text(kw, float_format, rows):
+                stream.write(text)
+    finally:
+        if close:
+            stream.close()
+
+
+def dumps(keywords, float_format=FLOAT_FORMAT):
+    """ Returns keywords as Abaqus input text.
+    """
+    return ''.join(text for kw in keywords for text in iter_keyword_text(kw, float_format))
@@ -9,17 +9,35 @@
 #-----------------------------------------------------------------
 
 
+def check_state(state, size):
+    """ Rejects pickled state that is not the tuple __getstate__
+        makes, e.g. the __dict__ of an object pickled before the
+        class used __slots__.
+    """
+    if not isinstance(state, tuple) or len(state) != size:
+        raise TypeError('unexpected pickled state %r' % (type(state),))
+
+
 class Coord(object):
     """ Coordinates of a syntactic element. Consists of:
             - File name
             - Line number
             - (optional) column number, for the Lexer
     """
+    __slots__ = ('file', 'line', 'column')
+
     def __init__(self, file, line, column=None):
         self.file = file
         self.line = line
         self.column = column
 
+    def __getstate__(self):
+        return (self.file, self.line, self.column)
+
+    def __setstate__(self, state):
+        check_state(state, 3)
+        self.file, self.line, self.column = state
+
     def __str__(self):
         str = "%s:%s" % (self.file, self.line)
         if self.column: str += ":%s" % self.column
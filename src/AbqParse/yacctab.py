@@ -0,0 +1,51 @@
+
+# AbqParse/yacctab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\x18k\xdd\x16\xf6\x19D\nL\x85Lp\x98\x0c\x8e.'
+    
+_lr_action_items = {'LASTTOKENONLINE':([5,6,8,9,10,14,15,21,],[13,-21,-22,-19,-20,20,-18,-17,]),'KEYWORD':([0,1,2,3,4,11,12,13,16,17,18,19,20,23,25,26,27,28,],[2,-2,-3,2,-14,-4,-1,-15,-5,-9,-8,-13,-16,-6,-7,-12,-10,-11,]),'EQUALS':([17,],[24,]),'PARAM':([7,22,24,],[17,17,27,]),'INT_CONST_DEC':([2,4,5,6,8,9,10,11,13,14,15,16,17,18,19,20,21,23,24,25,26,27,28,],[6,-14,6,-21,-22,-19,-20,6,-15,6,-18,6,-9,-8,-13,-16,-17,6,26,-7,-12,-10,-11,]),'COMMA':([2,5,6,8,9,10,15,16,17,18,21,25,26,27,28,],[7,14,-21,-22,-19,-20,-18,22,-9,-8,-17,-7,-12,-10,-11,]),'FLOAT_CONST':([2,4,5,6,8,9,10,11,13,14,15,16,17,18,19,20,21,23,24,25,26,27,28,],[8,-14,8,-21,-22,-19,-20,8,-15,8,-18,8,-9,-8,-13,-16,-17,8,28,-7,-12,-10,-11,]),'ID':([2,4,5,6,8,9,10,11,13,14,15,16,17,18,19,20,21,23,25,26,27,28,],[10,-14,10,-21,-22,-19,-20,10,-15,10,-18,10,-9,-8,-13,-16,-17,10,-7,-12,-10,-11,]),'$end':([1,2,3,4,11,12,13,16,17,18,19,20,23,25,26,27,28,],[-2,-3,0,-14,-4,-1,-15,-5,-9,-8,-13,-16,-6,-7,-12,-10,-11,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'data_line':([2,11,16,23,],[4,19,4,19,]),'keyword':([0,3,],[1,12,]),'keyword_list':([0,],[3,]),'param':([7,22,],[18,25,]),'param_list':([7,],[16,]),'data_list':([2,11,16,23,],[5,5,5,5,]),'data':([2,5,11,14,16,23,],[9,15,9,21,9,9,]),'data_lines':([2,16,],[11,23,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> keyword_list","S'",1,None,None,None),
+  ('keyword_list -> keyword_list keyword','keyword_list',2,'p_keyword_list','AbqParse/abaqus_parser.py',853),
+  ('keyword_list -> keyword','keyword_list',1,'p_keyword','AbqParse/abaqus_parser.py',859),
+  ('keyword -> KEYWORD','keyword',1,'p_single_keyword','AbqParse/abaqus_parser.py',865),
+  ('keyword -> KEYWORD data_lines','keyword',2,'p_single_keyword','AbqParse/abaqus_parser.py',866),
+  ('keyword -> KEYWORD COMMA param_list','keyword',3,'p_single_keyword','AbqParse/abaqus_parser.py',867),
+  ('keyword -> KEYWORD COMMA param_list data_lines','keyword',4,'p_single_keyword','AbqParse/abaqus_parser.py',868),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','AbqParse/abaqus_parser.py',888),
+  ('param_list -> param','param_list',1,'p_param','AbqParse/abaqus_parser.py',892),
+  ('param -> PARAM','param',1,'p_single_param','AbqParse/abaqus_parser.py',897),
+  ('param -> PARAM EQUALS PARAM','param',3,'p_single_param','AbqParse/abaqus_parser.py',898),
+  ('param -> PARAM EQUALS FLOAT_CONST','param',3,'p_single_param','AbqParse/abaqus_parser.py',899),
+  ('param -> PARAM EQUALS INT_CONST_DEC','param',3,'p_single_param','AbqParse/abaqus_parser.py',900),
+  ('data_lines -> data_lines data_line','data_lines',2,'p_data_lines_list','AbqParse/abaqus_parser.py',910),
+  ('data_lines -> data_line','data_lines',1,'p_data_lines','AbqParse/abaqus_parser.py',916),
+  ('data_line -> data_list LASTTOKENONLINE','data_line',2,'p_data_line','AbqParse/abaqus_parser.py',922),
+  ('data_line -> data_list COMMA LASTTOKENONLINE','data_line',3,'p_data_line','AbqParse/abaqus_parser.py',923),
+  ('data_list -> data_list COMMA data','data_list',3,'p_data_list','AbqParse/abaqus_parser.py',929),
+  ('data_list -> data_list data','data_list',2,'p_data_list','AbqParse/abaqus_parser.py',930),
+  ('data_list -> data','data_list',1,'p_data','AbqParse/abaqus_parser.py',939),
+  ('data -> ID','data',1,'p_single_data','AbqParse/abaqus_parser.py',945),
+  ('data -> INT_CONST_DEC','data',1,'p_single_data','AbqParse/abaqus_parser.py',946),
+  ('data -> FLOAT_CONST','data',1,'p_single_data','AbqParse/abaqus_parser.py',947),
+]
@@ -0,0 +1,33 @@
+#-----------------------------------------------------------------
+# helpers.py
+#
+# Functions shared by the test modules.
+#-----------------------------------------------------------------
+
+
+def dump_keyword(kw, coord=False, exact=False):
+    """ kw as a tuple of its name, parameters and data, which
+        compares equal for keywords that parse the same. With coord,
+        the file and line of kw are added. With exact, the type of
+        the name, the dtypes of array data and params of None are
+        kept apart as well.
+    """
+    data = kw.data
+    if exact and isinstance(data, tuple):
+        data = tuple((array.dtype.str, array.tolist()) for array in data)
+    if exact and kw.params is None:
+        params = None
+    else:
+        params = [(param.name, param.value) for param in kw.params or []]
+    result = (kw.keyword, params, data)
+    if exact:
+        result = (type(kw.keyword),) + result
+    if coord:
+        result += (kw.coord.file, kw.coord.line)
+    return result
+
+
+def dump(keywords, coord=False, exact=False):
+    """ dump_keyword of each of keywords.
+    """
+    return [dump_keyword(kw, coord, exact) for kw in keywords]
@@ -0,0 +1,110 @@
+import unittest
+import sys, os
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+import numpy
+
+from AbqParse import abaqus_parser, abaqus_arrays
+
+class Arrays(unittest.TestCase):
+    def test_1(self):
+        buf = ''' 
+        *Node,nset=all_nodes
+        1,1.0,1.0e-5,1.0E+6
+        2,2.0
+        *element,type=c3d4,elset=foo
+        1,1,2,3,4
+        2,3,4,5,6
+        *elset,elset=foo
+        1,
+        '''
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(buf, 'test_1_buffer', debuglevel=0, arrays=True)
+        labels, coords = t[0].data
+        self.assertEqual(labels.dtype, numpy.int64)
+        self.assertEqual(labels.tolist(), [1, 2])
+        self.assertEqual(coords.dtype, numpy.float64)
+        self.assertEqual(coords.tolist(), [[1.0, 1.0e-5, 1.0e6], [2.0, 0.0, 0.0]])
+        labels, connectivity = t[1].data
+        self.assertEqual(labels.tolist(), [1, 2])
+        self.assertEqual(connectivity.dtype, numpy.int64)
+        self.assertEqual(connectivity.tolist(), [[1, 2, 3, 4], [3, 4, 5, 6]])
+        self.assertEqual(t[2].data, [['1']])
+
+    def test_empty(self):
+        buf = '*Node\n*Elset, elset=a\n1\n*element,type=c3d4\n'
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        fd, path = tempfile.mkstemp(suffix='.inp')
+        os.write(fd, buf)
+        os.close(fd)
+        try:
+            for t in (parser.parse(buf, 'buffer', arrays=True),
+                      parser.parse(buf, 'buffer', arrays=True, lazy=True),
+                      parser.parse_file(path, arrays=True, lazy=True)):
+                labels, coords = t[0].data
+                self.assertEqual((labels.tolist(), coords.shape), ([], (0, 3)))
+                self.assertEqual(t[1].data, [['1']])
+                labels, connectivity = t[2].data
+                self.assertEqual((labels.tolist(), connectivity.shape[0]), ([], 0))
+        finally:
+            os.remove(path)
+
+    def test_continuation(self):
+        line1 = [str(i) for i in range(1, 17)]
+        line2 = [str(i) for i in range(17, 22)]
+        labels, connectivity = abaqus_arrays.element_arrays([line1, line2, line1, line2])
+        self.assertEqual(labels.tolist(), [1, 1])
+        self.assertEqual(connectivity.shape, (2, 20))
+
+    def test_text(self):
+        nodes = '1, 1.0,-2.5e-3 ,.5\n2,3.,4e2,0\n'
+        labels, coords = abaqus_arrays.pack_text('node', '*node\n' + nodes, 6)
+        self.assertEqual(labels.dtype, numpy.int64)
+        expected = abaqus_arrays.node_arrays([line.split(',') for line in nodes.split('\n')[:-1]])
+        self.assertEqual(labels.tolist(), expected[0].tolist())
+        self.assertEqual(coords.tolist(), expected[1].tolist())
+        labels, coords = abaqus_arrays.pack_text('node', '1,2.0\n')
+        self.assertEqual(coords.tolist(), [[2.0, 0.0, 0.0]])
+        labels, connectivity = abaqus_arrays.pack_text('element', '5,1,2,3\n6,4,5,6\n')
+        self.assertEqual(connectivity.tolist(), [[1, 2, 3], [4, 5, 6]])
+        # Anything but plain numbers in equal lines is split first
+        for name, text in [('node', '1,2.0\n2,3.0,4.0\n'), ('node', '1.0,2.0\n'),
+                           ('node', '1,2.0\n** c\n'), ('node', '1,-1\n'), ('node', '1,2.0'),
+                           ('node', '1 2.0\n'), ('element', '1,2.0\n'), ('element', '1,2,\n'),
+                           ('element', '1,a\n'), ('elset', '1,2\n')]:
+            self.assertEqual(abaqus_arrays.pack_text(name, text), None)
+
+    def test_buffer(self):
+        f = open(os.path.join('data','test_2.inp'),'rb')
+        buf = f.read()
+        f.close()
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(bytearray(buf), 'test_2.inp', arrays=True)
+        expected = parser.parse(buf, 'test_2.inp', arrays=True, fast=False)
+        self.assertEqual([type(kw.keyword) for kw in t], [str] * len(expected))
+        for kw, expected_kw in zip(t, expected):
+            for array, expected_array in zip(kw.data, expected_kw.data):
+                self.assertTrue(numpy.array_equal(array, expected_array))
+
+    def test_mmxmn(self):
+        f = open(os.path.join('data','mmxmn.inp'),'rb')
+        buf = f.read()
+        f.close()
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(buf, 'mmxmn.inp', debuglevel=0, arrays=True)
+        labels, coords = t[2].data
+        self.assertEqual(coords.shape, (len(labels), 3))
+        self.assertEqual(labels[0], 1)
+        self.assertAlmostEqual(coords[0][0], 1.246880054)
+        labels, connectivity = t[3].data
+        self.assertEqual(connectivity.shape, (len(labels), 4))
+
+def suite():
+    suite1 = unittest.makeSuite(Arrays)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Arrays)
+    unittest.TextTestRunner(verbosity=2).run(suite)
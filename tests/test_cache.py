@@ -0,0 +1,82 @@
+import unittest
+import sys, os
+import shutil
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser, abaqus_cache
+from helpers import dump
+
+class Cache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_parse_file(self):
+        cache = abaqus_cache.ParseCache(self.directory)
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False,
+                                            cache=cache)
+        filename = os.path.join('data','test_2.inp')
+        t = parser.parse_file(filename, 'test_2.inp')
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        # Served from the cache from now on
+        parser.cparser = None
+        self.assertEqual(dump(parser.parse_file(filename, 'test_2.inp')), dump(t))
+        f = open(filename,'rb')
+        buf = f.read()
+        f.close()
+        self.assertEqual(dump(parser.parse(buf, 'test_2.inp')), dump(t))
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_key(self):
+        cache = abaqus_cache.ParseCache(self.directory)
+        digest = abaqus_cache.text_digest('*node\n1,2.0\n')
+        self.assertNotEqual(cache.key(digest, 'a.inp', 1, False),
+                            cache.key(digest, 'a.inp', 1, True))
+        self.assertNotEqual(cache.key(digest, 'a.inp', 1, False),
+                            cache.key(abaqus_cache.text_digest('*node\n1,3.0\n'), 'a.inp', 1, False))
+
+    def test_eviction(self):
+        cache = abaqus_cache.ParseCache(self.directory, max_size=1000)
+        for i in range(10):
+            cache.put('key%d' % i, [[str(i) * 100, 'y' * 100]])
+            self.assertTrue(cache.size() <= 1000)
+        self.assertEqual(cache.get('key9'), [['9' * 100, 'y' * 100]])
+        self.assertEqual(cache.get('key0'), None)
+        cache.discard('key9')
+        self.assertEqual(cache.get('key9'), None)
+
+    def test_corrupt(self):
+        cache = abaqus_cache.ParseCache(self.directory)
+        cache.put('key', [1, 2, 3])
+        f = open(os.path.join(self.directory, 'key.pickle'), 'wb')
+        f.write('garbage')
+        f.close()
+        self.assertEqual(cache.get('key'), None)
+        self.assertEqual(cache.size(), 0)
+
+    def test_stale_state(self):
+        # Entries pickled before Keyword used __slots__ hold a dict
+        cache = abaqus_cache.ParseCache(self.directory)
+        kw = abaqus_parser.Keyword('node', [abaqus_parser.Parameter('nset', 'all')], [['1', '0.0']])
+        getstate = abaqus_parser.Keyword.__getstate__
+        abaqus_parser.Keyword.__getstate__ = lambda self: {
+            'keyword': self.keyword, 'params': self.params, 'data': self.data, 'coord': None}
+        try:
+            cache.put('key', [kw])
+        finally:
+            abaqus_parser.Keyword.__getstate__ = getstate
+        self.assertEqual(cache.get('key'), None)
+        self.assertEqual(cache.size(), 0)
+
+def suite():
+    suite1 = unittest.makeSuite(Cache)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Cache)
+    unittest.TextTestRunner(verbosity=2).run(suite)
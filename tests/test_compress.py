@@ -0,0 +1,103 @@
+import unittest
+import sys, os
+import bz2
+import gzip
+import io
+import shutil
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser, abaqus_compress
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+class Compress(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        f = open(os.path.join('data', 'mmxmn.inp'), 'rb')
+        self.buf = f.read()
+        f.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_gzip(self, name, text):
+        path = os.path.join(self.directory, name)
+        f = gzip.GzipFile(path, 'wb')
+        f.write(text)
+        f.close()
+        return path
+
+    def write_bz2(self, name, text):
+        path = os.path.join(self.directory, name)
+        f = bz2.BZ2File(path, 'wb')
+        f.write(text)
+        f.close()
+        return path
+
+    def test_parse_file(self):
+        expected = dump(self.parser.parse(self.buf, 'mmxmn.inp'), coord=True)
+        for path in (self.write_gzip('mmxmn.inp.gz', self.buf),
+                     self.write_bz2('mmxmn.inp.bz2', self.buf),
+                     # Recognized by the magic bytes
+                     self.write_gzip('mmxmn.inp', self.buf)):
+            t = self.parser.parse_file(path, 'mmxmn.inp')
+            self.assertEqual(dump(t, coord=True), expected)
+            t = self.parser.parse_file(path, 'mmxmn.inp', lazy=True)
+            self.assertEqual(dump(t, coord=True), expected)
+            t = self.parser.iter_keywords(path, 'mmxmn.inp', chunk_size=4096, prefetch=True)
+            self.assertEqual(dump(t, coord=True), expected)
+        self.assertEqual(abaqus_compress.compression(path), 'gzip')
+        self.assertEqual(abaqus_compress.compression(os.path.join('data', 'mmxmn.inp')), None)
+
+    def test_include(self):
+        main = os.path.join(self.directory, 'main.inp')
+        f = open(main, 'wb')
+        f.write('*heading\nmodel\n*include,input=mesh.inp.gz\n*end step\n')
+        f.close()
+        self.write_gzip('mesh.inp.gz', '*node\n1,0.0,0.0\n')
+        t = self.parser.parse_file(main, includes=True)
+        self.assertEqual([kw.keyword for kw in t], ['heading', 'node', 'end step'])
+
+    def test_errors(self):
+        path = self.write_gzip('bad.inp.gz', '*node\n1,2.0\n3 = 4\n')
+        with self.assertRaises(ParseError) as cm:
+            self.parser.parse_file(path, 'bad.inp')
+        self.assertTrue(str(cm.exception).startswith('bad.inp:3:'))
+        errors = []
+        self.assertEqual(self.parser.parse_file(path, errors=errors), [])
+        self.assertEqual(len(errors), 1)
+        # Errors of the stream are raised by the reader
+        path = self.write_gzip('truncated.inp.gz', self.buf)
+        f = open(path, 'rb')
+        data = f.read()
+        f.close()
+        f = open(path, 'wb')
+        f.write(data[:len(data) // 2])
+        f.close()
+        self.assertRaises(IOError, self.parser.parse_file, path)
+        self.assertRaises(ParseError, self.parser.parse_file, self.write_gzip('empty.gz', ''))
+
+    def test_prefetch(self):
+        reader = abaqus_compress.PrefetchReader(io.BytesIO(self.buf), 1000, depth=2)
+        chunks = list(iter(reader.read, ''))
+        self.assertEqual(''.join(chunks), self.buf)
+        self.assertEqual(reader.read(), '')
+        reader.close()
+        # Closing early stops the thread
+        reader = abaqus_compress.PrefetchReader(io.BytesIO(self.buf), 10, depth=2)
+        self.assertEqual(reader.read(), self.buf[:10])
+        reader.close()
+        self.assertFalse(reader._thread.is_alive())
+
+def suite():
+    suite1 = unittest.makeSuite(Compress)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Compress)
+    unittest.TextTestRunner(verbosity=2).run(suite)
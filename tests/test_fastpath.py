@@ -0,0 +1,92 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser, abaqus_fastpath
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+class FastPath(unittest.TestCase):
+    def setUp(self):
+        self.parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+    def assertSameParse(self, buf):
+        expected = dump(self.parser.parse(buf, 'buffer', fast=False))
+        self.assertEqual(dump(self.parser.parse(buf, 'buffer')), expected)
+
+    def test_1(self):
+        buf = ''' 
+        ** comment
+        *heading
+        word1 word2
+        *KEYword,
+        param=continue
+        *node,nset=all_nodes
+        1,1.0,1.0e-5,1.0E+6
+        ** comment
+        2, -1., .5, 5e3
+        *surface,name=ts01
+        1487,S4
+        1488 ,S4 ,
+        *contact pair,interaction=t01
+        ts01,tm01
+        *friction
+        0.0,
+        *end step
+        '''
+        self.assertSameParse(buf)
+
+    def test_fallback(self):
+        # Whitespace separated values
+        buf = '*node\n1 2.0 3.0\n*elset,elset=a\n1,2\n'
+        self.assertEqual(abaqus_fastpath.split_block('*node\n1 2.0 3.0\n'), None)
+        self.assertSameParse(buf)
+
+    def test_errors(self):
+        for buf in ('*node\n1,,2\n', '*node\n-1,2.0\n', '*node\n1,2\n  \n3,4\n'):
+            self.assertEqual(abaqus_fastpath.split_block(buf), None)
+            self.assertRaises(ParseError, self.parser.parse, buf, 'buffer')
+
+    def test_unicode(self):
+        buf = u'*heading\n** mod\xe8le\n*node,nset=all\n1,2.0,3.0\n*elset,elset=a\n1,2\n'
+        expected = dump(self.parser.parse(buf, 'buffer', fast=False))
+        self.assertEqual(expected[1], (u'node', [(u'nset', u'all')], [[u'1', u'2.0', u'3.0']]))
+        for options in ({}, {'lazy': True}, {'errors': []}):
+            t = self.parser.parse(buf, 'buffer', **options)
+            self.assertEqual(dump(t), expected)
+            self.assertEqual([type(kw.keyword) for kw in t], [unicode] * 3)
+            self.assertEqual(type(t[2].data[0][0]), unicode)
+        labels, coords = self.parser.parse(buf, 'buffer', arrays=True)[1].data
+        self.assertEqual(coords.tolist(), [[2.0, 3.0, 0.0]])
+
+    def test_header(self):
+        headers = ['*node\n', '*Node, nset=all\n', '*el file , freq = 1.0 ,x\n',
+                   '  *step,inc=100,nlgeom,name=step_1\n', '*a,b=1.e5,c=+2.\n',
+                   '*a,b=0\n', '*end step \t\n']
+        for header in headers:
+            split = abaqus_fastpath.split_header(header)
+            self.assertNotEqual(split, None)
+            kw = self.parser.parse(header, 'buffer', fast=False)[0]
+            params = kw.params
+            if params is not None:
+                params = [(param.name, param.value or '') for param in params]
+            self.assertEqual(split, (kw.keyword, params))
+        # Continued lines, comments and invalid values go to PLY
+        for header in ('*node,\nnset=all\n', '** c\n*node\n', '*a,b=0x1\n',
+                       '*a,b=--1\n', '*node,\n', '*node'):
+            self.assertEqual(abaqus_fastpath.split_header(header), None)
+
+    def test_mmxmn(self):
+        f = open(os.path.join('data','mmxmn.inp'),'rb')
+        buf = f.read()
+        f.close()
+        self.assertSameParse(buf)
+
+def suite():
+    suite1 = unittest.makeSuite(FastPath)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(FastPath)
+    unittest.TextTestRunner(verbosity=2).run(suite)
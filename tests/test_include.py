@@ -0,0 +1,83 @@
+import unittest
+import sys, os
+import shutil
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.plyparser import ParseError
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+class Include(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.directory, 'mesh'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        f = open(path, 'wb')
+        f.write(text)
+        f.close()
+        return path
+
+    def test_1(self):
+        main = self.write('main.inp', '*heading\nmodel\n*include,input=materials.inp\n'
+                                      '*include,input=mesh\n*end step\n')
+        self.write('materials.inp', '*material,name=T95\n*elastic\n30.0e6,0.3\n')
+        self.write('mesh/part.inp', '*node\n1,0.0,0.0\n')
+        self.write('mesh.inp', '** empty\n')
+        self.assertRaises(ParseError, abaqus_parser.AbaqusParser(**OPTIONS).parse_file,
+                          main, includes=True)
+        self.write('main.inp', '*heading\nmodel\n*include,input=materials.inp\n'
+                               '*include,input=part.inp\n*end step\n')
+        self.write('part.inp', '*node\n1,0.0,0.0\n*include,input=materials.inp\n')
+        for workers in (1, 2):
+            parser = abaqus_parser.AbaqusParser(**OPTIONS)
+            t = parser.parse_file(main, includes=True, workers=workers)
+            self.assertEqual([kw.keyword for kw in t],
+                             ['heading', 'material', 'elastic', 'node', 'material', 'elastic', 'end step'])
+            self.assertEqual(os.path.basename(t[0].coord.file), 'main.inp')
+            self.assertEqual(os.path.basename(t[2].coord.file), 'materials.inp')
+            self.assertEqual(t[2].coord.line, 2)
+            self.assertEqual(os.path.basename(t[3].coord.file), 'part.inp')
+            self.assertEqual(t[6].coord.line, 5)
+
+    def test_filter(self):
+        main = self.write('main.inp', '*heading\nmodel\n*include,input=part.inp\n*end step\n')
+        self.write('part.inp', '*node\n1,0.0,0.0\n*material,name=T95\n*elastic\n30.0e6,0.3\n')
+        for workers in (1, 2):
+            parser = abaqus_parser.AbaqusParser(**OPTIONS)
+            t = parser.parse_file(main, includes=True, workers=workers,
+                                  include_keywords=['node', 'elastic'])
+            self.assertEqual([kw.keyword for kw in t], ['node', 'elastic'])
+            self.assertEqual(t[1].coord.line, 4)
+            t = parser.parse_file(main, includes=True, exclude_keywords=['heading', 'include'])
+            self.assertEqual([kw.keyword for kw in t], ['node', 'material', 'elastic', 'end step'])
+
+    def test_cycle(self):
+        main = self.write('main.inp', '*heading\n*include,input=a.inp\n')
+        self.write('a.inp', '*node\n1,0.0\n*include,input=main.inp\n')
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        with self.assertRaises(ParseError) as cm:
+            parser.parse_file(main, includes=True)
+        self.assertTrue('a.inp:3: include cycle' in str(cm.exception))
+
+    def test_missing(self):
+        main = self.write('main.inp', '*heading\n*include,input=missing.inp\n')
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        with self.assertRaises(ParseError) as cm:
+            parser.parse_file(main, includes=True)
+        self.assertTrue('main.inp:2: cannot find include file' in str(cm.exception))
+
+def suite():
+    suite1 = unittest.makeSuite(Include)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Include)
+    unittest.TextTestRunner(verbosity=2).run(suite)
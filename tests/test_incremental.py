@@ -0,0 +1,108 @@
+import unittest
+import sys, os
+import random
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+BUF = '''** leading comment
+*heading
+word1 word2
+*node,nset=all_nodes
+1,1.0,1.0e-5,1.0E+6
+2,1.0,1.0e-5,1.0E+6
+*material,name=T95
+*elastic
+30.0e6,0.3
+*element,type=c3d4,elset=foo
+1,1,2,3,4
+*end
+'''
+
+class Incremental(unittest.TestCase):
+    def setUp(self):
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def check(self, t, offset, length, text):
+        t.edit(offset, length, text)
+        self.assertEqual(dump(t.keywords, coord=True),
+                         dump(self.parser.parse(t.text, 'buffer'), coord=True))
+        self.assertEqual([t.text[start:start + 1] for start in t.starts[1:]],
+                         ['*'] * (len(t.starts) - 1))
+
+    def test_edits(self):
+        t = self.parser.parse_incremental(BUF, 'buffer')
+        self.assertEqual(dump(t.keywords, coord=True),
+                         dump(self.parser.parse(BUF, 'buffer'), coord=True))
+        # Change a data line
+        self.check(t, t.text.index('30.0e6'), 6, '29.0e6')
+        # Add data lines, shifting the later blocks
+        self.check(t, t.text.index('2,1.0'), 0, '3,0.0,0.0,0.0\n4,0.0,0.0,0.0\n')
+        # Add a keyword
+        self.check(t, t.text.index('*element'), 0, '*density\n7.8e-9\n')
+        # Edit a keyword line
+        self.check(t, t.text.index('T95'), 3, 'steel')
+        # Remove a keyword line: its data lines join the block before
+        start = t.text.index('*elastic')
+        self.check(t, start, len('*elastic\n'), '')
+        self.check(t, start, 0, '*elastic\n')
+        # Split a keyword line into a continuation line and join it back
+        self.check(t, t.text.index('elset=foo'), 0, '\n')
+        self.check(t, t.text.index('elset=foo') - 1, 1, '')
+        # Replace everything after the heading
+        start = t.text.index('*node')
+        self.check(t, start, len(t.text) - start, '*node\n1,2.0\n')
+
+    def test_random_edits(self):
+        pieces = ['*node\n5,1.0\n', '*elset,elset=a\n1,2\n', '7,8\n', '** c\n', '\n', ',']
+        rng = random.Random(1)
+        t = self.parser.parse_incremental(BUF, 'buffer')
+        for i in range(200):
+            offset = rng.randint(0, len(t.text))
+            length = rng.randint(0, min(12, len(t.text) - offset))
+            text = rng.choice(pieces)
+            new = t.text[:offset] + text + t.text[offset + length:]
+            try:
+                expected = dump(self.parser.parse(new, 'buffer'), coord=True)
+            except ParseError:
+                continue
+            t.edit(offset, length, text)
+            self.assertEqual(t.text, new)
+            self.assertEqual(dump(t.keywords, coord=True), expected)
+
+    def test_many_blocks(self):
+        buf = '*heading\n' + ''.join('*elset,elset=e%d\n%d,\n' % (i, i) for i in range(300))
+        t = self.parser.parse_incremental(buf, 'buffer')
+        # Keywords added at one place, beyond a slot's capacity
+        for i in range(100):
+            self.check(t, t.text.index('*elset,elset=e0\n'), 0, '*nset,nset=n%d\n%d,\n' % (i, i))
+        # Coords of the blocks after the edits move along
+        self.check(t, t.text.index('*elset,elset=e200'), 0, '\n\n')
+        # Removing most blocks at once
+        start = t.text.index('*nset,nset=n50')
+        self.check(t, start, t.text.index('*elset,elset=e250') - start, '')
+        self.check(t, 0, len('*heading\n'), '*heading\n** more\n')
+
+    def test_error(self):
+        t = self.parser.parse_incremental(BUF, 'buffer')
+        expected = dump(t.keywords, coord=True)
+        offset = t.text.index('30.0e6')
+        with self.assertRaises(ParseError) as cm:
+            t.edit(offset, 0, '=')
+        self.assertTrue(str(cm.exception).startswith('buffer:9:'))
+        self.assertEqual(t.text, BUF)
+        self.assertEqual(dump(t.keywords, coord=True), expected)
+        self.assertRaises(ValueError, t.edit, len(BUF), 1, '')
+
+def suite():
+    suite1 = unittest.makeSuite(Incremental)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Incremental)
+    unittest.TextTestRunner(verbosity=2).run(suite)
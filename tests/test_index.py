@@ -0,0 +1,65 @@
+import unittest
+import sys, os
+import shutil
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.abaqus_index import KeywordIndex
+from helpers import dump_keyword
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+class Index(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'mmxmn.inp')
+        shutil.copy(os.path.join('data', 'mmxmn.inp'), self.path)
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build(self):
+        keywords = self.parser.parse_file(self.path)
+        index = KeywordIndex.build(self.path, self.parser)
+        self.assertEqual(len(index.entries), len(keywords))
+        for entry, kw in zip(index.entries, keywords):
+            self.assertEqual(entry.name, ' '.join(kw.keyword.lower().split()))
+            self.assertEqual(entry.nlines, len(kw.data or []))
+        entries = index.find('ELSET', elset='Box')
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].lineno, 47811)
+        kw = index.read(entries[0])
+        expected = [k for k in keywords if k.coord.line == 47811][0]
+        self.assertEqual(dump_keyword(kw, coord=True), dump_keyword(expected, coord=True))
+        self.assertEqual(len(index.get('solid section', material='t95')), 2)
+        self.assertEqual(index.get('elset', elset='missing'), [])
+
+    def test_sidecar(self):
+        self.assertEqual(KeywordIndex.load(self.path, self.parser), None)
+        index = KeywordIndex.open(self.path, self.parser)
+        self.assertTrue(os.path.isfile(self.path + '.idx'))
+        loaded = KeywordIndex.load(self.path, self.parser)
+        self.assertEqual([(e.name, e.params, e.offset, e.length, e.lineno, e.nlines)
+                          for e in loaded.entries],
+                         [(e.name, e.params, e.offset, e.length, e.lineno, e.nlines)
+                          for e in index.entries])
+        self.assertEqual(dump_keyword(loaded.get('elset', elset='pin')[0], coord=True),
+                         dump_keyword(index.get('elset', elset='pin')[0], coord=True))
+        # A changed deck invalidates the sidecar file
+        f = open(self.path, 'ab')
+        f.write('*end step\n')
+        f.close()
+        self.assertEqual(KeywordIndex.load(self.path, self.parser), None)
+        index = KeywordIndex.open(self.path, self.parser)
+        self.assertEqual(index.entries[-1].name, 'end step')
+
+def suite():
+    suite1 = unittest.makeSuite(Index)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Index)
+    unittest.TextTestRunner(verbosity=2).run(suite)
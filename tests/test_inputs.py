@@ -21,6 +21,17 @@ class Inputs(unittest.TestCase):
         parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
         t = parser.parse(buf, 'test_2.inp', debuglevel=0)
 
+    def test_parse_file(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        for name in ('mmxmn.inp', 'test_2.inp'):
+            f = open(os.path.join('data',name),'rb')
+            buf = f.read()
+            f.close()
+            expected = parser.parse(buf, name, debuglevel=0)
+            t = parser.parse_file(os.path.join('data',name), name)
+            self.assertEqual([kw.keyword for kw in t], [kw.keyword for kw in expected])
+            self.assertEqual([kw.data for kw in t], [kw.data for kw in expected])
+
 def suite():
     suite1 = unittest.makeSuite(Inputs)
     return unittest.TestSuite([suite1])
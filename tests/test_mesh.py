@@ -0,0 +1,79 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+import numpy
+
+from AbqParse import abaqus_parser
+from AbqParse.abaqus_mesh import Mesh, LabelIndex
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+BUF = '''*Node,nset=all
+10,0.0,0.0
+30,1.0,0.0
+20,1.0,1.0
+*node
+40,0.0,1.0,5.0
+*element,type=CAX3,elset=tri
+1,10,30,20
+*element,type=cax4
+2,10,30,20,40
+*elset,elset=Both
+2,
+1,
+*nset,nset=corner
+40,10
+'''
+
+class MeshModel(unittest.TestCase):
+    def setUp(self):
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def test_index(self):
+        index = LabelIndex(numpy.array([5, 3, 9, 3]))
+        self.assertEqual(index.rows([9, 3, 5]).tolist(), [2, 1, 0])
+        self.assertEqual(index.contains([3, 4, 10]).tolist(), [True, False, False])
+        self.assertRaises(KeyError, index.rows, [4])
+
+    def test_snippet(self):
+        for arrays in (False, True):
+            mesh = Mesh.from_keywords(self.parser.parse(BUF, 'buffer', arrays=arrays))
+            self.assertEqual(mesh.coords.shape, (4, 3))
+            self.assertEqual(mesh.node_coords([40, 20]).tolist(), [[0.0, 1.0, 5.0], [1.0, 1.0, 0.0]])
+            self.assertEqual(sorted(mesh.elements), ['cax3', 'cax4'])
+            self.assertEqual(mesh.elements['cax4'].connectivity.tolist(), [[10, 30, 20, 40]])
+            self.assertEqual(mesh.nset('ALL').tolist(), [10, 20, 30])
+            self.assertEqual(mesh.nset('corner').tolist(), [10, 40])
+            self.assertEqual(mesh.elset('both').tolist(), [1, 2])
+            labels, coords = mesh.elset_coords('tri')
+            self.assertEqual(labels.tolist(), [10, 20, 30])
+            self.assertEqual(coords[:, :2].tolist(), [[0.0, 0.0], [1.0, 1.0], [1.0, 0.0]])
+            self.assertEqual(mesh.element_nodes([1, 2]).tolist(), [10, 20, 30, 40])
+            self.assertRaises(KeyError, mesh.element_nodes, [3])
+            self.assertRaises(KeyError, mesh.elset, 'missing')
+
+    def test_mmxmn(self):
+        t = self.parser.parse_file(os.path.join('data', 'mmxmn.inp'), arrays=True)
+        mesh = Mesh.from_keywords(t)
+        self.assertEqual(len(mesh.elements['cax4']) + len(mesh.elements['cax3']),
+                         len(mesh.elset('axi')))
+        # Same as looking the nodes up one by one
+        nodes = dict(zip(mesh.node_labels.tolist(), mesh.coords.tolist()))
+        elements = {}
+        for table in mesh.elements.values():
+            elements.update(zip(table.labels.tolist(), table.connectivity.tolist()))
+        expected = sorted(set(node for label in mesh.elset('box').tolist()
+                              for node in elements[label]))
+        labels, coords = mesh.elset_coords('box')
+        self.assertEqual(labels.tolist(), expected)
+        self.assertEqual(coords.tolist(), [nodes[label] for label in expected])
+
+def suite():
+    suite1 = unittest.makeSuite(MeshModel)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(MeshModel)
+    unittest.TextTestRunner(verbosity=2).run(suite)
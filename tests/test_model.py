@@ -0,0 +1,120 @@
+import unittest
+import sys, os
+import pickle
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+class Model(unittest.TestCase):
+    def test_slots(self):
+        kw = abaqus_parser.Keyword('node', [abaqus_parser.Parameter('nset', 'all')], [['1', '0.0']])
+        self.assertFalse(hasattr(kw, '__dict__'))
+        self.assertFalse(hasattr(kw.params[0], '__dict__'))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(kw, protocol))
+            self.assertEqual(copy.data, [['1', '0.0']])
+            self.assertEqual(copy.params[0].value, 'all')
+
+    def test_lazy(self):
+        buf = ''' 
+        ** comment
+        *heading
+        word1 word2
+        *KEYword,
+        param=continue
+        *node,nset=all_nodes
+        1,1.0,1.0e-5,1.0E+6
+        2 3.0 4.0
+        *end step
+        '''
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        expected = dump(parser.parse(buf, 'buffer'), coord=True)
+        t = parser.parse(buf, 'buffer', lazy=True)
+        self.assertEqual([kw.loaded for kw in t][:3], [False, True, False])
+        self.assertEqual(dump(t, coord=True), expected)
+        self.assertTrue(all(kw.loaded for kw in t))
+
+    def test_lazy_error(self):
+        buf = '*heading\nline\n*node\n1,2.0\n3,,4\n*end\n'
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(buf, 'buffer', lazy=True)
+        self.assertEqual(len(t), 3)
+        with self.assertRaises(ParseError) as cm:
+            t[1].data
+        self.assertTrue(str(cm.exception).startswith('buffer:5:'))
+
+    def test_lazy_file(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        filename = os.path.join('data','mmxmn.inp')
+        t = parser.parse_file(filename, lazy=True)
+        self.assertFalse(any(kw.loaded for kw in t if kw.keyword.lower() == 'node'))
+        self.assertEqual(dump(t, coord=True), dump(parser.parse_file(filename), coord=True))
+        self.assertRaises(ValueError, parser.parse_file, filename, includes=True, lazy=True)
+
+    def test_lazy_pickle(self):
+        f = open(os.path.join('data','test_2.inp'),'rb')
+        buf = f.read()
+        f.close()
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(buf, 'test_2.inp', lazy=True, arrays=True)
+        copy = pickle.loads(pickle.dumps(t, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(copy[0].data[1].tolist(), [[3160, 3322, 21971], [30153, 30159, 30195]])
+        self.assertEqual(len(copy[1].data), len(t[1].data))
+
+    def test_filter(self):
+        buf = '''** comment
+*heading
+model
+*Node,nset=all
+1,0.0,0.0
+2,1.0,0.0
+*element,type=CAX3,elset=tri
+1,1,2,3
+*Surface  Interaction,name=contact
+*friction
+0.2,
+*material,name=T95
+*elastic
+30.0e6,0.3 = 4
+*end step
+'''
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        # The lexer error in the *elastic data is never reached
+        self.assertRaises(ParseError, parser.parse, buf, 'buffer')
+        expected = dump(parser.parse(buf.replace(' = 4', ''), 'buffer'), coord=True)
+        for options in ({}, {'fast': False}, {'lazy': True}, {'arrays': True}):
+            t = parser.parse(buf, 'buffer', include_keywords=['NODE', '*Element'], **options)
+            self.assertEqual([(kw.keyword, kw.coord.line) for kw in t],
+                             [('Node', 4), ('element', 7)])
+            if not options.get('arrays'):
+                self.assertEqual(dump(t, coord=True), expected[1:3])
+        t = parser.parse(buf, 'buffer', include_keywords=['surface interaction', 'friction'])
+        self.assertEqual(dump(t, coord=True), expected[3:5])
+        t = parser.parse(buf, 'buffer', exclude_keywords='elastic')
+        self.assertEqual(dump(t, coord=True), expected[:6] + expected[7:])
+        self.assertEqual(parser.parse(buf, 'buffer', include_keywords=['step']), [])
+        # Comments without keywords are still reported
+        self.assertRaises(ParseError, parser.parse, '** comment\n', include_keywords=['node'])
+
+    def test_filter_file(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        filename = os.path.join('data','mmxmn.inp')
+        expected = [kw for kw in dump(parser.parse_file(filename), coord=True)
+                    if kw[0].lower() in ('node', 'nset')]
+        self.assertTrue(expected)
+        for options in ({}, {'lazy': True}):
+            t = parser.parse_file(filename, include_keywords=['node', 'nset'], **options)
+            self.assertEqual(dump(t, coord=True), expected)
+        t = parser.iter_keywords(filename, include_keywords=['node', 'nset'], chunk_size=4096)
+        self.assertEqual(dump(t, coord=True), expected)
+
+def suite():
+    suite1 = unittest.makeSuite(Model)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Model)
+    unittest.TextTestRunner(verbosity=2).run(suite)
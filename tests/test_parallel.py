@@ -0,0 +1,94 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser, abaqus_parallel
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+class Parallel(unittest.TestCase):
+    def test_chunks(self):
+        filename = os.path.join('data','mmxmn.inp')
+        chunks = abaqus_parallel.find_chunks(filename, 100000)
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(sum(chunk[1] for chunk in chunks), os.path.getsize(filename))
+        f = open(filename,'rb')
+        lines = f.readlines()
+        f.close()
+        for offset, length, lineno, header in chunks[1:]:
+            if header is None:
+                self.assertTrue(lines[lineno - 1].startswith('*'))
+            else:
+                self.assertTrue(header.startswith('*'))
+            self.assertEqual(offset, sum(len(line) for line in lines[:lineno - 1]))
+
+    def test_mmxmn(self):
+        filename = os.path.join('data','mmxmn.inp')
+        f = open(filename,'rb')
+        buf = f.read()
+        f.close()
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        expected = dump(parser.parse(buf, 'mmxmn.inp'))
+        t = abaqus_parallel.parse_parallel(filename, workers=3, filename='mmxmn.inp',
+                                           chunk_size=100000, **OPTIONS)
+        self.assertEqual(dump(t), expected)
+
+    def test_large_block(self):
+        # One *Node and one *Element block, the elements wrapped over
+        # two lines, each far larger than a chunk
+        nodes = ''.join('%d,%d.0,%d.5\n' % (i, i, i) for i in range(1, 3001))
+        elements = ''.join('%d,%s,\n%s\n' % (i, ','.join(['%d' % i] * 15), ','.join(['1'] * 5))
+                           for i in range(1, 1001))
+        buf = '*node,nset=all\n' + nodes + '*element,type=c3d20\n' + elements
+        path = os.path.abspath('parallel_large.inp')
+        f = open(path,'wb')
+        f.write(buf)
+        f.close()
+        try:
+            chunks = abaqus_parallel.find_chunks(path, 4000)
+            self.assertTrue(len(chunks) > 20)
+            self.assertEqual(sum(chunk[1] for chunk in chunks), len(buf))
+            parser = abaqus_parser.AbaqusParser(**OPTIONS)
+            expected = dump(parser.parse(buf, 'large.inp'))
+            for workers in (1, 3):
+                t = abaqus_parallel.parse_parallel(path, workers=workers, filename='large.inp',
+                                                   chunk_size=4000, **OPTIONS)
+                self.assertEqual(dump(t), expected)
+            t = abaqus_parallel.parse_parallel(path, workers=3, arrays=True,
+                                               chunk_size=4000, **OPTIONS)
+            expected = parser.parse(buf, 'large.inp', arrays=True)
+            for kw, expected_kw in zip(t, expected):
+                self.assertEqual([array.tolist() for array in kw.data],
+                                 [array.tolist() for array in expected_kw.data])
+        finally:
+            os.remove(path)
+
+    def test_error_lineno(self):
+        filename = os.path.join('data','test_2.inp')
+        f = open(filename,'rb')
+        lines = f.readlines()
+        f.close()
+        bad = os.path.abspath('parallel_bad.inp')
+        lines[8000] = '1,,\n'
+        f = open(bad,'wb')
+        f.write(''.join(lines))
+        f.close()
+        try:
+            with self.assertRaises(ParseError) as cm:
+                abaqus_parallel.parse_parallel(bad, workers=2, filename='bad.inp',
+                                               chunk_size=1000, **OPTIONS)
+            self.assertTrue(str(cm.exception).startswith('bad.inp:8001:'))
+        finally:
+            os.remove(bad)
+
+def suite():
+    suite1 = unittest.makeSuite(Parallel)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Parallel)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,82 @@
+import unittest
+import sys, os
+import io
+import threading
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.abaqus_pool import ParserPool
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+def deck(i):
+    return ('** deck %d\n*heading\ndeck %d\n*node,nset=n%d\n' % (i, i, i) +
+            ''.join('%d,%d.0,1.0\n' % (j, i) for j in range(1, 50)) + '*end\n')
+
+class Pool(unittest.TestCase):
+    def test_clone(self):
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        clone = parser.clone()
+        self.assertFalse(clone.clex is parser.clex)
+        self.assertFalse(clone.cparser is parser.cparser)
+        # The tables are shared
+        self.assertTrue(clone.cparser.action is parser.cparser.action)
+        f = open(os.path.join('data','mmxmn.inp'),'rb')
+        buf = f.read()
+        f.close()
+        self.assertEqual(dump(clone.parse(buf, 'mmxmn.inp', fast=False), coord=True),
+                         dump(parser.parse(buf, 'mmxmn.inp', fast=False), coord=True))
+        with self.assertRaises(ParseError) as cm:
+            clone.parse('*node\n1,$\n', 'buffer')
+        self.assertTrue(str(cm.exception).startswith('buffer:2:3:'))
+
+    def test_threads(self):
+        pool = ParserPool(**OPTIONS)
+        decks = [deck(i) for i in range(16)]
+        expected = [dump(pool.prototype.parse(text, 'deck%d' % i, fast=False), coord=True)
+                    for i, text in enumerate(decks)]
+        results = {}
+        failures = []
+        def work(i):
+            try:
+                for n in range(10):
+                    with pool.parser() as parser:
+                        streamed = list(parser.iter_keywords(
+                            io.BytesIO(decks[i]), 'deck%d' % i, chunk_size=64))
+                    t = pool.parse(decks[i], 'deck%d' % i, fast=False)
+                    if (dump(streamed, coord=True) != expected[i] or
+                            dump(t, coord=True) != expected[i]):
+                        failures.append(i)
+                results[i] = True
+            except Exception:
+                failures.append(sys.exc_info()[1])
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(len(decks))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertEqual(len(results), len(decks))
+        self.assertTrue(0 < len(pool._idle) <= len(decks))
+
+    def test_max_idle(self):
+        pool = ParserPool(abaqus_parser.AbaqusParser(**OPTIONS), max_idle=1)
+        parsers = [pool.acquire(), pool.acquire()]
+        self.assertFalse(parsers[0] is parsers[1])
+        self.assertFalse(pool.prototype in parsers)
+        for parser in parsers:
+            pool.release(parser)
+        self.assertEqual(pool._idle, parsers[:1])
+        self.assertTrue(pool.acquire() is parsers[0])
+        self.assertRaises(TypeError, ParserPool, pool.prototype, **OPTIONS)
+
+def suite():
+    suite1 = unittest.makeSuite(Pool)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Pool)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,88 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+import numpy
+
+from AbqParse import abaqus_parser, abaqus_sets
+from AbqParse.abaqus_mesh import Mesh
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+BUF = '''*elset,elset=range,generate
+1,9,2
+20,22
+*elset,elset=Plain
+4,3,
+2
+*elset,elset=both
+Plain, range
+100
+*elset,elset=Outer
+BOTH,
+*elset,elset=plain
+50
+*nset,nset=loop1
+a
+*nset,nset=a
+1,loop1
+'''
+
+class Sets(unittest.TestCase):
+    def setUp(self):
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        self.keywords = parser.parse(BUF, 'buffer')
+
+    def table(self, kind):
+        table = abaqus_sets.SetTable(kind)
+        for kw in self.keywords:
+            if kw.keyword == kind:
+                table.add_keyword(kw)
+        return table
+
+    def test_generate(self):
+        self.assertEqual(abaqus_sets.generate_labels([['1', '9', '2'], ['20', '22']]).tolist(),
+                         [1, 3, 5, 7, 9, 20, 21, 22])
+        labels = abaqus_sets.generate_labels([['1', '1000000', '1']])
+        self.assertEqual(labels.dtype, numpy.int64)
+        self.assertTrue(numpy.array_equal(labels, numpy.arange(1, 1000001)))
+        self.assertRaises(ValueError, abaqus_sets.generate_labels, [['5', '1', '1']])
+        self.assertRaises(ValueError, abaqus_sets.generate_labels, [['5']])
+
+    def test_nested(self):
+        elsets = self.table('elset')
+        self.assertEqual(sorted(elsets), ['both', 'outer', 'plain', 'range'])
+        self.assertEqual(elsets['range'].tolist(), [1, 3, 5, 7, 9, 20, 21, 22])
+        # Both *elset blocks of plain count
+        self.assertEqual(elsets['PLAIN'].tolist(), [2, 3, 4, 50])
+        outer = elsets['outer']
+        self.assertEqual(outer.tolist(), [1, 2, 3, 4, 5, 7, 9, 20, 21, 22, 50, 100])
+        # Memoized
+        self.assertTrue(elsets['Outer'] is outer)
+        self.assertRaises(KeyError, elsets.__getitem__, 'missing')
+        self.assertRaises(ValueError, self.table('nset').__getitem__, 'a')
+
+    def test_operations(self):
+        elsets = self.table('elset')
+        self.assertEqual(abaqus_sets.intersection(elsets['range'], elsets['plain']).tolist(), [3])
+        self.assertEqual(abaqus_sets.union(elsets['range'], elsets['plain']).tolist(),
+                         elsets['both'].tolist()[:-1])
+        self.assertEqual(abaqus_sets.difference(elsets['plain'], elsets['range']).tolist(),
+                         [2, 4, 50])
+        self.assertEqual(abaqus_sets.union().tolist(), [])
+
+    def test_mmxmn(self):
+        parser = abaqus_parser.AbaqusParser(**OPTIONS)
+        mesh = Mesh.from_keywords(parser.parse_file(os.path.join('data', 'mmxmn.inp')))
+        pin, box = mesh.elset('pin'), mesh.elset('box')
+        self.assertEqual(len(abaqus_sets.intersection(pin, box)), 0)
+        self.assertEqual(len(abaqus_sets.union(pin, box)), len(mesh.elset('axi')))
+
+def suite():
+    suite1 = unittest.makeSuite(Sets)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Sets)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -62,6 +62,71 @@ class Snippets(unittest.TestCase):
         t = parser.parse(buf, 'test_2_buffer', debuglevel=0)
         self.assertEqual(len(t),2)
 
+    def test_4(self):
+        buf = ''' 
+        *element,type=cax4,elset=axi
+        1,1,2,3,4
+        2,3,4,5,6
+        *end step
+        '''
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.parse(buf, 'test_4_buffer', debuglevel=0)
+        self.assertEqual(len(t),2)
+        self.assertEqual([param.name for param in t[0].params],['type','elset'])
+        self.assertEqual(t[0].data,[['1','1','2','3','4'],['2','3','4','5','6']])
+        self.assertEqual(t[1].keyword,'end step')
+
+    def test_errors(self):
+        buf = '*heading\nx\n*node\n1,2$,3\n 4,5@\n*elset,elset=a\n1 = 2\n*end\n'
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        with self.assertRaises(abaqus_parser.ParseError) as cm:
+            parser.parse(buf, 'test_errors_buffer')
+        self.assertEqual(str(cm.exception), "test_errors_buffer:4:4: Illegal character '$'")
+        for fast in (True, False):
+            errors = []
+            t = parser.parse(buf, 'test_errors_buffer', fast=fast, errors=errors)
+            self.assertEqual([str(e) for e in errors],
+                             ["test_errors_buffer:4:4: Illegal character '$'",
+                              "test_errors_buffer:5:5: Illegal character '@'",
+                              "test_errors_buffer:7: before: =",])
+            self.assertEqual([kw.keyword for kw in t], ['heading', 'node', 'end'])
+            self.assertEqual(t[1].data, [['1','2','3'],['4','5']])
+        # Many errors on one long line
+        errors = []
+        parser.parse('*node\n1' + '$' * 20000 + '\n', 'long', errors=errors)
+        self.assertEqual(len(errors), 20000)
+        self.assertEqual(str(errors[-1]), "long:2:20001: Illegal character '$'")
+
+    def test_continued_lines(self):
+        buf = '*node,\nnset=a\n1,2\n*elset,elset=x\n1$\n'
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        for fast in (True, False):
+            with self.assertRaises(abaqus_parser.ParseError) as cm:
+                parser.parse(buf, 'f', fast=fast)
+            self.assertEqual(str(cm.exception), "f:5:2: Illegal character '$'")
+            t = parser.parse(buf.replace('$', ''), 'f', fast=fast)
+            self.assertEqual([kw.coord.line for kw in t], [1, 4])
+
+    def test_unfinished_keyword(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        for buf in ('*foo,\n*bar\n', '*node\n1,2\n*foo,\n*bar\n1\n', '*foo,\n'):
+            with self.assertRaises(abaqus_parser.ParseError) as cm:
+                parser.parse(buf, 'f', fast=False)
+            expected = str(cm.exception)
+            self.assertTrue(expected.startswith('f:'))
+            for options in ({}, {'lazy': True}, {'errors': []}):
+                if 'errors' in options:
+                    parser.parse(buf, 'f', **options)
+                    self.assertEqual([str(e) for e in options['errors']], [expected])
+                    continue
+                with self.assertRaises(abaqus_parser.ParseError) as cm:
+                    parser.parse(buf, 'f', **options)
+                self.assertEqual(str(cm.exception), expected)
+        errors = []
+        t = parser.parse('*node\n1,2\n*foo,\n*bar\n1\n', 'f', errors=errors)
+        self.assertEqual([kw.keyword for kw in t], ['node', 'bar'])
+        self.assertEqual([str(e) for e in errors], ['f:4: before: bar'])
+
 def suite():
     suite1 = unittest.makeSuite(Snippets)
     return unittest.TestSuite([suite1])
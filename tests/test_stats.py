@@ -0,0 +1,74 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+from AbqParse.abaqus_stats import ParseStats, PHASES
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+BUF = '''** leading comment
+*heading
+word1 word2
+*node,nset=all_nodes
+1,1.0,1.0e-5,1.0E+6
+2,1.0,1.0e-5,1.0E+6
+*element,type=c3d4,elset=foo
+1,1,2,3,4
+2,3,4,5,6
+*node
+3,1.0
+*end
+'''
+
+class Stats(unittest.TestCase):
+    def setUp(self):
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def test_counts(self):
+        calls = []
+        stats = ParseStats(callback=calls.append)
+        t = self.parser.parse(BUF, 'buffer', stats=stats)
+        self.assertEqual(dump(t), dump(self.parser.parse(BUF, 'buffer')))
+        self.assertEqual(calls, [stats])
+        self.assertEqual(sorted(stats.keywords), ['element', 'end', 'heading', 'node'])
+        node = stats.keywords['node']
+        self.assertEqual((node.count, node.lines), (2, 5))
+        self.assertEqual(stats.lines, BUF.count('\n'))
+        self.assertEqual(sorted(stats.phases), sorted(PHASES))
+        self.assertTrue(min(stats.phases.values()) >= 0)
+        self.assertTrue(stats.elapsed >= sum(stats.phases.values()) * 0.5)
+        # Without the fast path every token goes through the lexer
+        stats = ParseStats()
+        self.parser.parse(BUF, 'buffer', fast=False, stats=stats)
+        self.assertEqual(stats.keywords['element'].tokens, 9 + 2 * 10)
+        self.assertEqual(stats.tokens, sum(s.tokens for s in stats.keywords.values()))
+        self.assertEqual(stats.as_dict()['keywords']['element']['lines'], 3)
+
+    def test_file(self):
+        filename = os.path.join('data', 'test_2.inp')
+        stats = ParseStats()
+        t = self.parser.parse_file(filename, arrays=True, stats=stats)
+        self.assertEqual(sum(s.count for s in stats.keywords.values()), len(t))
+        lines = stats.lines
+        self.parser.parse_file(filename, stats=stats)
+        self.assertEqual(stats.lines, 2 * lines)
+        stats.reset()
+        self.assertEqual(stats.lines, 0)
+        # Errors still reach the callback
+        calls = []
+        stats = ParseStats(callback=calls.append)
+        self.assertRaises(abaqus_parser.ParseError, self.parser.parse,
+                          '*node\n1 = 2\n', stats=stats)
+        self.assertEqual(calls, [stats])
+        self.assertEqual(self.parser._stats, None)
+
+def suite():
+    suite1 = unittest.makeSuite(Stats)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Stats)
+    unittest.TextTestRunner(verbosity=2).run(suite)
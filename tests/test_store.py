@@ -0,0 +1,83 @@
+import unittest
+import sys, os
+import shutil
+import tempfile
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+import numpy
+
+from AbqParse import abaqus_parser, abaqus_store
+from AbqParse.abaqus_mesh import Mesh
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+BUF = '''*heading
+model
+*node,nset=all
+1,0.0,0.0
+2,1.0,0.0
+*node
+3,1.0,1.0,2.0
+*element,type=CAX3,elset=tri
+1,1,2,3
+*elset,elset=Both
+1,
+*elset,elset=range,generate
+1,9,2
+*nset,nset=named
+all,3
+*material,name=T95
+*elastic
+30.0e6,0.3
+*end step
+'''
+
+class Store(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def roundtrip(self, keywords, **options):
+        directory = os.path.join(self.directory, 'store')
+        abaqus_store.save(keywords, directory)
+        t = abaqus_store.load(directory, **options)
+        self.assertEqual(dump(t, coord=True, exact=True), dump(keywords, coord=True, exact=True))
+        return t
+
+    def test_snippet(self):
+        for arrays in (False, True):
+            self.roundtrip(self.parser.parse(BUF, 'buffer', arrays=arrays))
+        t = self.roundtrip(self.parser.parse(BUF, 'buffer', arrays=True), mmap=False)
+        self.assertFalse(isinstance(t[1].data[1], numpy.memmap))
+        # Bytes of any encoding survive the JSON manifest
+        self.roundtrip([abaqus_parser.Keyword('empty', [abaqus_parser.Parameter('name', 'caf\xe9')],
+                                              data=[], coord=t[0].coord)])
+
+    def test_files(self):
+        for name in sorted(os.listdir('data')):
+            if not name.endswith('.inp'):
+                continue
+            filename = os.path.join('data', name)
+            for arrays in (False, True):
+                self.roundtrip(self.parser.parse_file(filename, arrays=arrays))
+        # The tables are memory-mapped
+        t = self.roundtrip(self.parser.parse_file(os.path.join('data', 'mmxmn.inp'), arrays=True))
+        labels, coords = [kw.data for kw in t if kw.keyword.lower() == 'node'][0]
+        self.assertTrue(isinstance(coords.base, numpy.memmap) or
+                        isinstance(coords, numpy.memmap))
+        self.assertFalse(coords.flags.writeable)
+        mesh = Mesh.from_keywords(t)
+        self.assertEqual(len(mesh.node_labels), len(labels))
+
+def suite():
+    suite1 = unittest.makeSuite(Store)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Store)
+    unittest.TextTestRunner(verbosity=2).run(suite)
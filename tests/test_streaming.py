@@ -0,0 +1,90 @@
+import unittest
+import sys, os
+import io
+import threading
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser, abaqus_scanner
+from AbqParse.plyparser import ParseError
+from helpers import dump
+
+BUF = '''
+** leading comment
+*heading
+word1 word2
+*node,nset=all_nodes
+1,1.0,1.0e-5,1.0E+6
+2,1.0,1.0e-5,1.0E+6
+** comment inside a block
+3,1.0,1.0e-5,1.0E+6
+*element,type=c3d4,elset=foo
+1,1,2,3,4
+2,3,4,5,6
+*end
+'''
+
+class Streaming(unittest.TestCase):
+    def test_blocks(self):
+        blocks = list(abaqus_scanner.iter_blocks(BUF))
+        self.assertEqual(''.join(block for lineno, block in blocks), BUF)
+        self.assertEqual([lineno for lineno, block in blocks], [1, 5, 10, 13])
+        for chunk_size in (1, 7, 64, 1 << 20):
+            stream_blocks = list(abaqus_scanner.iter_stream_blocks(io.BytesIO(BUF), chunk_size))
+            self.assertEqual(stream_blocks, blocks)
+
+    def test_iter_keywords(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        expected = dump(parser.parse(BUF, 'buffer'))
+        for chunk_size in (1, 5, 1 << 20):
+            t = parser.iter_keywords(io.BytesIO(BUF), 'buffer', chunk_size=chunk_size)
+            self.assertEqual(dump(t), expected)
+
+    def test_error_lineno(self):
+        buf = '*heading\nline\n*node\n1,2.0\n3 = 4\n'
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        t = parser.iter_keywords(io.BytesIO(buf), 'buffer', chunk_size=4)
+        self.assertEqual(next(t).keyword, 'heading')
+        with self.assertRaises(ParseError) as cm:
+            next(t)
+        self.assertTrue(str(cm.exception).startswith('buffer:5:'))
+
+    def test_feed(self):
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        expected = dump(parser.parse(BUF, 'buffer'))
+        for chunk_size in (1, 7, 1 << 20):
+            feed = parser.feed_keywords('buffer')
+            t = []
+            for pos in range(0, len(BUF), chunk_size):
+                t.extend(feed.feed(BUF[pos:pos + chunk_size]))
+            t.extend(feed.close())
+            self.assertEqual(dump(t), expected)
+            self.assertEqual(feed.close(), [])
+            self.assertRaises(ValueError, feed.feed, '*end\n')
+        # Keywords come out once their data lines end
+        feed = parser.feed_keywords('buffer')
+        self.assertEqual([kw.keyword for kw in feed.feed('*heading\nline\n*node\n1,2.0\n')],
+                         ['heading'])
+        results = []
+        worker = threading.Thread(target=lambda: results.append(feed.feed('*end\n')))
+        worker.start()
+        worker.join()
+        self.assertEqual([kw.keyword for kw in results[0]], ['node'])
+        self.assertEqual([kw.keyword for kw in feed.close()], ['end'])
+
+    def test_file(self):
+        filename = os.path.join('data','test_2.inp')
+        f = open(filename,'rb')
+        buf = f.read()
+        f.close()
+        parser = abaqus_parser.AbaqusParser(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+        expected = dump(parser.parse(buf, 'test_2.inp'))
+        self.assertEqual(dump(parser.iter_keywords(filename, chunk_size=4096)), expected)
+
+def suite():
+    suite1 = unittest.makeSuite(Streaming)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Streaming)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,33 @@
+import unittest
+import sys, os
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+from AbqParse import abaqus_parser
+
+def snapshot(directory):
+    return dict((name, os.path.getmtime(os.path.join(directory, name)))
+                for name in os.listdir(directory) if not name.endswith('.pyc'))
+
+class Tables(unittest.TestCase):
+    def test_names(self):
+        self.assertEqual(abaqus_parser.LEXTAB, 'AbqParse.lextab')
+        self.assertEqual(abaqus_parser.YACCTAB, 'AbqParse.yacctab')
+
+    def test_no_writes(self):
+        # Neither the shipped tables nor missing ones are written
+        directories = (abaqus_parser.TABLES_DIR, os.getcwd())
+        before = [snapshot(directory) for directory in directories]
+        abaqus_parser.AbaqusParser()
+        abaqus_parser.AbaqusParser(lex_optimize=False, yacc_optimize=False)
+        parser = abaqus_parser.AbaqusParser(lextab='no_such_lextab', yacctab='no_such_yacctab')
+        self.assertEqual(parser.parse('*node\n1,2.0\n')[0].data, [['1', '2.0']])
+        self.assertEqual([snapshot(directory) for directory in directories], before)
+
+def suite():
+    suite1 = unittest.makeSuite(Tables)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Tables)
+    unittest.TextTestRunner(verbosity=2).run(suite)
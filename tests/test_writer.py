@@ -0,0 +1,74 @@
+import unittest
+import sys, os
+import io
+
+sys.path.insert(0,os.path.abspath(os.path.join('..','src')))
+
+import numpy
+
+from AbqParse import abaqus_parser, abaqus_writer
+from helpers import dump
+
+OPTIONS = dict(lex_optimize=False, yacc_debug=False, yacc_optimize=False)
+
+class Writer(unittest.TestCase):
+    def setUp(self):
+        self.parser = abaqus_parser.AbaqusParser(**OPTIONS)
+
+    def read(self, name):
+        f = open(os.path.join('data', name), 'rb')
+        buf = f.read()
+        f.close()
+        return buf
+
+    def test_round_trip(self):
+        for name in ('mmxmn.inp', 'test_2.inp'):
+            t = self.parser.parse(self.read(name), name)
+            text = abaqus_writer.dumps(t)
+            self.assertEqual(dump(self.parser.parse(text, name)), dump(t))
+            stream = io.BytesIO()
+            abaqus_writer.write(t, stream, rows=100)
+            self.assertEqual(stream.getvalue(), text)
+
+    def test_round_trip_arrays(self):
+        t = self.parser.parse(self.read('mmxmn.inp'), 'mmxmn.inp', arrays=True)
+        labels, coords = t[2].data
+        # Morph the mesh
+        coords *= -1.0 / 3.0
+        t2 = self.parser.parse(abaqus_writer.dumps(t), 'mmxmn.inp', arrays=True)
+        self.assertEqual(len(t2), len(t))
+        for kw, kw2 in zip(t, t2):
+            self.assertEqual(kw.keyword, kw2.keyword)
+            if isinstance(kw.data, tuple):
+                self.assertTrue(numpy.array_equal(kw.data[0], kw2.data[0]))
+                self.assertTrue(numpy.array_equal(kw.data[1], kw2.data[1]))
+            else:
+                self.assertEqual(kw.data, kw2.data)
+
+    def test_snippet(self):
+        kw = abaqus_parser.Keyword('Node', [abaqus_parser.Parameter('nset', 'all')],
+            (numpy.array([1, 2]), numpy.array([[0.5, -1.0e-5, 0.0], [2.0, 3.0, 4.0]])))
+        connectivity = numpy.arange(1, 41).reshape(2, 20)
+        kw2 = abaqus_parser.Keyword('element', [abaqus_parser.Parameter('type', 'c3d20')],
+            (numpy.array([7, 8]), connectivity))
+        kw3 = abaqus_parser.Keyword('end step')
+        text = abaqus_writer.dumps([kw, kw2, kw3])
+        lines = text.split('\n')
+        self.assertEqual(lines[0], '*Node, nset=all')
+        self.assertEqual(lines[1], '1,5.0000000000000000E-01,-1.0000000000000001E-05,0.0000000000000000E+00')
+        self.assertEqual(lines[3], '*element, type=c3d20')
+        self.assertEqual(lines[4], ','.join([str(i) for i in [7] + range(1, 16)]) + ',')
+        self.assertEqual(lines[5], '16,17,18,19,20')
+        self.assertEqual(lines[-2], '*end step')
+        t = self.parser.parse(text, 'buffer', arrays=True)
+        self.assertEqual(t[0].data[1].tolist(), kw.data[1].tolist())
+        self.assertEqual(t[1].data[0].tolist(), [7, 8])
+        self.assertEqual(t[1].data[1].tolist(), connectivity.tolist())
+
+def suite():
+    suite1 = unittest.makeSuite(Writer)
+    return unittest.TestSuite([suite1])
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(Writer)
+    unittest.TextTestRunner(verbosity=2).run(suite)